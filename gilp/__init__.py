@@ -16,6 +16,6 @@ provided in the examples module.
 
 __author__ = 'Henry Robbins'
 
-from .simplex import BFS, LP, simplex, branch_and_bound
+from .simplex import BFS, LP, simplex, simplex_iter, branch_and_bound
 from .visualize import lp_visual, simplex_visual, bnb_visual
 from . import examples
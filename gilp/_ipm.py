@@ -0,0 +1,225 @@
+"""Primal-dual interior point method for linear programs.
+
+This module solves an LP in standard equality form with variable bounds
+(max c^Tx s.t. Ax = b, lb <= x <= ub) with Mehrotra's predictor-corrector
+interior point method. Every iterate keeps the variables strictly within their
+bounds; the iterates approach an optimal solution from the interior of the
+feasible region. The Newton systems are reduced to the normal equations
+(A Theta A^T) dy = r which are solved with a Cholesky (or sparse LU)
+factorization. The returned solution is not basic in general; a crossover is
+needed to obtain an optimal basis.
+"""
+
+__author__ = 'Henry Robbins'
+__all__ = ['IPM', 'ipm']
+
+from collections import namedtuple
+import numpy as np
+from scipy import sparse
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
+from scipy.sparse.linalg import splu
+from typing import Union
+from ._linalg import SlackMatrix
+
+IPM = namedtuple('ipm', ['x', 'y', 'iterations', 'converged'])
+IPM.__doc__ = '''\
+Solution found by the interior point method.
+
+- x (np.ndarray): Primal solution (n*1 vector).
+- y (np.ndarray): Dual solution (m*1 vector).
+- iterations (int): Number of iterations.
+- converged (bool): True iff the solution is optimal within the tolerance.'''
+
+
+def _normal_solver(A: Union[np.ndarray, sparse.spmatrix, SlackMatrix],
+                   theta: np.ndarray):
+    """Return a function solving (A Theta A^T) y = r where Theta = diag(theta).
+
+    A small multiple of the identity is added to A Theta A^T so that the
+    factorization exists if A does not have full row rank. The solution is
+    improved by iterative refinement with the unregularized matrix.
+
+    Raises:
+        LinAlgError: A Theta A^T could not be factorized.
+    """
+    if isinstance(A, SlackMatrix):
+        n = A.n
+        S = A.A
+        D = np.bincount(A.rows, theta[n:], minlength=A.shape[0])
+        if sparse.issparse(S):
+            M = S @ sparse.diags(theta[:n]) @ S.transpose()
+            M = M + sparse.diags(D)
+        else:
+            M = (S * theta[:n]) @ S.transpose() + np.diag(D)
+    elif sparse.issparse(A):
+        M = A @ sparse.diags(theta) @ A.transpose()
+    else:
+        M = (A * theta) @ A.transpose()
+    m = M.shape[0]
+    reg = 1e-14 * max(1, np.abs(M.diagonal()).max(initial=0))
+    if sparse.issparse(M):
+        M = sparse.csc_matrix(M)
+        try:
+            lu = splu(M + reg * sparse.identity(m, format='csc'))
+        except RuntimeError:
+            raise LinAlgError('Singular normal matrix.')
+        solve = lu.solve
+    else:
+        for _ in range(8):
+            try:
+                factor = cho_factor(M + reg * np.identity(m),
+                                    check_finite=False)
+                break
+            except LinAlgError:
+                reg *= 100
+        else:
+            raise LinAlgError('Normal matrix is not positive definite.')
+
+        def solve(r):
+            return cho_solve(factor, r, check_finite=False)
+
+    def refined(r):
+        y = solve(r)
+        for _ in range(2):
+            y = y + solve(r - M @ y)
+        return y
+
+    return refined
+
+
+def _step(v: np.ndarray, dv: np.ndarray) -> float:
+    """Return the largest step in [0,1] such that v + step * dv >= 0."""
+    neg = dv < 0
+    if not np.any(neg):
+        return 1.0
+    return float(min(1, np.min(-v[neg] / dv[neg])))
+
+
+def ipm(A: Union[np.ndarray, sparse.spmatrix, SlackMatrix],
+        b: np.ndarray,
+        c: np.ndarray,
+        lb: np.ndarray,
+        ub: np.ndarray,
+        tol: float = 1e-8,
+        max_iter: int = 100) -> IPM:
+    """Solve max c^Tx s.t. Ax = b, lb <= x <= ub with an interior point method.
+
+    After the shift x = lb + x', the LP min -c^Tx' s.t. Ax' = b - A lb,
+    0 <= x' <= u (with u = ub - lb) is solved together with its dual. Each
+    iteration computes an affine scaling (predictor) direction, chooses the
+    centering parameter sigma = (mu_aff / mu)^3 from it, and then takes a
+    step along the combined centering and second order (corrector)
+    direction. Iterations stop once the relative primal and dual residuals
+    and the relative duality gap are at most tol. Variables with lb = ub are
+    fixed throughout.
+
+    Args:
+        A (Union[np.ndarray, sparse.spmatrix, SlackMatrix]): An m*n matrix.
+        b (np.ndarray): Coefficient vector of length m.
+        c (np.ndarray): Coefficient vector of length n.
+        lb (np.ndarray): Finite lower bounds of length n.
+        ub (np.ndarray): Upper bounds of length n.
+        tol (float): Optimality tolerance (1e-8 by default).
+        max_iter (int): Maximum number of iterations (100 by default).
+
+    Returns:
+        IPM: Solution found by the interior point method.
+    """
+    m, n = A.shape
+    lb = np.array(lb, dtype=float).reshape(-1)
+    b = np.array(b, dtype=float).reshape(-1) - A @ lb
+    cost = -np.array(c, dtype=float).reshape(-1)
+    u = np.array(ub, dtype=float).reshape(-1) - lb
+    active = u > 0  # variables which are not fixed
+    U = np.isfinite(u) & active  # variables with an upper bound
+    u = np.where(U, u, 0)
+    N = np.sum(active) + np.sum(U)
+
+    # Starting point: least squares solutions shifted into the interior
+    try:
+        solve = _normal_solver(A, active.astype(float))
+    except LinAlgError:
+        return IPM(x=lb.reshape(-1,1), y=np.zeros((m,1)), iterations=0,
+                   converged=False)
+    x = np.where(active, A.transpose() @ solve(b), 0)
+    y = solve(A @ np.where(active, cost, 0))
+    z = cost - A.transpose() @ y
+    v = np.where(U, np.maximum(-z, 0), 0)
+    x = np.where(active, np.maximum(x, 1), 0)
+    x = np.where(U, np.minimum(x, u / 2), x)
+    w = np.where(U, u - x, 0)
+    z = np.where(active, np.maximum(z, 1), 0)
+    v = np.where(U, np.maximum(v, 1), 0)
+
+    converged = False
+    for iterations in range(max_iter):
+        r_b = b - A @ x
+        r_u = np.where(U, u - x - w, 0)
+        r_c = np.where(active, cost - A.transpose() @ y - z + v, 0)
+        mu = (x @ z + w @ v) / N if N > 0 else 0
+        primal, dual = cost @ x, b @ y - u @ v
+        if (np.linalg.norm(r_b) <= tol * (1 + np.linalg.norm(b))
+                and np.linalg.norm(r_u) <= tol * (1 + np.linalg.norm(u))
+                and np.linalg.norm(r_c) <= tol * (1 + np.linalg.norm(cost))
+                and abs(primal - dual) <= tol * (1 + abs(primal))):
+            converged = True
+            break
+        if max(np.abs(x).max(initial=0), np.abs(y).max(initial=0)) > 1e15:
+            break  # diverging: the LP is likely infeasible or unbounded
+        if N == 0:
+            break  # every variable is fixed
+
+        # Normal equations of the Newton system
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            theta = np.where(active,
+                             1 / (z / x + np.where(U, v / w, 0)), 0)
+        if not np.all(np.isfinite(theta)):
+            break  # an iterate reached a bound: no further progress
+        try:
+            solve = _normal_solver(A, theta)
+        except LinAlgError:
+            break
+
+        def direction(r_xz, r_wv):
+            """Return the Newton direction for the complementarity RHS."""
+            with np.errstate(divide='ignore', invalid='ignore'):
+                r = r_c - np.where(active, r_xz / x, 0)
+                r = r + np.where(U, (r_wv - v * r_u) / w, 0)
+                dy = solve(r_b + A @ (theta * r))
+                dx = theta * (A.transpose() @ dy - r)
+                dz = np.where(active, (r_xz - z * dx) / x, 0)
+                dw = np.where(U, r_u - dx, 0)
+                dv = np.where(U, (r_wv - v * dw) / w, 0)
+            return dx, dy, dz, dw, dv
+
+        def steps(dx, dz, dw, dv):
+            """Return the largest primal and dual steps."""
+            return (min(_step(x, dx), _step(w[U], dw[U])),
+                    min(_step(z, dz), _step(v[U], dv[U])))
+
+        # Predictor (affine scaling) step
+        dx, dy, dz, dw, dv = direction(-x * z, -w * v)
+        alpha_p, alpha_d = steps(dx, dz, dw, dv)
+        mu_aff = ((x + alpha_p*dx) @ (z + alpha_d*dz)
+                  + (w + alpha_p*dw) @ (v + alpha_d*dv)) / N
+        sigma = (mu_aff / mu)**3 if mu > 0 else 0
+
+        # Corrector (centering and second order) step
+        r_xz = np.where(active, sigma*mu - x*z - dx*dz, 0)
+        r_wv = np.where(U, sigma*mu - w*v - dw*dv, 0)
+        dx, dy, dz, dw, dv = direction(r_xz, r_wv)
+        alpha_p, alpha_d = steps(dx, dz, dw, dv)
+        eta = max(0.9, 1 - mu) if mu < 1 else 0.9
+        eta = min(eta, 0.9995)
+        x = x + eta*alpha_p*dx
+        w = w + eta*alpha_p*dw
+        y = y + eta*alpha_d*dy
+        z = z + eta*alpha_d*dz
+        v = v + eta*alpha_d*dv
+    else:
+        iterations = max_iter
+
+    return IPM(x=(lb + x).reshape(-1,1),
+               y=-y.reshape(-1,1),
+               iterations=iterations,
+               converged=converged)
@@ -0,0 +1,308 @@
+"""Linear algebra for the revised simplex method.
+
+This module maintains a factorization of the basis matrix A_B used by the
+revised simplex method. Rather than solving with A_B from scratch at every
+pivot, an LU factorization is computed once and updated after each pivot using
+the product form of the inverse. The factorization is recomputed periodically
+to bound the length of the update file and the accumulated rounding error.
+Coefficient matrices may be dense numpy arrays or scipy.sparse matrices; sparse
+bases are factorized with a sparse LU (SuperLU). The equality form [A I] of an
+inequality LP is represented implicitly by a SlackMatrix. Its slack columns are
+signed unit vectors, so only the structural columns of a basis are factorized.
+"""
+
+__author__ = 'Henry Robbins'
+__all__ = ['BasisFactor', 'SlackMatrix', 'column', 'columns']
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+from scipy.linalg import lu_factor, lu_solve, LinAlgError
+from typing import List, Union
+import warnings
+
+
+class SlackMatrix:
+    """The m*(n+k) matrix [A U] with implicit unit (slack) columns.
+
+    Only the m*n matrix A of structural columns is stored. Column n+j is the
+    signed unit vector signs_j e_(rows_j). By default, k = m and U = I so the
+    matrix is the equality form [A I] of an inequality LP. Products with the
+    matrix and its transpose and column extraction use this structure without
+    forming [A U].
+
+    Attributes:
+        A (Union[np.ndarray, sparse.spmatrix]): Structural columns.
+        n (int): Number of structural columns.
+        rows (np.ndarray): Row of the nonzero entry of each unit column.
+        signs (np.ndarray): Sign (1 or -1) of each unit column.
+        shape (Tuple[int, int]): Shape (m, n+k) of [A U].
+    """
+
+    def __init__(self,
+                 A: Union[np.ndarray, sparse.spmatrix],
+                 rows: List[int] = None,
+                 signs: List[float] = None):
+        self.A = A
+        m, self.n = A.shape
+        self._identity = rows is None and signs is None
+        self.rows = (np.arange(m) if rows is None
+                     else np.asarray(rows, dtype=int).reshape(-1))
+        self.signs = (np.ones(len(self.rows)) if signs is None
+                      else np.asarray(signs, dtype=float).reshape(-1))
+        self.shape = (m, self.n + len(self.rows))
+
+    def _unit(self, x: np.ndarray) -> np.ndarray:
+        """Return the signs broadcast along the leading axis of x."""
+        return self.signs.reshape((-1,) + (1,) * (np.ndim(x) - 1))
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        """Return [A U]x."""
+        if self._identity:
+            return self.A @ x[:self.n] + x[self.n:]
+        out = np.array(self.A @ x[:self.n], dtype=float)
+        np.add.at(out, self.rows, self._unit(x) * x[self.n:])
+        return out
+
+    def transpose(self) -> '_SlackTranspose':
+        """Return the transpose [A U]^T (also implicit)."""
+        return _SlackTranspose(self)
+
+    @property
+    def T(self) -> '_SlackTranspose':
+        return self.transpose()
+
+    def columns(self, indices: List[int]) -> np.ndarray:
+        """Return the given columns of [A U] as a dense matrix."""
+        indices = np.asarray(indices, dtype=int).reshape(-1)
+        out = np.zeros((self.shape[0], len(indices)))
+        structural = indices < self.n
+        out[:,structural] = columns(self.A, indices[structural])
+        slack = np.flatnonzero(~structural)
+        unit = indices[slack] - self.n
+        out[self.rows[unit], slack] = self.signs[unit]
+        return out
+
+    def _units(self) -> sparse.csc_matrix:
+        """Return the unit columns U as a sparse (CSC) matrix."""
+        k = len(self.rows)
+        return sparse.csc_matrix((self.signs, (self.rows, np.arange(k))),
+                                 shape=(self.shape[0], k))
+
+    def toarray(self) -> np.ndarray:
+        """Return [A U] as a dense matrix."""
+        A = self.A.toarray() if sparse.issparse(self.A) else self.A
+        return np.hstack((A, self._units().toarray()))
+
+    def tocsc(self) -> sparse.csc_matrix:
+        """Return [A U] as a sparse (CSC) matrix."""
+        return sparse.hstack((sparse.csc_matrix(self.A), self._units()),
+                             format='csc')
+
+    def explicit(self) -> Union[np.ndarray, sparse.spmatrix]:
+        """Return [A U] (sparse if A is sparse and dense otherwise)."""
+        return self.tocsc() if sparse.issparse(self.A) else self.toarray()
+
+
+class _SlackTranspose:
+    """The transpose [A U]^T of a SlackMatrix."""
+
+    def __init__(self, M: SlackMatrix):
+        self.M = M
+
+    def __matmul__(self, y: np.ndarray) -> np.ndarray:
+        """Return [A U]^Ty (the products A^Ty followed by U^Ty)."""
+        M = self.M
+        u = y if M._identity else M._unit(y) * y[M.rows]
+        return np.concatenate((M.A.transpose() @ y, u), axis=0)
+
+
+def column(A: Union[np.ndarray, sparse.spmatrix], k: int) -> np.ndarray:
+    """Return column k of the (dense or sparse) matrix A as a dense vector."""
+    if isinstance(A, SlackMatrix):
+        if k < A.n:
+            return column(A.A, k)
+        e = np.zeros(A.shape[0])
+        e[A.rows[k - A.n]] = A.signs[k - A.n]
+        return e
+    if sparse.issparse(A):
+        return A[:,[k]].toarray()[:,0].astype(float)
+    return np.asarray(A[:,k], dtype=float)
+
+
+def columns(A: Union[np.ndarray, sparse.spmatrix],
+            indices: List[int]) -> np.ndarray:
+    """Return columns of the (dense or sparse) matrix A as a dense matrix."""
+    if isinstance(A, SlackMatrix):
+        return A.columns(indices)
+    if sparse.issparse(A):
+        return A[:,indices].toarray().astype(float)
+    return np.asarray(A[:,indices], dtype=float)
+
+
+def _lu(M: Union[np.ndarray, sparse.spmatrix]):
+    """Return the LU factors of the square (dense or sparse) matrix M.
+
+    Raises:
+        LinAlgError: Singular matrix.
+    """
+    if M.shape[0] == 0:
+        return None
+    if sparse.issparse(M):
+        try:
+            lu = splu(sparse.csc_matrix(M, dtype=float))
+        except RuntimeError:
+            raise LinAlgError('Singular basis matrix.')
+        U = lu.U.diagonal()
+        if np.any(np.abs(U) <= 1e-12 * max(1, np.abs(U).max())):
+            raise LinAlgError('Singular basis matrix.')
+        return lu
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        lu, piv = lu_factor(np.asarray(M, dtype=float), check_finite=False)
+    U = np.diag(lu)
+    if np.any(np.abs(U) <= 1e-12 * max(1, np.abs(lu).max())):
+        raise LinAlgError('Singular basis matrix.')
+    return (lu, piv)
+
+
+class BasisFactor:
+    """Maintains an LU factorization of the basis matrix A_B.
+
+    The basis header lists the basic variables in the order of the columns of
+    the factorized matrix. After a pivot replaces the column in position p,
+    the inverse is updated in product form: A_B'^(-1) = E^(-1) A_B^(-1) where E
+    is the identity with column p replaced by d = A_B^(-1)a_k. Each update
+    only stores d (an eta vector). After refactor_interval updates, A_B is
+    factorized from scratch.
+
+    If A is a SlackMatrix, let S be the structural basic columns and L the
+    rows of the basic unit columns (with signs s_L). Then only the square
+    block A[~L,S] is factorized: A_B d = a is solved by d_S = A[~L,S]^(-1)
+    a[~L] followed by d_L = s_L (a[L] - A[L,S] d_S) (and similarly for
+    A_B^T y = c).
+
+    Attributes:
+        basis (np.ndarray): Basis header (basic variable in each position).
+        refactor_interval (int): Number of updates between refactorizations.
+        solves (int): Number of linear solves (FTRAN or BTRAN) performed.
+    """
+
+    def __init__(self,
+                 A: np.ndarray,
+                 basis: List[int],
+                 refactor_interval: int = 50):
+        """Initialize and compute the factorization of A_B.
+
+        Args:
+            A (Union[np.ndarray, sparse.spmatrix]): An m*n coefficient matrix.
+            basis (List[int]): Basis header of m column indices of A.
+            refactor_interval (int): Updates between refactorizations.
+
+        Raises:
+            LinAlgError: Singular basis matrix.
+        """
+        self.A = A
+        self.basis = np.array(basis, dtype=int)
+        self.refactor_interval = refactor_interval
+        self.solves = 0
+        self.refactor()
+
+    def refactor(self):
+        """Compute a fresh LU factorization of A_B and clear the eta file.
+
+        Raises:
+            LinAlgError: Singular basis matrix.
+        """
+        m = self.A.shape[0]
+        if len(self.basis) != m:
+            raise LinAlgError('Basis matrix is not square.')
+        if isinstance(self.A, SlackMatrix):
+            slack = self.basis >= self.A.n
+            self._S = np.flatnonzero(~slack)
+            self._L = np.flatnonzero(slack)
+            unit = self.basis[self._L] - self.A.n
+            self._rows_L = self.A.rows[unit]
+            self._signs_L = self.A.signs[unit]
+            if len(np.unique(self._rows_L)) < len(self._rows_L):
+                raise LinAlgError('Singular basis matrix.')
+            self._rows_K = np.setdiff1d(np.arange(m), self._rows_L)
+            A_S = self.A.A[:,self.basis[self._S]]
+            self._lu = _lu(A_S[self._rows_K])
+            self._coupling = A_S[self._rows_L]
+        else:
+            self._S = None
+            self._lu = _lu(self.A[:,self.basis])
+        self._etas = []
+
+    def _lu_solve(self, a: np.ndarray, trans: bool = False) -> np.ndarray:
+        """Solve with the LU factors of the last refactorization."""
+        if self._lu is None:
+            return a
+        if isinstance(self._lu, tuple):
+            return lu_solve(self._lu, a, trans=int(trans), check_finite=False)
+        return self._lu.solve(a, trans='T' if trans else 'N')
+
+    def _solve(self, a: np.ndarray, trans: bool = False) -> np.ndarray:
+        """Solve with A_B (or A_B^T) as of the last refactorization."""
+        if self._S is None:
+            return self._lu_solve(a, trans)
+        out = np.empty(a.shape)
+        s_L = self._signs_L.reshape((-1,) + (1,) * (a.ndim - 1))
+        if trans:
+            y_L = s_L * a[self._L]
+            out[self._rows_L] = y_L
+            out[self._rows_K] = self._lu_solve(
+                a[self._S] - self._coupling.transpose() @ y_L, trans)
+        else:
+            d_S = self._lu_solve(a[self._rows_K])
+            out[self._S] = d_S
+            out[self._L] = s_L * (a[self._rows_L] - self._coupling @ d_S)
+        return out
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """Return d solving A_B d = a (forward transformation).
+
+        Args:
+            a (np.ndarray): Right hand side vector (or matrix of columns).
+
+        Returns:
+            np.ndarray: Solution with the same shape as a.
+        """
+        self.solves += 1
+        d = self._solve(np.array(a, dtype=float))
+        for p, eta in self._etas:
+            d_p = d[p] / eta[p]
+            d -= np.multiply.outer(eta, d_p)
+            d[p] = d_p
+        return d
+
+    def btran(self, c: np.ndarray) -> np.ndarray:
+        """Return y solving A_B^T y = c (backward transformation).
+
+        Args:
+            c (np.ndarray): Right hand side vector (or matrix of columns).
+
+        Returns:
+            np.ndarray: Solution with the same shape as c.
+        """
+        self.solves += 1
+        y = np.array(c, dtype=float)
+        for p, eta in reversed(self._etas):
+            off_p = np.tensordot(eta, y, axes=1) - eta[p]*y[p]
+            y[p] = (y[p] - off_p) / eta[p]
+        return self._solve(y, trans=True)
+
+    def replace(self, p: int, k: int, d: np.ndarray):
+        """Replace the basic variable in position p with variable k.
+
+        Args:
+            p (int): Position in the basis header of the leaving variable.
+            k (int): Index of the entering variable.
+            d (np.ndarray): The solution d of A_B d = a_k (before the pivot).
+        """
+        self.basis[p] = k
+        if len(self._etas) + 1 >= self.refactor_interval:
+            self.refactor()
+        else:
+            self._etas.append((p, np.array(d, dtype=float).reshape(-1)))
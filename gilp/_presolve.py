@@ -0,0 +1,278 @@
+"""Presolve for linear programs in standard equality form.
+
+This module reduces an LP in standard equality form (max c^Tx s.t. Ax = b,
+x >= 0) before any pivoting is done. Rows and columns are removed by a set of
+reductions (empty and singleton rows, fixed and dominated columns, duplicate
+and linearly dependent rows, and bound tightening) which are applied until
+none of them makes progress. Every removed column is fixed at a value which
+does not depend on the solution of the reduced LP. Hence, a postsolve maps a
+basic solution of the reduced LP back to a basic solution of the original LP.
+"""
+
+__author__ = 'Henry Robbins'
+__all__ = ['Presolved', 'PresolveInfeasible', 'presolve', 'postsolve']
+
+from collections import namedtuple
+import numpy as np
+from scipy import sparse
+from scipy.linalg import qr
+from typing import List, Tuple, Union
+
+Presolved = namedtuple('presolved', ['A', 'b', 'c', 'rows', 'cols', 'x',
+                                     'basic'])
+Presolved.__doc__ = '''\
+Reduced LP in standard equality form and the data needed for postsolve.
+
+- A (Union[np.ndarray, sparse.spmatrix]): LHS coefficients of reduced LP.
+- b (np.ndarray): RHS coefficients of the reduced LP.
+- c (np.ndarray): Objective function coefficients of the reduced LP.
+- rows (np.ndarray): Original indices of the rows of the reduced LP.
+- cols (np.ndarray): Original indices of the columns of the reduced LP.
+- x (np.ndarray): Values of removed variables (zero for kept variables).
+- basic (List[int]): Removed variables which complete a basis.'''
+
+
+class PresolveInfeasible(Exception):
+    """Raised when presolve finds that the LP has no feasible solution."""
+    pass
+
+
+def presolve(A: Union[np.ndarray, sparse.spmatrix],
+             b: np.ndarray,
+             c: np.ndarray,
+             feas_tol: float = 1e-7,
+             max_passes: int = 20) -> Presolved:
+    """Return a reduced LP equivalent to max c^Tx s.t. Ax = b, x >= 0.
+
+    The following reductions are repeated (at most max_passes times) until no
+    more rows or columns are removed:
+
+        - Empty row: 0 = b_i is removed (or the LP is infeasible).
+        - Singleton row: a_ijx_j = b_i fixes x_j = b_i/a_ij and is removed.
+        - Fixed column: an empty column with c_j <= 0 is fixed at 0.
+        - Dominated column: a column whose reduced cost is negative for
+          every dual solution allowed by the singleton columns is fixed at 0.
+        - Bound tightening: implied upper bounds u_j on the variables are
+          derived from the rows. Variables with u_j = 0 (e.g. in a forcing
+          row) are fixed at 0 and rows whose activity bounds exclude b_i
+          show that the LP is infeasible.
+        - Duplicate row: a multiple of another row is removed (or the LP is
+          infeasible).
+
+    Finally, linearly dependent rows are removed (or the LP is infeasible).
+
+    Args:
+        A (Union[np.ndarray, sparse.spmatrix]): An m*n matrix of coefficients.
+        b (np.ndarray): Coefficient vector of length m.
+        c (np.ndarray): Coefficient vector of length n.
+        feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        max_passes (int): Maximum number of passes of the reductions.
+
+    Returns:
+        Presolved: Reduced LP and the data needed for postsolve.
+
+    Raises:
+        PresolveInfeasible: The LP has no feasible solution.
+    """
+    dense = not sparse.issparse(A)
+    A = sparse.csr_matrix(A, dtype=float)
+    A.eliminate_zeros()
+    C = A.tocsc()
+    m, n = A.shape
+    b = np.array(b, dtype=float).reshape(-1)
+    c = np.array(c, dtype=float).reshape(-1)
+
+    pattern = A.copy()
+    pattern.data[:] = 1
+    row_nnz = np.asarray(pattern.sum(axis=1)).reshape(-1)
+
+    row_alive = np.ones(m, dtype=bool)
+    col_alive = np.ones(n, dtype=bool)
+    needs_basic = np.zeros(m, dtype=bool)  # removed rows owning a basic var
+    x = np.zeros(n)
+    u = np.full(n, np.inf)  # implied upper bounds
+    designated = []  # columns fixed by singleton rows
+    removed = []  # columns in order of removal
+
+    def fix(j, value):
+        """Fix variable x_j at value and remove its column."""
+        x[j] = value
+        col_alive[j] = False
+        removed.append(j)
+        if value != 0:
+            start, end = C.indptr[j], C.indptr[j+1]
+            b[C.indices[start:end]] -= C.data[start:end] * value
+
+    def row_entries(i):
+        """Return the column indices and values of row i in alive columns."""
+        start, end = A.indptr[i], A.indptr[i+1]
+        idx, vals = A.indices[start:end], A.data[start:end]
+        alive = col_alive[idx]
+        return idx[alive], vals[alive]
+
+    def tol(v):
+        return feas_tol * max(1, abs(v))
+
+    for _ in range(max_passes):
+        changed = False
+
+        # Empty and singleton rows
+        for i in np.flatnonzero(row_alive):
+            idx, vals = row_entries(i)
+            if len(idx) == 0:
+                if abs(b[i]) > tol(b[i]):
+                    raise PresolveInfeasible('Empty row %d with b != 0.' % i)
+                row_alive[i] = False
+                needs_basic[i] = row_nnz[i] > 0
+                changed = True
+            elif len(idx) == 1:
+                value = b[i] / vals[0]
+                if value < -tol(value):
+                    raise PresolveInfeasible('Singleton row %d forces a '
+                                             'negative value.' % i)
+                fix(idx[0], max(value, 0))
+                designated.append(idx[0])
+                row_alive[i] = False
+                needs_basic[i] = True
+                changed = True
+
+        # Restrict the matrix to alive rows and columns
+        R = sparse.diags(row_alive.astype(float)) @ A
+        R = R @ sparse.diags(col_alive.astype(float))
+        R.eliminate_zeros()
+        P, N = R.maximum(0), R.minimum(0)
+        P_pat, N_pat = (P != 0).astype(float), (N != 0).astype(float)
+        col_nnz = np.asarray((R != 0).sum(axis=0)).reshape(-1)
+
+        # Empty columns with nonpositive cost
+        for j in np.flatnonzero(col_alive & (col_nnz == 0) & (c <= 0)):
+            fix(j, 0)
+            changed = True
+
+        # Dominated columns: bounds on the duals from singleton columns
+        y_lo, y_hi = np.full(m, -np.inf), np.full(m, np.inf)
+        Rc = R.tocsc()
+        for j in np.flatnonzero(col_alive & (col_nnz == 1)):
+            start, end = Rc.indptr[j], Rc.indptr[j+1]
+            k, a = Rc.indices[start:end][0], Rc.data[start:end][0]
+            if a > 0:
+                y_lo[k] = max(y_lo[k], c[j] / a)
+            else:
+                y_hi[k] = min(y_hi[k], c[j] / a)
+        lo_inf, hi_inf = np.isinf(y_lo), np.isinf(y_hi)
+        unbounded = (P_pat.T @ lo_inf + N_pat.T @ hi_inf) > 0
+        min_dual = (P.T @ np.where(lo_inf, 0, y_lo)
+                    + N.T @ np.where(hi_inf, 0, y_hi))
+        dominated = col_alive & (col_nnz > 0) & ~unbounded
+        dominated &= c - min_dual < -feas_tol
+        for j in np.flatnonzero(dominated):
+            fix(j, 0)
+            changed = True
+
+        # Bound tightening (row activity bounds given 0 <= x <= u)
+        u_inf = np.isinf(u)
+        u_fin = np.where(u_inf, 0, u)
+        min_act = N @ u_fin
+        min_act[(N_pat @ u_inf) > 0] = -np.inf
+        max_act = P @ u_fin
+        max_act[(P_pat @ u_inf) > 0] = np.inf
+        b_tol = feas_tol * np.maximum(1, np.abs(b))
+        if np.any(row_alive & ((min_act > b + b_tol) | (max_act < b - b_tol))):
+            raise PresolveInfeasible('Row activity bounds exclude b.')
+        coo = R.tocoo()
+        r, j, a = coo.row, coo.col, coo.data
+        with np.errstate(invalid='ignore'):
+            bound = np.where(a > 0,
+                             (b[r] - min_act[r]) / a,
+                             (b[r] - max_act[r]) / a)
+        bound[np.isnan(bound)] = np.inf
+        np.minimum.at(u, j, bound)
+        if np.any(col_alive & (u < -feas_tol)):
+            raise PresolveInfeasible('Implied upper bound is negative.')
+        for j in np.flatnonzero(col_alive & (u <= feas_tol)):
+            fix(j, 0)
+            changed = True
+
+        # Duplicate rows
+        seen = {}
+        for i in np.flatnonzero(row_alive):
+            idx, vals = row_entries(i)
+            if len(idx) < 2:
+                continue
+            key = (tuple(idx), tuple(np.round(vals / vals[0], 10)))
+            if key in seen:
+                k, a_k = seen[key]
+                if abs(b[i] - b[k] * vals[0] / a_k) > tol(b[i]):
+                    raise PresolveInfeasible('Duplicate rows %d and %d are '
+                                             'inconsistent.' % (k, i))
+                row_alive[i] = False
+                changed = True
+            else:
+                seen[key] = (i, vals[0])
+
+        if not changed:
+            break
+
+    # Linearly dependent rows
+    rows, cols = np.flatnonzero(row_alive), np.flatnonzero(col_alive)
+    if len(rows) > 1 and len(cols) > 0:
+        M = A[rows][:,cols].toarray()
+        Q, T, piv = qr(M.transpose(), mode='economic', pivoting=True)
+        diag = np.abs(np.diag(T))
+        rank = int(np.sum(diag > feas_tol * max(1, diag.max(initial=0))))
+        if rank < len(rows):
+            ind, dep = piv[:rank], piv[rank:]
+            Z = np.linalg.lstsq(M[ind].transpose(), M[dep].transpose(),
+                                rcond=None)[0]
+            b_dep = b[rows[dep]]
+            if not np.allclose(Z.transpose() @ b[rows[ind]], b_dep,
+                               atol=feas_tol * max(1, np.abs(b_dep).max())):
+                raise PresolveInfeasible('Linearly dependent rows are '
+                                         'inconsistent.')
+            row_alive[rows[dep]] = False
+            rows = np.flatnonzero(row_alive)
+
+    # Removed variables completing a basis for the removed rows
+    basic = []
+    need = np.flatnonzero(needs_basic)
+    if len(need) > 0:
+        order = designated + [j for j in removed if j not in designated]
+        M = A[need][:,order].toarray()
+        positions = []
+        for pos, j in enumerate(order):
+            if np.linalg.matrix_rank(M[:,positions + [pos]]) > len(basic):
+                positions.append(pos)
+                basic.append(j)
+                if len(basic) == len(need):
+                    break
+
+    A_red = A[rows][:,cols]
+    return Presolved(A=A_red.toarray() if dense else A_red.tocsc(),
+                     b=b[rows].reshape(-1,1),
+                     c=c[cols].reshape(-1,1),
+                     rows=rows,
+                     cols=cols,
+                     x=x.reshape(-1,1),
+                     basic=sorted(basic))
+
+
+def postsolve(presolved: Presolved,
+              x: np.ndarray,
+              B: List[int]) -> Tuple[np.ndarray, List[int]]:
+    """Map a basic solution of the reduced LP to the original LP.
+
+    Args:
+        presolved (Presolved): Result of presolve on the original LP.
+        x (np.ndarray): Basic solution of the reduced LP.
+        B (List[int]): Basis of the reduced LP.
+
+    Returns:
+        Tuple:
+
+        - x (np.ndarray): Basic solution of the original LP.
+        - B (List[int]): Basis of the original LP.
+    """
+    x_orig = np.array(presolved.x, dtype=float)
+    x_orig[presolved.cols,:] = x
+    B_orig = [int(presolved.cols[i]) for i in B] + presolved.basic
+    return x_orig, sorted(B_orig)
@@ -0,0 +1,131 @@
+"""Scaling of linear programs in standard equality form.
+
+This module scales the rows and columns of an LP in standard equality form
+(max c^Tx s.t. Ax = b, x >= 0) so that the nonzero coefficients of A are
+close to one in magnitude. With row scale factors r and column scale factors
+s, the scaled LP is max (Sc)^Tx' s.t. (RAS)x' = Rb, x' >= 0 where R = diag(r)
+and S = diag(s). A basis of the scaled LP is a basis of the original LP and
+x = Sx'. Scale factors are rounded to powers of two so that scaling introduces
+no rounding error.
+"""
+
+__author__ = 'Henry Robbins'
+__all__ = ['Scaled', 'SCALINGS', 'scale', 'unscale']
+
+from collections import namedtuple
+import numpy as np
+from scipy import sparse
+from typing import Union
+
+Scaled = namedtuple('scaled', ['A', 'b', 'c', 'row', 'col'])
+Scaled.__doc__ = '''\
+Scaled LP in standard equality form and the scale factors.
+
+- A (Union[np.ndarray, sparse.spmatrix]): LHS coefficients of scaled LP.
+- b (np.ndarray): RHS coefficients of the scaled LP.
+- c (np.ndarray): Objective function coefficients of the scaled LP.
+- row (np.ndarray): Row scale factors r (m*1 vector).
+- col (np.ndarray): Column scale factors s (n*1 vector).'''
+
+SCALINGS = ['geometric', 'equilibrate']
+
+
+def _extremes(A: sparse.spmatrix, axis: int = None):
+    """Return the largest and smallest nonzero magnitudes along axis."""
+    A = abs(A)
+    if axis is None:
+        if A.nnz == 0:
+            return np.zeros(1), np.zeros(1)
+        return np.array([A.data.max()]), np.array([A.data.min()])
+    big = A.max(axis=axis).toarray().reshape(-1)
+    inv = A.copy()
+    inv.data = 1 / inv.data
+    small = inv.max(axis=axis).toarray().reshape(-1)
+    with np.errstate(divide='ignore'):
+        small = np.where(small > 0, 1 / small, 0)
+    return big, small
+
+
+def _power_of_two(scale: np.ndarray) -> np.ndarray:
+    """Round positive scale factors to the nearest power of two."""
+    return np.exp2(np.round(np.log2(scale)))
+
+
+def scale(A: Union[np.ndarray, sparse.spmatrix],
+          b: np.ndarray,
+          c: np.ndarray,
+          method: str = 'geometric',
+          passes: int = 4,
+          tol: float = 0.9) -> Scaled:
+    """Return the LP max c^Tx s.t. Ax = b, x >= 0 with scaled rows and columns.
+
+    SCALINGS
+
+        - 'geometric': alternately divide each row and then each column by
+          the geometric mean of its largest and smallest nonzero magnitudes.
+          Passes stop early once the ratio of largest to smallest magnitude
+          no longer improves by a factor of tol. The rows and columns are
+          then equilibrated.
+        - 'equilibrate': divide each row and then each column by its largest
+          nonzero magnitude.
+
+    Args:
+        A (Union[np.ndarray, sparse.spmatrix]): An m*n matrix of coefficients.
+        b (np.ndarray): Coefficient vector of length m.
+        c (np.ndarray): Coefficient vector of length n.
+        method (str): Scaling method. 'geometric' by default.
+        passes (int): Maximum number of geometric mean passes.
+        tol (float): Required improvement of each geometric mean pass.
+
+    Returns:
+        Scaled: Scaled LP and the row and column scale factors.
+
+    Raises:
+        ValueError: Invalid scaling. Select from (list).
+    """
+    if method not in SCALINGS:
+        raise ValueError('Invalid scaling. Select from ' + str(SCALINGS))
+    dense = not sparse.issparse(A)
+    M = sparse.csr_matrix(A, dtype=float)
+    M.eliminate_zeros()
+    m, n = M.shape
+    r, s = np.ones(m), np.ones(n)
+
+    def apply(row, col):
+        return sparse.diags(row) @ M @ sparse.diags(col)
+
+    if method == 'geometric':
+        big, small = _extremes(M)
+        ratio = big[0] / small[0] if small[0] > 0 else 1
+        for _ in range(passes):
+            S = apply(r, s)
+            big, small = _extremes(S, 1)
+            r = r / np.where(big > 0, np.sqrt(big * small), 1)
+            S = apply(r, s)
+            big, small = _extremes(S, 0)
+            s = s / np.where(big > 0, np.sqrt(big * small), 1)
+            big, small = _extremes(apply(r, s))
+            new_ratio = big[0] / small[0] if small[0] > 0 else 1
+            if new_ratio > tol * ratio:
+                break
+            ratio = new_ratio
+
+    # Equilibrate rows and then columns
+    big, _ = _extremes(apply(r, s), 1)
+    r = _power_of_two(r / np.where(big > 0, big, 1))
+    big, _ = _extremes(apply(r, s), 0)
+    s = _power_of_two(s / np.where(big > 0, big, 1))
+
+    A_scaled = apply(r, s)
+    b = np.array(b, dtype=float).reshape(-1)
+    c = np.array(c, dtype=float).reshape(-1)
+    return Scaled(A=A_scaled.toarray() if dense else A_scaled.tocsc(),
+                  b=(r * b).reshape(-1,1),
+                  c=(s * c).reshape(-1,1),
+                  row=r.reshape(-1,1),
+                  col=s.reshape(-1,1))
+
+
+def unscale(scaled: Scaled, x: np.ndarray) -> np.ndarray:
+    """Map a solution x' of the scaled LP to the solution x = Sx'."""
+    return scaled.col * x
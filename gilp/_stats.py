@@ -0,0 +1,59 @@
+"""Statistics collected by the simplex method and branch and bound.
+
+This module defines a Stats class which accumulates counters and timers while
+an LP is solved with the simplex method or an integer program is solved with
+branch and bound. The statistics of every branch and bound node are added to
+the statistics of the whole search.
+"""
+
+__author__ = 'Henry Robbins'
+__all__ = ['Stats', 'PRUNE_REASONS']
+
+PRUNE_REASONS = ['infeasible', 'bound', 'integral']
+
+
+class Stats:
+    """Counters and timers of a simplex or branch and bound run.
+
+    Attributes:
+        iterations (int): Simplex iterations (pivots and bound flips).
+        pivots (int): Pivots (changes of the basis), phase one included.
+        degenerate_pivots (int): Pivots not changing the objective value.
+        bound_flips (int): Iterations moving a variable between its bounds.
+        phase_one_pivots (int): Pivots done in phase one.
+        solves (int): Linear solves (FTRAN or BTRAN) with a basis matrix.
+        pricing_time (float): Seconds spent computing reduced costs.
+        ratio_test_time (float): Seconds spent in ratio tests.
+        phase_one_time (float): Seconds spent in phase one.
+        time (float): Total number of seconds.
+        nodes (int): Branch and bound nodes explored.
+        pruned (Dict[str, int]): Branch and bound nodes pruned by reason
+            ('infeasible', 'bound', or 'integral').
+    """
+
+    def __init__(self):
+        self.iterations = 0
+        self.pivots = 0
+        self.degenerate_pivots = 0
+        self.bound_flips = 0
+        self.phase_one_pivots = 0
+        self.solves = 0
+        self.pricing_time = 0.0
+        self.ratio_test_time = 0.0
+        self.phase_one_time = 0.0
+        self.time = 0.0
+        self.nodes = 0
+        self.pruned = dict.fromkeys(PRUNE_REASONS, 0)
+
+    def add(self, other: 'Stats'):
+        """Add the counters and timers (except time) of other to these."""
+        for key, value in vars(other).items():
+            if key == 'pruned':
+                for reason, count in value.items():
+                    self.pruned[reason] += count
+            elif key != 'time':
+                setattr(self, key, getattr(self, key) + value)
+
+    def __repr__(self) -> str:
+        fields = ', '.join('%s=%s' % item for item in vars(self).items())
+        return 'Stats(%s)' % fields
@@ -6,15 +6,27 @@ be obtained through an implementation of the branch and bound algorithm.
 """
 
 __author__ = 'Henry Robbins'
-__all__ = ['BFS', 'LP', 'simplex', 'branch_and_bound']
+__all__ = ['BFS', 'LP', 'SimplexPath', 'simplex', 'simplex_iter',
+           'branch_and_bound']
 
 from collections import namedtuple
+from collections.abc import Sequence
+from concurrent import futures
+import copy
+import heapq
 import itertools
 from ._geometry import polytope_vertices
+from ._linalg import BasisFactor, SlackMatrix, column, columns
+from . import _ipm, _presolve, _scaling
+from ._stats import Stats
 import math
+import multiprocessing
 import numpy as np
-from scipy.linalg import solve, LinAlgError
-from typing import Union, List, Tuple
+from scipy import sparse
+from scipy.linalg import LinAlgError, qr
+import threading
+import time
+from typing import Callable, Iterator, Union, List, Tuple
 import warnings
 
 BFS = namedtuple('bfs', ['x', 'B', 'obj_val', 'optimal'])
@@ -26,6 +38,81 @@ Basic feasible solution (BFS) for a linear program (LP).
 - obj_val (float): Objective value of the basic feasible solution.
 - optimal (bool): True if x is known to be optimal. False otherwise.'''
 
+Coefficients = namedtuple('coefficents', ['n', 'm', 'A', 'b', 'c'])
+Coefficients.__doc__ = '''\
+Coefficients of a linear program (LP) and the dimensions of A.
+
+- n (int): Number of columns of A.
+- m (int): Number of rows of A.
+- A (Union[np.ndarray, sparse.spmatrix]): LHS coefficients.
+- b (np.ndarray): RHS coefficients.
+- c (np.ndarray): Objective function coefficients.'''
+
+Bounds = namedtuple('bounds', ['lb', 'ub'])
+Bounds.__doc__ = '''\
+Lower and upper bounds on the variables of a linear program (LP).
+
+- lb (np.ndarray): Lower bounds on the variables.
+- ub (np.ndarray): Upper bounds on the variables.'''
+
+Sensitivity = namedtuple('sensitivity', ['y', 'red_costs', 'obj_range',
+                                         'rhs_range'])
+Sensitivity.__doc__ = '''\
+Sensitivity analysis of an optimal basis of a linear program (LP).
+
+- y (np.ndarray): Shadow prices (dual values) of the constraints.
+- red_costs (np.ndarray): Reduced costs of the variables.
+- obj_range (np.ndarray): Interval [low, high] of each objective function
+  coefficient for which the basis stays optimal (n*2 matrix).
+- rhs_range (np.ndarray): Interval [low, high] of each RHS coefficient for
+  which the basis stays feasible (m*2 matrix).'''
+
+
+class _Attributes:
+    """Mixin giving a namedtuple additional (non-tuple) attributes.
+
+    Instances unpack and index as the namedtuple only. The names listed in
+    _attributes are passed as keyword arguments (None by default) and are
+    kept by _replace. This way, results can gain information without
+    breaking positional unpacking.
+    """
+
+    _attributes = ()
+
+    def __new__(cls, *args, **kwargs):
+        extra = {name: kwargs.pop(name, None) for name in cls._attributes}
+        self = super().__new__(cls, *args, **kwargs)
+        self.__dict__.update(extra)
+        return self
+
+    def _replace(self, **kwargs):
+        values = dict(self._asdict(), **self.__dict__)
+        values.update(kwargs)
+        return type(self)(**values)
+
+
+class _Simplex(_Attributes, namedtuple('simplex', ['x', 'B', 'obj_val',
+                                                   'optimal', 'path'])):
+    """Result of simplex (see simplex for a description of the fields)."""
+
+    _attributes = ('priced', 'sensitivity', 'stats', 'status')
+
+
+class _Bnb(_Attributes, namedtuple('bnb', ['x', 'obj_val'])):
+    """Result of branch_and_bound (see branch_and_bound for the fields)."""
+
+    _attributes = ('stats', 'status')
+
+
+BnbIter = namedtuple('bnb_iter', ['fathomed', 'incumbent', 'best_bound',
+                                  'left_LP', 'right_LP', 'status', 'B',
+                                  'obj_val', 'estimate', 'index', 'x'],
+                     defaults=['optimal', None, None, None, None, None])
+BnbIter.__doc__ = '''\
+Result of one iteration of branch and bound on a node.
+
+See branch_and_bound_iteration for a description of the fields.'''
+
 
 class UnboundedLinearProgram(Exception):
     """Raised when an LP is found to be unbounded during an execution of the
@@ -56,97 +143,199 @@ class LP:
     The LP class maintains the coefficents of a linear program. If initialized
     in standard inequality form, both standard equality and inequality form
     are maintained. Otherwise, only standard equality form is maintained.
-    Hence, if equality is True, the attributes A, b, and c are None.
+    Hence, if equality is True, the attributes A, b, c, lb, and ub are None.
+    If A is given as a scipy.sparse matrix, A and A_eq are kept sparse (CSC
+    format). For an LP in standard inequality form, A_eq = [A I] is not
+    stored; it is formed (read-only) when accessed, only once if the LP is
+    immutable, and get_coefficients with copy=False gives it implicitly as a
+    SlackMatrix. Variables have lower bounds lb (0 by default) and upper
+    bounds ub (infinity by default). Slack variables have bounds 0 and
+    infinity. An immutable LP stores read-only arrays and its attributes can
+    not be set.
 
     ::
 
-        inequality        equality
-        max c^Tx          max c_eq^Tx
-        s.t A x <= b      s.t A_eq x == b_eq
-              x >= 0               x >= 0
+        inequality             equality
+        max c^Tx               max c_eq^Tx
+        s.t A x <= b           s.t A_eq x == b_eq
+            lb <= x <= ub          lb_eq <= x <= ub_eq
 
     Attributes:
         n (int): Number of decision variables (excluding slack variables).
         m (int): Number of constraints (excluding nonnegativity constraints).
-        A (np.ndarray): LHS coefficients of LP in standard inequality form.
-        A_eq (np.ndarray): LHS coefficients of LP in standard equality form.
+        A (Union[np.ndarray, sparse.spmatrix]): LHS coefficients of LP in
+            standard inequality form.
+        A_eq (Union[np.ndarray, sparse.spmatrix]): LHS coefficients of LP in
+            standard equality form.
         b (np.ndarray): RHS coefficients of LP in standard inequality form.
         b_eq (np.ndarray): RHS coefficients of LP in standard equality form.
         c (np.ndarray): Objective function coefficents for inequality form.
         c_eq (np.ndarray): Objective function coefficents for equality form.
+        lb (np.ndarray): Lower bounds of the variables in inequality form.
+        lb_eq (np.ndarray): Lower bounds of the variables in equality form.
+        ub (np.ndarray): Upper bounds of the variables in inequality form.
+        ub_eq (np.ndarray): Upper bounds of the variables in equality form.
         equality (bool): True iff the LP is in standard equality form.
+        immutable (bool): True iff the LP is immutable.
     """
 
     def __init__(self,
-                 A: Union[np.ndarray, List, Tuple],
+                 A: Union[np.ndarray, List, Tuple, sparse.spmatrix],
                  b: Union[np.ndarray, List, Tuple],
                  c: Union[np.ndarray, List, Tuple],
-                 equality: bool = False):
+                 equality: bool = False,
+                 lb: Union[np.ndarray, List, Tuple] = None,
+                 ub: Union[np.ndarray, List, Tuple] = None,
+                 immutable: bool = False):
         """Initialize an LP.
 
         Creates an instance of LP using the given coefficents interpreted as
-        either inequality or equality form.
+        either inequality or equality form. The bounds on the variables are
+        handled implicitly by the simplex method (they do not add rows to A).
 
         ::
 
-            inequality        equality
-            max c^Tx          max c^Tx
-            s.t Ax <= b       s.t Ax == b
-                x  >= 0            x >= 0
+            inequality             equality
+            max c^Tx               max c^Tx
+            s.t Ax <= b            s.t Ax == b
+                lb <= x <= ub          lb <= x <= ub
 
         Args:
-            A (Union[np.ndarray, List, Tuple]): An m*n matrix of coefficients.
+            A (Union[np.ndarray, List, Tuple, sparse.spmatrix]): An m*n matrix
+                of coefficients (dense or scipy.sparse).
             b (Union[np.ndarray, List, Tuple]): Coefficient vector of length m.
             c (Union[np.ndarray, List, Tuple]): Coefficient vector of length n.
             equality (bool): True iff the LP is in standard equality form.
+            lb (Union[np.ndarray, List, Tuple]): Finite lower bounds of length
+                n. 0 by default.
+            ub (Union[np.ndarray, List, Tuple]): Upper bounds of length n.
+                Infinity by default.
+            immutable (bool): True iff the coefficients and bounds of the LP
+                are read-only and its attributes can not be set.
 
         Raises:
             ValueError: b should have shape (m,1) or (m) but was ().
             ValueError: c should have shape (n,1) or (n) but was ().
+            ValueError: lb should have shape (n,1) or (n) but was ().
+            ValueError: ub should have shape (n,1) or (n) but was ().
+            ValueError: Lower bounds must be finite and at most upper bounds.
         """
+        self.immutable = False
         self.equality = equality
-        self.m = len(A)
-        self.n = len(A[0])
+        if sparse.issparse(A):
+            A = sparse.csc_matrix(A, copy=True)
+            A.sum_duplicates()
+        else:
+            A = np.copy(A) if type(A) != np.array else np.array(A)
+        self.m, self.n = A.shape
+
+        lb = np.zeros(self.n) if lb is None else lb
+        ub = np.full(self.n, np.inf) if ub is None else ub
+        lb = _validate(vector=_vectorize(lb).astype(float),
+                       sizes=self.n, name='lb')
+        ub = _validate(vector=_vectorize(ub).astype(float),
+                       sizes=self.n, name='ub')
+        if not (np.all(np.isfinite(lb)) and np.all(lb <= ub)):
+            raise ValueError('Lower bounds must be finite and at most upper '
+                             'bounds.')
 
         if self.equality:
-            self.A_eq = np.copy(A) if type(A) != np.array else np.array(A)
+            self._A_eq = A
             self.b_eq = _validate(vector=_vectorize(b), sizes=self.m, name='b')
             self.c_eq = _validate(vector=_vectorize(c), sizes=self.n, name='c')
+            self.lb_eq, self.ub_eq = lb, ub
 
             A, b, c = (None, None, None)
         else:
-            self.A = np.copy(A) if type(A) != np.array else np.array(A)
+            self.A = A
             self.b = _validate(vector=_vectorize(b), sizes=self.m, name='b')
             self.c = _validate(vector=_vectorize(c), sizes=self.n, name='c')
 
-            self.A_eq = np.hstack((self.A, np.identity(self.m)))
+            self._A_eq = None  # [A I] with implicit slack columns
             self.b_eq = np.copy(self.b)
             self.c_eq = np.vstack((self.c, np.zeros((self.m, 1))))
-
-    def get_coefficients(self, equality: bool = True):
+            self.lb, self.ub = lb, ub
+            self.lb_eq = np.vstack((self.lb, np.zeros((self.m, 1))))
+            self.ub_eq = np.vstack((self.ub, np.full((self.m, 1), np.inf)))
+
+        if immutable:
+            for name in ['A', 'b', 'c', 'lb', 'ub',
+                         '_A_eq', 'b_eq', 'c_eq', 'lb_eq', 'ub_eq']:
+                if getattr(self, name, None) is not None:
+                    _set_read_only(getattr(self, name))
+            self.immutable = True
+
+    @property
+    def A_eq(self) -> Union[np.ndarray, sparse.spmatrix]:
+        """LHS coefficients of LP in standard equality form."""
+        if self.equality:
+            return self._A_eq
+        A_eq = self.__dict__.get('_explicit_A_eq')
+        if A_eq is None:
+            A_eq = SlackMatrix(self.A).explicit()
+            _set_read_only(A_eq)
+            if self.immutable:
+                # A can not change, so [A I] is only formed once
+                object.__setattr__(self, '_explicit_A_eq', A_eq)
+        return A_eq
+
+    def __setattr__(self, name, value):
+        if getattr(self, 'immutable', False):
+            raise AttributeError('Can not set %s of an immutable LP.' % name)
+        super().__setattr__(name, value)
+
+    def get_coefficients(self,
+                         equality: bool = True,
+                         copy: bool = True) -> Coefficients:
         """Returns the coefficents describing this LP.
 
         If equality is True (defaults to True), then return standard equality
         coefficents. Otherwise, return standard inequality coefficents. Also
-        returns the dimensions of m*n matrix A.
+        returns the dimensions of m*n matrix A. If copy is True (defaults to
+        True), copies are returned. Otherwise, read-only views of the
+        coefficients are returned without copying them. In that case, the
+        standard equality form [A I] of an inequality LP is returned as a
+        SlackMatrix whose slack columns are implicit.
         """
-        Coefficents = namedtuple('coefficents', ['n', 'm', 'A', 'b', 'c'])
         if equality:
-            m, n = self.A_eq.shape
-            return Coefficents(n=n,
-                               m=m,
-                               A=np.copy(self.A_eq),
-                               b=np.copy(self.b_eq),
-                               c=np.copy(self.c_eq))
+            A, b, c = self._A_eq, self.b_eq, self.c_eq
         else:
             if self.equality:
                 raise ValueError('Equality form LP. No inequality form.')
-            m, n = self.A.shape
-            return Coefficents(n=n,
-                               m=m,
-                               A=np.copy(self.A),
-                               b=np.copy(self.b),
-                               c=np.copy(self.c))
+            A, b, c = self.A, self.b, self.c
+        get = _copy if copy else _read_only
+        if A is None:
+            # Standard equality form [A I] of an inequality LP
+            A = SlackMatrix(self.A)
+            m, n = A.shape
+            A = A.explicit() if copy else SlackMatrix(_read_only(self.A))
+            return Coefficients(n=n, m=m, A=A, b=get(b), c=get(c))
+        m, n = A.shape
+        return Coefficients(n=n, m=m, A=get(A), b=get(b), c=get(c))
+
+    def get_bounds(self,
+                   equality: bool = True,
+                   copy: bool = True) -> Bounds:
+        """Returns the lower and upper bounds on the variables of this LP.
+
+        If equality is True (defaults to True), then return the bounds in
+        standard equality form (including the slack variables). Otherwise,
+        return the bounds in standard inequality form. If copy is True
+        (defaults to True), copies are returned. Otherwise, read-only views of
+        the bounds are returned without copying them.
+        """
+        if equality:
+            lb, ub = self.lb_eq, self.ub_eq
+        else:
+            if self.equality:
+                raise ValueError('Equality form LP. No inequality form.')
+            lb, ub = self.lb, self.ub
+        get = _copy if copy else _read_only
+        return Bounds(lb=get(lb), ub=get(ub))
+
+    def is_bounded(self) -> bool:
+        """Return true if some variable has a bound other than [0, inf)."""
+        return bool(np.any(self.lb_eq != 0) or np.any(np.isfinite(self.ub_eq)))
 
     def get_basic_feasible_sol(self,
                                B: List[int],
@@ -158,7 +347,8 @@ class LP:
         basic solution x satisfies A_Bx = b. By definition, x is a basic
         feasible solution iff x satisfies both A_Bx = b and x > 0. These
         constraints must be satisfied to a tolerance of feas_tol (which is set
-        to 1e-7 by default).
+        to 1e-7 by default). If the variables have bounds, the nonbasic
+        variables are at their lower bounds and x must satisfy lb <= x <= ub.
 
         Args:
             B (List[int]): A list of indices in {0..(n+m-1)} forming a basis.
@@ -171,16 +361,18 @@ class LP:
             InvalidBasis: B
             InfeasibleBasicSolution: x_B
         """
-        n,m,A,b,c = self.get_coefficients()
+        n,m,A,b,c = self.get_coefficients(copy=False)
+        lb,ub = self.get_bounds(copy=False)
         B.sort()
         if len(B) == m and B[-1] < n:
+            x_B = np.copy(lb)  # nonbasic variables at their lower bounds
+            x_B[B,:] = 0
             try:
-                x = solve(A[:,B], b)
+                x = BasisFactor(A, B).ftran(b - A @ x_B)
             except LinAlgError:
                 raise InvalidBasis(B)
-            x_B = np.zeros((n, 1))
             x_B[B,:] = x
-            if all(x_B >= np.zeros((n, 1)) - feas_tol):
+            if all(x_B >= lb - feas_tol) and all(x_B <= ub + feas_tol):
                 return BFS(x=x_B,
                            B=B,
                            obj_val=float(np.dot(c.transpose(), x_B)),
@@ -196,7 +388,7 @@ class LP:
         Returns:
             List[BFS]: List of basic feasible solutions.
         """
-        n,m,A,b,c = self.get_coefficients()
+        n,m,A,b,c = self.get_coefficients(copy=False)
         bfs = []
         for B in itertools.combinations(range(n), m):
             try:
@@ -222,7 +414,8 @@ class LP:
         Raises:
             InvalidBasis: Invalid basis. A_B is not invertible.
         """
-        n,m,A,b,c = self.get_coefficients()
+        n,m,A,b,c = self.get_coefficients(copy=False)
+        A = _dense(A)
         if not _invertible(A[:,B]):
             raise InvalidBasis('Invalid basis. A_B is not invertible.')
 
@@ -241,24 +434,38 @@ class LP:
         T[1:,n+1] = np.dot(A_B_inv, b)[:,0]
         return T
 
-    def get_vertices(self) -> np.ndarray:
-        """Return the vertices of this inequality LP's feasible region.
+    def get_polyhedron(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (A, b) such that the feasible region is {x : Ax <= b}.
+
+        The constraints of this inequality LP are followed by the lower bounds
+        -x <= -lb and the finite upper bounds x <= ub.
 
         Returns:
-            np.ndarray: Vertices of the LP's feasible region.
+            Tuple[np.ndarray, np.ndarray]: Dense matrix A and vector b.
 
         Raises:
             ValueError: The LP must be in standard inequality form.
         """
         try:
-            n,m,A,b,c = self.get_coefficients(equality=False)
+            n,m,A,b,c = self.get_coefficients(equality=False, copy=False)
         except ValueError:
             raise ValueError('The LP must be in standard inequality form.')
+        lb,ub = self.get_bounds(equality=False, copy=False)
+        finite = np.isfinite(ub[:,0])
+        A_tmp = np.vstack((_dense(A), -np.identity(n), np.identity(n)[finite]))
+        b_tmp = np.vstack((b, -lb, ub[finite]))
+        return A_tmp, b_tmp
+
+    def get_vertices(self) -> np.ndarray:
+        """Return the vertices of this inequality LP's feasible region.
+
+        Returns:
+            np.ndarray: Vertices of the LP's feasible region.
 
-        # Add non-negativity constraints and return vertices
-        A_tmp = np.vstack((A, -np.identity(n)))
-        b_tmp = np.vstack((b, np.zeros((n,1))))
-        return polytope_vertices(A_tmp, b_tmp)
+        Raises:
+            ValueError: The LP must be in standard inequality form.
+        """
+        return polytope_vertices(*self.get_polyhedron())
 
 
 def _vectorize(array: Union[np.ndarray, List, Tuple]):
@@ -270,6 +477,44 @@ def _vectorize(array: Union[np.ndarray, List, Tuple]):
     return array
 
 
+def _dense(A: Union[np.ndarray, sparse.spmatrix]) -> np.ndarray:
+    """Return the matrix A as a dense numpy array."""
+    if sparse.issparse(A) or isinstance(A, SlackMatrix):
+        return A.toarray()
+    return A
+
+
+def _explicit(A: Union[np.ndarray, sparse.spmatrix, SlackMatrix]):
+    """Return the matrix A with any implicit slack columns formed."""
+    return A.explicit() if isinstance(A, SlackMatrix) else A
+
+
+def _copy(A: Union[np.ndarray, sparse.spmatrix]):
+    """Return a (writeable) copy of a (sparse) matrix."""
+    return A.copy()
+
+
+def _read_only(A: Union[np.ndarray, sparse.spmatrix]):
+    """Return a read-only view of a (sparse) matrix which shares its data."""
+    if sparse.issparse(A):
+        return sparse.csc_matrix((_read_only(A.data),
+                                  _read_only(A.indices),
+                                  _read_only(A.indptr)),
+                                 shape=A.shape, copy=False)
+    view = A.view()
+    view.flags.writeable = False
+    return view
+
+
+def _set_read_only(A: Union[np.ndarray, sparse.spmatrix]):
+    """Clear the writeable flag of a (sparse) matrix in place."""
+    if sparse.issparse(A):
+        for array in [A.data, A.indices, A.indptr]:
+            array.flags.writeable = False
+    else:
+        A.flags.writeable = False
+
+
 def _validate(vector: np.ndarray, sizes: List[int], name: str):
     """Validate vector has one of the expected sizes."""
     sizes = [sizes] if type(sizes) == int else sizes
@@ -295,197 +540,768 @@ def _invertible(A:np.ndarray) -> bool:
     return len(A) == len(A[0]) and np.linalg.matrix_rank(A) == len(A)
 
 
-def _phase_one(lp: LP, feas_tol: float = 1e-7) -> BFS:
+def _crash_basis(A: Union[np.ndarray, sparse.spmatrix, SlackMatrix],
+                 residual: np.ndarray,
+                 lb: np.ndarray,
+                 ub: np.ndarray,
+                 feas_tol: float = 1e-7) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the slack column crashed into the basis for each row of A.
+
+    A slack column j of row i has a single nonzero entry a_ij. With all other
+    variables at their lower bounds, its value is lb_j + residual_i / a_ij
+    where residual = b - A lb. The slack is basic in row i if this value is
+    within its bounds. If a row has multiple such slacks, the one with the
+    largest index is used. Rows without one are marked with -1. The pivot
+    entry a_ij of every crashed slack is returned as well (0 for rows without
+    one) so the slack values can be set without extracting its columns. The
+    unit columns of a SlackMatrix are used without forming them.
+
+    Args:
+        A (Union[np.ndarray, sparse.spmatrix, SlackMatrix]): An m*n matrix of
+            coefficients.
+        residual (np.ndarray): Residual b - A lb (m*1 vector).
+        lb (np.ndarray): Lower bounds of the variables (n*1 vector).
+        ub (np.ndarray): Upper bounds of the variables (n*1 vector).
+        feas_tol (float): Primal feasibility tolerance (1e-7 default).
+
+    Returns:
+        Tuple:
+
+        - crash (np.ndarray): Slack column for each row (-1 if there is none).
+        - pivots (np.ndarray): Pivot entry a_ij of each crashed slack.
+    """
+    S = A.A if isinstance(A, SlackMatrix) else A
+    C = sparse.csc_matrix(S, dtype=float, copy=True)
+    C.eliminate_zeros()
+    J = np.flatnonzero(np.diff(C.indptr) == 1)
+    rows, a = C.indices[C.indptr[J]], C.data[C.indptr[J]]
+    if isinstance(A, SlackMatrix):
+        # The implicit unit columns are slack columns by construction
+        J = np.concatenate((J, A.n + np.arange(len(A.rows))))
+        rows = np.concatenate((rows, A.rows))
+        a = np.concatenate((a, A.signs))
+    t = residual[rows,0] / a
+    ok = (t >= -feas_tol) & (lb[J,0] + t <= ub[J,0] + feas_tol)
+    crash = np.full(A.shape[0], -1)
+    np.maximum.at(crash, rows[ok], J[ok])
+    pivots = np.zeros(A.shape[0])
+    chosen = np.flatnonzero(crash >= 0)
+    pivots[chosen] = a[np.searchsorted(J, crash[chosen])]
+    return crash, pivots
+
+
+class _AuxiliaryLP:
+    """Auxiliary LP of phase I in standard equality form.
+
+    Only the parts of the LP interface used by a simplex iteration are
+    provided. The coefficient matrix is kept as given (a SlackMatrix whose
+    unit columns include the artificial variables) and the upper bounds are
+    writeable so that artificial variables can be retired.
+
+    Attributes:
+        A_eq (SlackMatrix): LHS coefficients (with artificial columns).
+        b_eq (np.ndarray): RHS coefficients.
+        c_eq (np.ndarray): Objective function coefficents.
+        lb_eq (np.ndarray): Lower bounds of the variables.
+        ub_eq (np.ndarray): Upper bounds of the variables.
+    """
+
+    def __init__(self,
+                 A: SlackMatrix,
+                 b: np.ndarray,
+                 c: np.ndarray,
+                 lb: np.ndarray,
+                 ub: np.ndarray):
+        self.A_eq, self.b_eq, self.c_eq = A, b, c
+        self.lb_eq, self.ub_eq = lb, ub
+
+    def get_coefficients(self, copy: bool = False) -> Coefficients:
+        """Return the coefficients (without copying them)."""
+        m, n = self.A_eq.shape
+        return Coefficients(n=n, m=m, A=self.A_eq, b=self.b_eq, c=self.c_eq)
+
+    def get_bounds(self, copy: bool = False) -> Bounds:
+        """Return the bounds (without copying them)."""
+        return Bounds(lb=self.lb_eq, ub=self.ub_eq)
+
+
+def _phase_one(lp: LP,
+               feas_tol: float = 1e-7,
+               stats: Stats = None,
+               limits: '_Limits' = None) -> BFS:
     """Execute Phase I of the simplex method.
 
     Execute Phase I of the simplex method to find an inital basic feasible
     solution to the given LP. Return a basic feasible solution if one exists.
-    Otherwise, raise the Infeasible exception.
+    Otherwise, raise the Infeasible exception. The variables start at their
+    lower bounds. A crash basis of slack columns (see _crash_basis) covers
+    every row where it is feasible and an artificial variable is added for
+    each other row only. If no artificial variable is needed, the crash basis
+    is returned without any pivots.
+
+    The auxiliary LP is built once (its artificial columns are implicit unit
+    columns) and one basis factorization is updated across all pivots. An
+    artificial variable which leaves the basis is retired by fixing its upper
+    bound at 0. Basic artificial variables (at value 0) are then pivoted out
+    of the basis. If no original variable can replace one, its constraint is
+    redundant and is dropped (the returned basis then has fewer than m
+    indices).
 
     Args:
         lp (LP): LP on which phase I of the simplex method will be done.
         feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        stats (Stats): Statistics to which phase I is added (if given).
+        limits (_Limits): Cancellation and time limit checked every pivot.
 
     Returns:
         BFS: Inital basic feasible solution
 
     Raises:
         Infeasible: The LP is found to not have a feasible solution.
+        _Interrupted: Phase I was cancelled or ran out of time.
     """
-
-    def delete_variables(A,c,x,B,rem):
-        """Delete variables with indices in rem from the given coefficent
-        matrices, basic feasible solution, and basis."""
-        in_basis = np.array([int(i in B) for i in range(len(A[0]))])
-        B = list(np.nonzero(np.delete(in_basis,rem))[0])
-        A = np.delete(A, rem, 1)
-        c = np.delete(c, rem, 0)
-        x = np.delete(x, rem, 0)
-        return A,c,x,B
-
-    n,m,A,b,c = lp.get_coefficients()
-
-    # Augment so b is non-negative
-    neg = (b < 0)[:,0]
-    b[neg] = -b[neg]
-    A[neg,:] = -A[neg,:]
-
-    # Introduce artificial variables
-    A = np.hstack((A,np.identity(m)))
-    c = np.zeros((n+m,1))
-    c[n:,0] = -1
-
-    # Use artificial variables as initial basis
-    B = list(range(n,n+m))
-    x = np.zeros((n+m,1))
-    x[B,:] = b
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    residual = b - A @ lb
+
+    # Crash basis of slack columns
+    crash, pivots = _crash_basis(A, residual, lb, ub, feas_tol)
+    rows = np.flatnonzero(crash >= 0)
+    S = crash[rows]
+    x = np.copy(lb)
+    x[S,0] += residual[rows,0] / pivots[rows]
+    if len(S) == m:
+        B = sorted(int(j) for j in S)
+        obj_val = float(np.dot(c.transpose(), x))
+        return BFS(x=x, B=B, obj_val=obj_val, optimal=False)
+
+    # Introduce artificial variables for the remaining rows; the sign of each
+    # artificial column makes its value |residual_i| non-negative. They are
+    # kept as implicit unit columns (after any slack columns of A).
+    art = np.flatnonzero(crash < 0)
+    k = len(art)
+    signs = np.where(residual[art,0] < 0, -1, 1)
+    if isinstance(A, SlackMatrix):
+        A_aux = SlackMatrix(A.A, np.concatenate((A.rows, art)),
+                            np.concatenate((A.signs, signs)))
+    else:
+        A_aux = SlackMatrix(A, art, signs)
+    c_aux = np.zeros((n+k,1))
+    c_aux[n:,0] = -1
+    aux_lp = _AuxiliaryLP(A_aux, b, c_aux,
+                          lb=np.vstack((lb, np.zeros((k,1)))),
+                          ub=np.vstack((ub, np.full((k,1), np.inf))))
+
+    # Use the crash basis and artificial variables as initial basis
+    B = sorted([int(j) for j in S] + list(range(n,n+k)))
+    x = np.vstack((x, np.abs(residual[art])))
+    bfs = BFS(x=x, B=B, obj_val=float(np.dot(c_aux.transpose(),x)),
+              optimal=False)
 
     # Solve the auxiliary LP
-    aux_lp = LP(A,b,c,equality=True)
-
-    optimal = False
-    obj_val = float(np.dot(c.transpose(),x))
-    bfs = BFS(x=x, B=B, obj_val=obj_val, optimal=optimal)
-
-    while(not optimal):
-        x, B, obj_val, optimal = _simplex_iteration(lp=aux_lp,
-                                                    bfs=bfs,
-                                                    feas_tol=feas_tol)
-        # Delete appearances of nonbasic artificial variables
-        rem = [i for i in list(range(n,aux_lp.n)) if i not in B]
-        A,c,x,B = delete_variables(A,c,x,B,rem)
-        aux_lp = LP(A,b,c,equality=True)
-        bfs = BFS(x=x, B=B, obj_val=obj_val, optimal=optimal)
+    state = _SimplexState(A_aux, B, stats)
+    pivots = state.stats.pivots
+    while(not bfs.optimal):
+        bfs = _simplex_iteration(lp=aux_lp,
+                                 bfs=bfs,
+                                 feas_tol=feas_tol,
+                                 state=state)
+        # Retire nonbasic artificial variables (fix them at 0)
+        retired = n + np.flatnonzero(~state.is_basic[n:])
+        aux_lp.ub_eq[retired] = 0
+        status = None if limits is None else limits.interrupted()
+        if status is not None:
+            raise _Interrupted(status)
 
     # Interpret solution to the auxiliary LP
-    if obj_val < -feas_tol:
+    if bfs.obj_val < -feas_tol:
         raise Infeasible('The LP has no feasible solutions.')
-    else:
-        # Remove constraints and pivot to remove any basic artificial variables
-        while(B[-1] >= n):
-            j = B[-1]  # Basic artificial variable in column j
-            a = aux_lp.get_tableau(B)[1:,1:-1]
-            i = int(np.nonzero(a[:,j])[0])  # Corresponding constraint in row i
-            nonzero_a_ij = np.nonzero(a[i,:n])[0]
-            if len(nonzero_a_ij) > 0:
-                # Nonzero a_ij enters and nonbasic artificial variable leaves
-                B.append(nonzero_a_ij[0])
-                B.remove(j)
-                B.sort()
+
+    # Pivot basic artificial variables (at value 0) out of the basis
+    x = bfs.x
+    for j in sorted(state.header[state.header >= n], reverse=True):
+        p = state.position[j]
+        e_p = np.zeros(m)
+        e_p[p] = 1
+        alpha = A_aux.transpose() @ state.factor.btran(e_p)
+        candidates = np.flatnonzero((np.abs(alpha[:n]) > feas_tol)
+                                    & ~state.is_basic[:n])
+        if len(candidates) > 0:
+            # Degenerate pivot: the first candidate replaces the artificial
+            k = int(candidates[0])
+            state.pivot(p, k, state.factor.ftran(column(A_aux, k)))
+            state.stats.pivots += 1
+            state.stats.degenerate_pivots += 1
+        # Otherwise, the constraint is redundant and the artificial variable
+        # (and its constraint) are dropped below
+    B = sorted(int(j) for j in state.header if j < n)
+    x = x[:n]
+    obj_val = float(np.dot(c.transpose(), x))
+    state.stats.phase_one_pivots += state.stats.pivots - pivots
+    state.stats.solves += state.factor.solves
+    return BFS(x=x, B=B, obj_val=obj_val, optimal=False)
+
+
+class _SimplexState:
+    """Basis header, factorization, and workspace kept between pivots.
+
+    The basis header (held by the factorization) is complemented by a boolean
+    mask of the basic variables and the position of every variable in the
+    header. Pricing and ratio tests are then vectorized numpy operations on
+    preallocated buffers and a pivot updates the header in constant time.
+    Partial pricing scans a rotating block of columns and keeps a short list
+    of attractive candidates which is re-priced first at the next iteration.
+
+    Attributes:
+        factor (BasisFactor): Factorization of A_B (and the basis header).
+        is_basic (np.ndarray): Boolean mask of the basic variables.
+        position (np.ndarray): Header position of each variable (-1 if none).
+        red_costs (np.ndarray): Workspace for the reduced costs.
+        eligible (np.ndarray): Workspace for the entering candidate mask.
+        weights (np.ndarray): Reference weights of the pricing rule (if any).
+        weight_rule (str): Pricing rule the reference weights belong to.
+        block_size (int): Number of columns per partial pricing block.
+        list_size (int): Maximum length of the candidate list.
+        candidates (np.ndarray): Candidate list of partial pricing.
+        block_start (int): First column of the next partial pricing block.
+        priced (int): Number of reduced costs computed so far.
+        move (Tuple[int, int, float]): Entering variable, leaving variable,
+            and (signed) step of the entering variable of the last iteration.
+        stats (Stats): Statistics updated by the iterations.
+    """
+
+    def __init__(self,
+                 A: Union[np.ndarray, sparse.spmatrix],
+                 B: List[int],
+                 stats: Stats = None):
+        """Initialize the state for the basis B of the m*n matrix A.
+
+        Raises:
+            LinAlgError: Singular basis matrix.
+        """
+        n = A.shape[1]
+        self.factor = BasisFactor(A, B)
+        self.is_basic = np.zeros(n, dtype=bool)
+        self.is_basic[B] = True
+        self.position = np.full(n, -1, dtype=int)
+        self.position[B] = np.arange(len(B))
+        self.red_costs = np.empty(n)
+        self.eligible = np.empty(n, dtype=bool)
+        self.weights = None
+        self.weight_rule = None
+        self.block_size = max(len(B), int(math.ceil(n / 10)))
+        self.list_size = 5
+        self.candidates = np.zeros(0, dtype=int)
+        self.block_start = 0
+        self.priced = 0
+        self.move = None
+        self.stats = Stats() if stats is None else stats
+
+    @property
+    def header(self) -> np.ndarray:
+        """Basic variable in each position of the basis header."""
+        return self.factor.basis
+
+    def matches(self, B: List[int]) -> bool:
+        """Return true if B is the basis held by this state."""
+        return (len(B) == len(self.header)
+                and bool(np.all(self.is_basic[B])))
+
+    def price(self,
+              A: Union[np.ndarray, sparse.spmatrix],
+              c: np.ndarray) -> np.ndarray:
+        """Compute the reduced costs c - A^Ty (zero for basic variables)."""
+        y = self.factor.btran(c[self.header,0])
+        if isinstance(A, np.ndarray):
+            np.dot(y, A, out=self.red_costs)
+        else:
+            self.red_costs[:] = A.transpose() @ y
+        np.subtract(c[:,0], self.red_costs, out=self.red_costs)
+        self.red_costs[self.header] = 0
+        self.priced += len(self.red_costs)
+        return self.red_costs
+
+    def price_partial(self,
+                      A: Union[np.ndarray, sparse.spmatrix],
+                      c: np.ndarray,
+                      feas_tol: float = 1e-7,
+                      direction: np.ndarray = None,
+                      movable: np.ndarray = None) -> np.ndarray:
+        """Compute the reduced costs of a subset of the columns.
+
+        The candidate list is priced first. If none of its columns is still
+        attractive (reduced cost x direction > feas_tol where the direction is
+        -1 for variables at their upper bound and 1 otherwise, and the
+        variable is movable if a mask of movable variables is given, i.e.
+        not fixed by lb = ub), blocks of
+        block_size columns are priced in a rotating order until one contains
+        an attractive column; the best list_size of them become the new
+        candidate list. Reduced
+        costs of columns not priced are zero, so no entering variable is
+        found iff a full sweep of the blocks found none.
+        """
+        y = self.factor.btran(c[self.header,0])
+        rc = self.red_costs
+        rc.fill(0)
+
+        def price(J):
+            J = J[~self.is_basic[J]]
+            rc[J] = c[J,0] - columns(A, J).transpose() @ y
+            self.priced += len(J)
+            gains = rc[J] if direction is None else rc[J] * direction[J]
+            attractive = gains > feas_tol
+            if movable is not None:
+                attractive &= movable[J]
+            return J[attractive]
+
+        if len(price(self.candidates)) > 0:
+            return rc
+        n = len(rc)
+        for i in range(int(math.ceil(n / self.block_size))):
+            end = min(self.block_start + self.block_size, n)
+            attractive = price(np.arange(self.block_start, end))
+            self.block_start = end % n
+            if len(attractive) > 0:
+                gains = rc[attractive]
+                if direction is not None:
+                    gains = gains * direction[attractive]
+                best = np.argsort(-gains, kind='stable')
+                self.candidates = attractive[best[:self.list_size]]
+                return rc
+        self.candidates = np.zeros(0, dtype=int)
+        return rc
+
+    def init_weights(self,
+                     A: Union[np.ndarray, sparse.spmatrix],
+                     rule: str,
+                     chunk_size: int = 256):
+        """Initialize the reference weights of a pricing rule.
+
+        For 'steepest_edge', the weight of nonbasic variable j is the exact
+        squared norm 1 + ||A_B^(-1)a_j||^2 of its edge direction. The edge
+        directions are computed chunk_size columns at a time so at most an
+        m*chunk_size block is formed. If every basic variable is a slack of a
+        SlackMatrix, A_B is a signed permutation matrix and the weight is
+        simply 1 + ||a_j||^2. For 'devex', the current nonbasic variables form
+        the reference framework and all weights are 1.
+        """
+        self.weights = np.ones(A.shape[1])
+        if rule == 'steepest_edge':
+            N = np.flatnonzero(~self.is_basic)
+            if isinstance(A, SlackMatrix) and np.all(self.header >= A.n):
+                S = A.A
+                if sparse.issparse(S):
+                    norms = np.asarray(S.multiply(S).sum(axis=0)).reshape(-1)
+                else:
+                    norms = np.sum(np.asarray(S, dtype=float)**2, axis=0)
+                norms = np.concatenate((norms, np.ones(len(A.rows))))
+                self.weights[N] += norms[N]
             else:
-                # Redundant constraint; delete
-                A = np.delete(A, i, 0)
-                b = np.delete(b, i, 0)
-            A,c,x,B = delete_variables(A,c,x,B,[j])
-            aux_lp = LP(A,b,c,equality=True)
-        obj_val = float(np.dot(c.transpose(), x))
-        optimal = False
-        return BFS(x=x, B=B, obj_val=obj_val, optimal=optimal)
+                for i in range(0, len(N), chunk_size):
+                    J = N[i:i + chunk_size]
+                    W = self.factor.ftran(columns(A, J))
+                    self.weights[J] += np.sum(W**2, axis=0)
+        self.weight_rule = rule
+
+    def update_weights(self,
+                       A: Union[np.ndarray, sparse.spmatrix],
+                       p: int,
+                       k: int,
+                       d: np.ndarray):
+        """Update the reference weights for the pivot of k into position p.
+
+        Must be called before the pivot (with d = A_B^(-1)a_k). Steepest edge
+        weights use the Goldfarb-Reid recurrence; devex weights use the
+        Forrest-Goldfarb approximation and are reset once they grow large.
+        """
+        r = self.header[p]
+        e_p = np.zeros(len(d))
+        e_p[p] = 1
+        ratio = (A.transpose() @ self.factor.btran(e_p)) / d[p]
+        update = ~self.is_basic
+        update[k] = False
+        w = self.weights
+        if self.weight_rule == 'steepest_edge':
+            gamma_k = 1 + np.dot(d, d)
+            v = A.transpose() @ self.factor.btran(d)
+            new = np.maximum(w - 2*ratio*v + ratio**2 * gamma_k, 1 + ratio**2)
+            w[update] = new[update]
+            w[r] = max(gamma_k / d[p]**2, 1)
+        else:
+            w[update] = np.maximum(w[update], ratio[update]**2 * w[k])
+            w[r] = max(w[k] / d[p]**2, 1)
+            if w.max() > 1e6:
+                w[:] = 1  # reset the reference framework
+        w[k] = 1
+
+    def pivot(self, p: int, k: int, d: np.ndarray):
+        """Replace the basic variable in position p with variable k."""
+        r = self.header[p]
+        self.factor.replace(p, k, d)
+        self.is_basic[r] = False
+        self.is_basic[k] = True
+        self.position[r] = -1
+        self.position[k] = p
 
 
 def _simplex_iteration(lp: LP,
                        bfs: BFS,
                        pivot_rule: str = 'bland',
-                       feas_tol: float = 1e-7
+                       feas_tol: float = 1e-7,
+                       pricing: str = 'full',
+                       state: _SimplexState = None
                        ) -> BFS:
     """Execute a single iteration of the revised simplex method.
 
     Use a primal feasibility tolerance of feas_tol (with default vlaue of
     1e-7). Do one iteration of the revised simplex method using the given
-    pivot rule. Implemented pivot rules include:
+    pivot rule. If a simplex state is given, its basis factorization is used
+    for both the BTRAN (duals) and FTRAN (ratio test) solves and it is
+    updated after the pivot. It is recomputed if it does not match the basis
+    of bfs. The reference weights of the 'steepest_edge' and 'devex' rules
+    are kept in the state and updated across pivots. With 'partial' pricing,
+    only a block of columns (and a short list of candidates kept in the state)
+    is priced and the pivot rule chooses among the priced columns.
+
+    Bounds on the variables are handled implicitly: every nonbasic variable is
+    at its lower or upper bound. A nonbasic variable at its lower (upper)
+    bound is a candidate to enter if its reduced cost is positive (negative).
+    If the entering variable reaches its opposite bound before any basic
+    variable reaches one of its bounds, it moves to that bound and the basis
+    does not change (bound flip). Implemented pivot rules include:
 
     Entering variable:
 
         - 'bland' or 'min_index': minimum index
         - 'dantzig' or 'max_reduced_cost': most positive reduced cost
         - 'greatest_ascent': most positive (minimum ratio) x (reduced cost)
+        - 'steepest_edge': most positive (reduced cost) / ||edge direction||
+        - 'devex': most positive (reduced cost) / (approximate edge norm)
         - 'manual' or 'manual_select': user selects possible entering index
 
     Leaving variable:
 
         - (All): minimum (positive) ratio (minimum index to tie break)
 
+    Reduced costs of variables at their upper bounds count with the opposite
+    sign in the entering variable rules above.
+
     Args:
         lp (LP): LP on which the simplex iteration is being done.
         bfs (BFS): Basic feasible solution.
         pivot_rule (str): Pivot rule to be used. 'bland' by default.
         feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        pricing (str): Pricing ('full' or 'partial'). 'full' by default.
+        state (_SimplexState): Basis factorization and workspace.
 
     Returns:
         BFS: Basic feasible solution after pivot.
 
     Raises:
         ValueError: Invalid pivot rule. Select from (list).
+        ValueError: Invalid pricing. Select from (list).
         ValueError: x should have shape (n+m,1) but was ().
 
     """
     pivot_rules = ['bland','min_index','dantzig','max_reduced_cost',
-                   'greatest_ascent','manual', 'manual_select']
+                   'greatest_ascent','steepest_edge','devex',
+                   'manual', 'manual_select']
     if pivot_rule not in pivot_rules:
         raise ValueError('Invalid pivot rule. Select from ' + str(pivot_rules))
+    pricings = ['full', 'partial']
+    if pricing not in pricings:
+        raise ValueError('Invalid pricing. Select from ' + str(pricings))
 
-    n,m,A,b,c = lp.get_coefficients()
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
     x,B = bfs.x, bfs.B
     if not x.shape == (n, 1):
         raise ValueError('x should have shape (%d,1) but was %s'
                          % (n, str(x.shape)))
 
     B.sort()
-    N = list(set(range(n)) - set(B))
-    y = solve(A[:,B].transpose(), c[B,:])
-    red_costs = c - np.matmul(y.transpose(),A).transpose()
-    entering = {k: red_costs[k] for k in N if red_costs[k] > feas_tol}
-    if len(entering) == 0:
+    if state is None or not state.matches(B):
+        state = _SimplexState(A, B)
+    header = state.header
+    weighted = pivot_rule in ['steepest_edge', 'devex']
+    if weighted and state.weight_rule != pivot_rule:
+        state.init_weights(A, pivot_rule)
+    # Direction of each nonbasic variable: +1 at lower and -1 at upper bound
+    at_upper = (x[:,0] >= ub[:,0]) & ~state.is_basic
+    direction = np.where(at_upper, -1, 1)
+    movable = lb[:,0] < ub[:,0]
+    stats = state.stats
+    start = time.perf_counter()
+    if pricing == 'partial':
+        red_costs = state.price_partial(A, c, feas_tol, direction, movable)
+    else:
+        red_costs = state.price(A, c)
+    stats.pricing_time += time.perf_counter() - start
+    gains = red_costs * direction
+    entering = np.greater(gains, feas_tol, out=state.eligible)
+    entering &= movable
+    if not entering.any():
         current_value = float(np.matmul(c.transpose(), x))
         return BFS(x=x, B=B, obj_val=current_value, optimal=True)
     else:
-
-        def ratio_test(k):
-            """Do the ratio test assuming entering index k. Return the leaving
-            index r, minimum ratio t, and d from solving A_b*d = A_k."""
-            d = np.zeros((1,n))
-            d[:,B] = solve(A[:,B], A[:,k])
-            ratios = {i: x[i]/d[0][i] for i in B if d[0][i] > feas_tol}
-            if len(ratios) == 0:
-                raise UnboundedLinearProgram('This LP is unbounded')
-            t = min(ratios.values())
-            r_pos = [r for r in ratios if ratios[r] == t]
-            r = min(r_pos)
-            t = ratios[r]
-            return r,t,d
+        x_B = x[header].astype(float)
+        lb_B, ub_B = lb[header], ub[header]
+        has_ub = np.isfinite(ub_B)
+
+        def ratios(D):
+            """Return the ratios of the basic variables (one column for each
+            column of D) when x_B decreases by tD."""
+            R = np.full(D.shape, np.inf)
+            np.divide(x_B - lb_B, D, out=R, where=D > feas_tol)
+            np.divide(ub_B - x_B, -D, out=R, where=(D < -feas_tol) & has_ub)
+            return R
 
         if pivot_rule == 'greatest_ascent':
-            eligible = {}
-            for k in entering:
-                r,t,d = ratio_test(k)
-                eligible[(t*red_costs[k])[0]] = [k,r,t,d]
-            k,r,t,d = eligible[max(eligible.keys())]
+            # Ratio tests of all candidates with one multi-column FTRAN
+            start = time.perf_counter()
+            K = np.flatnonzero(entering)
+            D = state.factor.ftran(columns(A, K))
+            R = ratios(D * direction[K])
+            T = np.minimum(R.min(axis=0), ub[K,0] - lb[K,0])
+            if np.isinf(T).any():
+                raise UnboundedLinearProgram('This LP is unbounded')
+            # Last candidate attaining the greatest ascent (minimum ratio)
+            ascent = T * gains[K]
+            j = len(K) - 1 - int(np.argmax(ascent[::-1]))
+            k, t, d, R = int(K[j]), T[j], D[:,j], R[:,j]
+            stats.ratio_test_time += time.perf_counter() - start
         else:
-            user_input = None
             if pivot_rule in ['manual', 'manual_select']:
-                user_options = [i + 1 for i in entering.keys()]
-                user_input = int(input('Pick one of ' + str(user_options))) - 1
-            k = {'bland': min(entering.keys()),
-                 'min_index': min(entering.keys()),
-                 'dantzig': max(entering, key=entering.get),
-                 'max_reduced_cost': max(entering, key=entering.get),
-                 'manual_select': user_input,
-                 'manual': user_input}[pivot_rule]
-            r,t,d = ratio_test(k)
+                user_options = [i + 1 for i in np.flatnonzero(entering)]
+                k = int(input('Pick one of ' + str(user_options))) - 1
+            elif pivot_rule in ['bland', 'min_index']:
+                k = int(np.argmax(entering))
+            elif weighted:
+                score = red_costs**2 / state.weights
+                k = int(np.argmax(np.where(entering, score, -np.inf)))
+            else:  # 'dantzig' or 'max_reduced_cost'
+                k = int(np.argmax(np.where(entering, gains, -np.inf)))
+            start = time.perf_counter()
+            d = state.factor.ftran(column(A, k))
+            R = ratios(direction[k] * d[:,None])[:,0]
+            t = min(R.min(), ub[k,0] - lb[k,0])
+            stats.ratio_test_time += time.perf_counter() - start
+            if np.isinf(t):
+                raise UnboundedLinearProgram('This LP is unbounded')
         # Update
-        x[k] = t
-        x[B,:] = x[B,:] - t*(d[:,B].transpose())
+        step = direction[k] * t
+        stats.iterations += 1
+        x[k] = x[k] + step
+        x[header,0] = x[header,0] - step*d
+        if R.min() > t:
+            # Bound flip; the basis does not change
+            x[k] = ub[k] if step > 0 else lb[k]
+            state.move = (k, k, float(step))
+            stats.bound_flips += 1
+            current_value = float(np.dot(c.transpose(), x))
+            return BFS(x=x, B=B, obj_val=current_value, optimal=False)
+        ties = np.flatnonzero(R == t)
+        p = ties[np.argmin(header[ties])]
+        r = int(header[p])
+        x[r] = lb[r] if direction[k]*d[p] > 0 else ub[r]
+        state.move = (k, r, float(step))
+        stats.pivots += 1
+        stats.degenerate_pivots += int(t <= feas_tol)
+        if weighted:
+            state.update_weights(A, p, k, d)
+        else:
+            state.weight_rule = None  # weights (if any) are now stale
+        state.pivot(p, k, d)
         B.append(k)
         B.remove(r)
-        N.append(r)
-        N.remove(k)
         current_value = float(np.dot(c.transpose(), x))
         return BFS(x=x, B=B, obj_val=current_value, optimal=False)
 
 
+def _dual_simplex_iteration(lp: LP,
+                            bfs: BFS,
+                            feas_tol: float = 1e-7,
+                            state: _SimplexState = None
+                            ) -> BFS:
+    """Execute a single iteration of the dual simplex method.
+
+    The basis of bfs must be dual feasible (reduced costs are at most feas_tol
+    for nonbasic variables at their lower bounds and at least -feas_tol for
+    nonbasic variables at their upper bounds) but its basic solution x may be
+    primal infeasible. Do one iteration of the dual simplex method: the basic
+    variable with the largest bound violation leaves (minimum index to tie
+    break) at the violated bound and the nonbasic variable minimizing
+    |reduced cost / pivot row entry| over pivot row entries which move the
+    leaving variable towards that bound enters (minimum index to tie break).
+    If a simplex state is given, its basis factorization is used and updated
+    after the pivot.
+
+    Args:
+        lp (LP): LP on which the dual simplex iteration is being done.
+        bfs (BFS): Dual feasible basic solution.
+        feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        state (_SimplexState): Basis factorization and workspace.
+
+    Returns:
+        BFS: Basic solution after pivot. Optimal iff it is primal feasible.
+
+    Raises:
+        ValueError: x should have shape (n+m,1) but was ().
+        Infeasible: The LP is found to not have a feasible solution.
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    x,B = bfs.x, bfs.B
+    if not x.shape == (n, 1):
+        raise ValueError('x should have shape (%d,1) but was %s'
+                         % (n, str(x.shape)))
+
+    B.sort()
+    if state is None or not state.matches(B):
+        state = _SimplexState(A, B)
+    header = state.header
+
+    # Leaving variable: basic variable with the largest bound violation
+    x_B = x[header,0]
+    below = lb[header,0] - x_B
+    violation = np.maximum(below, x_B - ub[header,0])
+    pos = np.flatnonzero(violation > feas_tol)
+    if len(pos) == 0:
+        current_value = float(np.matmul(c.transpose(), x))
+        return BFS(x=x, B=B, obj_val=current_value, optimal=True)
+    ties = pos[violation[pos] == violation[pos].max()]
+    p = ties[np.argmin(header[ties])]
+    r = int(header[p])
+    bound = lb[r,0] if below[p] > 0 else ub[r,0]
+
+    # Pivot row of A_B^(-1)A and reduced costs
+    stats = state.stats
+    start = time.perf_counter()
+    e_p = np.zeros(m)
+    e_p[p] = 1
+    alpha = A.transpose() @ state.factor.btran(e_p)
+    red_costs = state.price(A, c)
+    stats.pricing_time += time.perf_counter() - start
+    start = time.perf_counter()
+    # x_r moves towards its bound iff sign * alpha_j * (direction of x_j) < 0
+    sign = 1 if below[p] > 0 else -1
+    direction = np.where((x[:,0] >= ub[:,0]) & ~state.is_basic, -1, 1)
+    entering = np.less(sign * alpha * direction, -feas_tol,
+                       out=state.eligible)
+    entering[header] = False
+    entering &= lb[:,0] < ub[:,0]
+    if not entering.any():
+        stats.ratio_test_time += time.perf_counter() - start
+        raise Infeasible('The LP has no feasible solutions.')
+    ratios = np.full(n, np.inf)
+    ratios[entering] = np.abs(red_costs[entering] / alpha[entering])
+    k = int(np.argmin(ratios))
+    stats.ratio_test_time += time.perf_counter() - start
+
+    # Update
+    d = state.factor.ftran(column(A, k))
+    t = (x[r,0] - bound) / d[p]
+    x[k] = x[k] + t
+    x[header,0] = x[header,0] - t*d
+    x[r] = bound
+    state.move = (k, r, float(t))
+    stats.iterations += 1
+    stats.pivots += 1
+    stats.degenerate_pivots += int(ratios[k] <= feas_tol)
+    state.pivot(p, k, d)
+    B.append(k)
+    B.remove(r)
+    current_value = float(np.dot(c.transpose(), x))
+    return BFS(x=x, B=B, obj_val=current_value, optimal=False)
+
+
+def _basic_solution(lp: LP, B: List[int], feas_tol: float = 1e-7) -> BFS:
+    """Return the (possibly infeasible) basic solution for the basis B.
+
+    Nonbasic variables with a finite upper bound and a positive reduced cost
+    are at their upper bounds. Other nonbasic variables are at their lower
+    bounds. Hence, the basic solution is dual feasible iff B is.
+
+    Args:
+        lp (LP): LP for which the basic solution is computed.
+        B (List[int]): A list of indices in {0..(n+m-1)} forming a basis.
+        feas_tol (float): Dual feasibility tolerance (1e-7 default).
+
+    Returns:
+        BFS: Basic solution corresponding to the basis B.
+
+    Raises:
+        InvalidBasis: B
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    B = sorted(B)
+    if len(B) != m or len(set(B)) != m or B[0] < 0 or B[-1] >= n:
+        raise InvalidBasis(B)
+    try:
+        factor = BasisFactor(A, B)
+    except LinAlgError:
+        raise InvalidBasis(B)
+    x = np.copy(lb)
+    if np.isfinite(ub).any():
+        red_costs = c - A.transpose() @ factor.btran(c[B,:])
+        at_upper = np.isfinite(ub) & (red_costs > feas_tol)
+        x[at_upper] = ub[at_upper]
+    x[B,:] = 0
+    x[B,:] = factor.ftran(b - A @ x)
+    return BFS(x=x, B=B, obj_val=float(np.dot(c.transpose(), x)),
+               optimal=False)
+
+
+def _dual_feasible(lp: LP, B: List[int], feas_tol: float = 1e-7) -> bool:
+    """Return true if all reduced costs for the basis B are at most feas_tol.
+
+    Reduced costs of variables with a finite upper bound are not restricted
+    since those variables can be nonbasic at their upper bounds.
+
+    Args:
+        lp (LP): LP for which dual feasibility is checked.
+        B (List[int]): A valid basis for this LP.
+        feas_tol (float): Dual feasibility tolerance (1e-7 default).
+
+    Returns:
+        bool: True if the basis B is dual feasible. False otherwise.
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    y = BasisFactor(A, B).btran(c[B,:])
+    red_costs = c - A.transpose() @ y
+    return bool(np.all((red_costs <= feas_tol) | np.isfinite(ub)))
+
+
+def _equality_form_solution(lp: LP,
+                            x: Union[np.ndarray, List, Tuple]) -> np.ndarray:
+    """Return the solution x in standard equality form.
+
+    If lp is in standard inequality form and x only provides the decision
+    variables, the slack variables are computed.
+
+    Raises:
+        ValueError: Initial solution should have one of the following shapes.
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    x = _vectorize(x).astype(float)
+    # Compute slack variables if only decision variables provided.
+    if not lp.equality and x.shape == (lp.n, 1):
+        slacks = b - lp.A @ x
+        x = np.vstack((x, slacks))
+
+    if lp.equality:
+        return _validate(x, n, 'Initial solution')
+    else:
+        return _validate(x, [lp.n, n], 'Initial solution')
+
+
 def _initial_solution(lp: LP,
                       x: Union[np.ndarray, List, Tuple] = None,
-                      feas_tol: float = 1e-7
+                      feas_tol: float = 1e-7,
+                      stats: Stats = None,
+                      limits: '_Limits' = None
                       ) -> BFS:
     """Return an initial basic feasible solution for the linear program.
 
@@ -497,28 +1313,24 @@ def _initial_solution(lp: LP,
         lp (LP): LP for which a basic feasible soluiton is given.
         x (Union[np.ndarray, List, Tuple]): Proposed inital solution.
         feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        stats (Stats): Statistics to which phase I is added (if given).
+        limits (_Limits): Cancellation and time limit of phase I.
 
     Returns:
         BFS: Initial basic feasible solution.
     """
-    n,m,A,b,c = lp.get_coefficients()
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
 
     if x is not None:
-        x = _vectorize(x).astype(float)
-        # Compute slack variables if only decision variables provided.
-        if not lp.equality and x.shape == (lp.n, 1):
-            slacks = b - np.matmul(lp.A, x)
-            x = np.vstack((x, slacks))
-
-        if lp.equality:
-            x = _validate(x, n, 'Initial solution')
-        else:
-            x = _validate(x, [lp.n, n], 'Initial solution')
-
-        if (np.allclose(np.dot(A,x), b, atol=feas_tol)
-                and all(x >= np.zeros((n,1)) - feas_tol)
-                and len(np.nonzero(x)[0]) <= m):
-            B = list(np.nonzero(x)[0])
+        x = _equality_form_solution(lp, x)
+        # Variables strictly between their bounds must be basic
+        between = (x != lb) & (x != ub)
+        if (np.allclose(A @ x, b, atol=feas_tol)
+                and all(x >= lb - feas_tol)
+                and all(x <= ub + feas_tol)
+                and len(np.nonzero(between)[0]) <= m):
+            B = list(np.nonzero(between)[0])
             N = list(set(range(lp.n+lp.m)) - set(B))
             while len(B) < m:  # if initial solution is degenerate
                 B.append(N.pop())
@@ -528,17 +1340,478 @@ def _initial_solution(lp: LP,
         else:
             warnings.warn("Provided initial solution was not a basic feasible "
                           "solution; ignored.", UserWarning)
-            return _phase_one(lp)
+    stats = Stats() if stats is None else stats
+    start = time.perf_counter()
+    try:
+        return _phase_one(lp, stats=stats, limits=limits)
+    finally:
+        stats.phase_one_time += time.perf_counter() - start
+
+
+def _independent_columns(A: Union[np.ndarray, sparse.spmatrix],
+                         order: np.ndarray,
+                         tol: float = 1e-8) -> List[int]:
+    """Return a maximal set of linearly independent columns of A.
+
+    Columns are considered in blocks of m in the given order. The columns of
+    a block are projected onto the orthogonal complement of the kept columns
+    and a QR factorization with column pivoting keeps those whose projection
+    is not negligible (relative to their norm).
+
+    Args:
+        A (Union[np.ndarray, sparse.spmatrix]): An m*n matrix.
+        order (np.ndarray): Order in which the columns are considered.
+        tol (float): Relative tolerance for a negligible projection.
+
+    Returns:
+        List[int]: Indices of the kept columns (at most m of them).
+    """
+    m = A.shape[0]
+    Q = np.zeros((m, 0))
+    kept = []
+    for start in range(0, len(order), m):
+        J = np.asarray(order[start:start + m])
+        C = columns(A, J)
+        norms = np.linalg.norm(C, axis=0)
+        for _ in range(2):  # reorthogonalization
+            C = C - Q @ (Q.transpose() @ C)
+        Q_J, R, piv = qr(C, mode='economic', pivoting=True)
+        diag = np.abs(np.diag(R))
+        k = 0
+        while (k < len(diag) and len(kept) + k < m
+               and diag[k] > tol * max(norms[piv[k]], 1e-300)):
+            k += 1
+        Q = np.hstack((Q, Q_J[:,:k]))
+        kept += [int(j) for j in J[piv[:k]]]
+        if len(kept) == m:
+            break
+    return kept
+
+
+def _crossover(lp: LP, x: np.ndarray, feas_tol: float = 1e-7) -> BFS:
+    """Return a basic feasible solution obtained from the feasible point x.
+
+    Variables within feas_tol of a bound are moved to it. A basis is chosen
+    greedily among the columns in decreasing order of the distance of their
+    variable to its nearest bound. Every nonbasic variable strictly between
+    its bounds (superbasic) is then pushed to one of its bounds in a direction
+    which does not decrease the objective. If a basic variable reaches its
+    bound first, it leaves the basis and the superbasic variable enters.
+    Hence, the objective value of the basic feasible solution is (up to
+    feas_tol) at least c^Tx.
+
+    Args:
+        lp (LP): LP for which a basic feasible solution is found.
+        x (np.ndarray): Feasible (interior point) solution of the LP.
+        feas_tol (float): Primal feasibility tolerance (1e-7 default).
+
+    Returns:
+        BFS: Basic feasible solution.
+
+    Raises:
+        InvalidBasis: No basis is found (A does not have full row rank).
+        UnboundedLinearProgram: The LP is unbounded.
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    x = np.clip(np.array(x, dtype=float), lb, ub)
+    tol = feas_tol * np.maximum(1, np.abs(x))
+    x = np.where(x - lb <= tol, lb, x)
+    x = np.where(ub - x <= tol, ub, x)
+
+    distance = np.minimum(x - lb, ub - x)[:,0]
+    B = _independent_columns(A, np.argsort(-distance, kind='stable'))
+    if len(B) < m:
+        raise InvalidBasis(B)
+    state = _SimplexState(A, B)
+    header = state.header
+
+    def update_basic():
+        """Solve A_B x_B = b - A_N x_N for the basic variables."""
+        x[header,:] = 0
+        x[header,0] = state.factor.ftran((b - A @ x)[:,0])
+
+    update_basic()
+    superbasic = np.flatnonzero(~state.is_basic & (x[:,0] > lb[:,0])
+                                & (x[:,0] < ub[:,0]))
+    for j in superbasic:
+        rc = state.price(A, c)[j]
+        nearer_ub = ub[j,0] - x[j,0] < x[j,0] - lb[j,0]
+        up = rc > feas_tol or (rc >= -feas_tol and nearer_ub)
+        direction = 1 if up else -1
+        d = state.factor.ftran(column(A, j))
+        x_B, lb_B, ub_B = x[header,0], lb[header,0], ub[header,0]
+        while True:
+            # Ratio test: x_B changes by -t * direction * d
+            D = direction * d
+            R = np.full(m, np.inf)
+            np.divide(x_B - lb_B, D, out=R, where=D > feas_tol)
+            np.divide(ub_B - x_B, -D, out=R,
+                      where=(D < -feas_tol) & np.isfinite(ub_B))
+            R = np.maximum(R, 0)
+            t_j = ub[j,0] - x[j,0] if direction > 0 else x[j,0] - lb[j,0]
+            if np.isfinite(min(R.min(), t_j)):
+                break
+            if rc > feas_tol:
+                raise UnboundedLinearProgram('This LP is unbounded')
+            direction = -1  # lower bounds are finite
+        t = min(R.min(), t_j)
+        x[j] = x[j] + direction * t
+        x[header,0] = x_B - t * D
+        if R.min() < t_j:
+            p = int(np.argmin(R))
+            r = int(header[p])
+            x[r] = lb[r] if D[p] > 0 else ub[r]
+            state.pivot(p, int(j), d)
+        else:
+            x[j] = ub[j] if direction > 0 else lb[j]
+    update_basic()
+    B = sorted(int(j) for j in header)
+    return BFS(x=x, B=B, obj_val=float(np.dot(c.transpose(), x)),
+               optimal=False)
+
+
+def _sensitivity(lp: LP,
+                 x: np.ndarray,
+                 factor: BasisFactor,
+                 feas_tol: float = 1e-7) -> Sensitivity:
+    """Return the sensitivity analysis of the optimal basic solution x.
+
+    The shadow prices, reduced costs, and ranges are computed with the
+    factorization of the optimal basis A_B. The columns of A_B^{-1} are
+    obtained from one FTRAN of the identity: column i is the change of x_B
+    per unit increase of b_i and row p gives row p of the tableau A_B^{-1}A.
+    Changing c_j of a nonbasic variable j only changes its own reduced cost
+    while changing c_j of the basic variable in position p changes the
+    reduced cost of every nonbasic variable k by -alpha_pk.
+
+    Args:
+        lp (LP): LP for which the sensitivity analysis is computed.
+        x (np.ndarray): Optimal basic feasible solution of the LP.
+        factor (BasisFactor): Factorization of the optimal basis.
+        feas_tol (float): Primal feasibility tolerance (1e-7 default).
+
+    Returns:
+        Sensitivity: Sensitivity analysis of the optimal basis.
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    lb, ub, x = lb[:,0], ub[:,0], x[:,0]
+    header = factor.basis
+    y = factor.btran(c[header,0])
+    red_costs = c[:,0] - A.transpose() @ y
+    red_costs[header] = 0
+    B_inv = factor.ftran(np.identity(m))
+
+    is_basic = np.zeros(n, dtype=bool)
+    is_basic[header] = True
+    movable = ~is_basic & (lb < ub)
+    at_upper = movable & (x >= ub)
+    at_lower = movable & ~at_upper
+
+    obj_range = np.tile([-np.inf, np.inf], (n,1))
+    obj_range[at_lower,1] = c[at_lower,0] - red_costs[at_lower]
+    obj_range[at_upper,0] = c[at_upper,0] - red_costs[at_upper]
+    if m > 0:
+        # alpha[k,p] is the entry of row p of the tableau in column k
+        alpha = A.transpose() @ B_inv.transpose()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            R = red_costs[:,None] / alpha
+        up, down = alpha > feas_tol, alpha < -feas_tol
+        lower = (at_lower[:,None] & up) | (at_upper[:,None] & down)
+        upper = (at_lower[:,None] & down) | (at_upper[:,None] & up)
+        obj_range[header,0] = c[header,0] + np.where(lower, R, -np.inf).max(0)
+        obj_range[header,1] = c[header,0] + np.where(upper, R, np.inf).min(0)
+
+        x_B = x[header,None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            to_lb = (lb[header,None] - x_B) / B_inv
+            to_ub = (ub[header,None] - x_B) / B_inv
+        up, down = B_inv > feas_tol, B_inv < -feas_tol
+        low = np.where(up, to_lb, np.where(down, to_ub, -np.inf)).max(0)
+        high = np.where(up, to_ub, np.where(down, to_lb, np.inf)).min(0)
+        rhs_range = np.column_stack((b[:,0] + np.minimum(low, 0),
+                                     b[:,0] + np.maximum(high, 0)))
     else:
-        return _phase_one(lp)
+        rhs_range = np.zeros((0,2))
+
+    return Sensitivity(y=y.reshape(-1,1),
+                       red_costs=red_costs.reshape(-1,1),
+                       obj_range=obj_range,
+                       rhs_range=rhs_range)
+
+
+class SimplexPath(Sequence):
+    """Path of simplex stored as its first iterate and a list of pivots.
+
+    Every pivot is recorded as the entering variable, the leaving variable
+    (the entering variable itself for a bound flip), and the signed step of
+    the entering variable. Iterates are rebuilt on demand by replaying the
+    pivots with a basis factorization: x_B decreases by step * A_B^{-1}a_k,
+    x_k increases by step, and the leaving variable is set to its nearest
+    bound. The most recently rebuilt iterate is kept so that accessing the
+    path in order replays every pivot only once. The path can be indexed and
+    iterated like a list of BFS.
+
+    Attributes:
+        lp (LP): LP on which simplex was run.
+        pivots (List[Tuple[int, int, float]]): Entering variable, leaving
+            variable, and step of every pivot.
+    """
+
+    def __init__(self, lp: LP, bfs: BFS, transform: Callable = None):
+        """Initialize a path starting at the given BFS.
+
+        Args:
+            lp (LP): LP on which simplex was run.
+            bfs (BFS): First iterate of the path.
+            transform (Callable): Function applied to every rebuilt BFS.
+        """
+        self.lp = lp
+        self.pivots = []
+        self._x = np.array(bfs.x, dtype=float)
+        self._B = sorted(bfs.B)
+        self._length = 0
+        self._transform = transform
+        self._cursor = None
+
+    def record(self, move: Tuple[int, int, float] = None):
+        """Append the iterate reached by the given move (None for the first
+        iterate) to the path."""
+        if move is not None:
+            self.pivots.append(move)
+        self._length += 1
+
+    def map(self, transform: Callable) -> 'SimplexPath':
+        """Return this path with transform applied to every rebuilt BFS."""
+        path = SimplexPath.__new__(SimplexPath)
+        path.__dict__.update(self.__dict__)
+        if self._transform is None:
+            path._transform = transform
+        else:
+            path._transform = lambda bfs: transform(self._transform(bfs))
+        path._cursor = None
+        return path
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> BFS:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError('Path index out of range.')
+        n,m,A,b,c = self.lp.get_coefficients(copy=False)
+        if self._cursor is None or self._cursor[0] > i:
+            self._cursor = [0, np.copy(self._x), BasisFactor(A, self._B)]
+        self._advance(i)
+        x, factor = self._cursor[1:]
+        bfs = BFS(x=np.copy(x), B=sorted(int(k) for k in factor.basis),
+                  obj_val=float(np.dot(c.transpose(), x)),
+                  optimal=False)
+        if self._transform is not None:
+            bfs = self._transform(bfs)
+        return bfs
+
+    def _advance(self, i: int):
+        """Replay pivots until the cursor reaches iterate i."""
+        n,m,A,b,c = self.lp.get_coefficients(copy=False)
+        lb,ub = self.lp.get_bounds(copy=False)
+        j, x, factor = self._cursor
+        for k, r, step in self.pivots[j:i]:
+            header = factor.basis
+            d = factor.ftran(column(A, k))
+            x[k] = x[k] + step
+            x[header,0] = x[header,0] - step*d
+            x[r] = lb[r] if x[r] - lb[r] <= ub[r] - x[r] else ub[r]
+            if r != k:
+                factor.replace(int(np.flatnonzero(header == r)[0]), k, d)
+        self._cursor[0] = i
+
+
+def _map_path(path: Union[List[BFS], SimplexPath], transform: Callable):
+    """Return the path with transform applied to every BFS."""
+    if path is None:
+        return None
+    if isinstance(path, SimplexPath):
+        return path.map(transform)
+    return [transform(bfs) for bfs in path]
+
+
+class _Interrupted(Exception):
+    """Raised when a solve is cancelled or runs out of time in phase I."""
+    pass
+
+
+class _Limits:
+    """Termination criteria of the simplex method and branch and bound.
+
+    Attributes:
+        iteration_limit (int): Maximum number of iterations (None if none).
+        deadline (float): Time (perf_counter) after which to stop (or None).
+        target (float): Objective value of a feasible solution to stop at.
+        cutoff (float): Stop once the optimal value is at most cutoff.
+        cancel (threading.Event): Stop once this event is set.
+    """
+
+    def __init__(self,
+                 iteration_limit: int = None,
+                 time_limit: float = None,
+                 target: float = None,
+                 cutoff: float = None,
+                 cancel: threading.Event = None):
+        self.iteration_limit = iteration_limit
+        self.deadline = None
+        if time_limit is not None:
+            self.deadline = time.perf_counter() + time_limit
+        self.target = target
+        self.cutoff = cutoff
+        self.cancel = cancel
+
+    def remaining(self) -> float:
+        """Return the number of seconds left (None if there is no limit)."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.perf_counter(), 0)
+
+    def interrupted(self) -> str:
+        """Return 'cancelled' or 'time_limit' if the solve must stop now."""
+        if self.cancel is not None and self.cancel.is_set():
+            return 'cancelled'
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return 'time_limit'
+        return None
+
+    def status(self, bfs: BFS, iterations: int, method: str) -> str:
+        """Return the termination status before the next iteration from bfs
+        (None if simplex continues).
+
+        The iterates of the primal method are feasible, so the target is
+        reached once the objective value is at least the target. The
+        objective value of an iterate of the dual method is an upper bound
+        on the optimal value, so the cutoff applies once it is at most the
+        cutoff.
+        """
+        status = self.interrupted()
+        if status is not None:
+            return status
+        if (self.iteration_limit is not None
+                and iterations >= self.iteration_limit):
+            return 'iteration_limit'
+        if method == 'primal':
+            if self.target is not None and bfs.obj_val >= self.target:
+                return 'target'
+        elif self.cutoff is not None and bfs.obj_val <= self.cutoff:
+            return 'cutoff'
+        return None
+
+
+def _start(lp: LP,
+           initial_solution: Union[np.ndarray, List, Tuple] = None,
+           feas_tol: float = 1e-7,
+           method: str = 'primal',
+           initial_basis: List[int] = None,
+           stats: Stats = None,
+           limits: _Limits = None) -> Tuple[BFS, str]:
+    """Return the first iterate of the given simplex method and the method
+    (primal or dual) used to continue from it.
+
+    See simplex() for the use of the initial solution and initial basis by
+    each method and the fallback to the primal simplex method. Phase I (if
+    needed) is added to the given statistics and stops (raising _Interrupted)
+    when the given limits interrupt it.
+    """
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    lb,ub = lp.get_bounds(copy=False)
+    if method == 'dual' and initial_basis is None and not lp.equality:
+        initial_basis = list(range(lp.n, n))  # slack basis
+    bfs = None
+    if method == 'ipm':
+        if initial_solution is not None or initial_basis is not None:
+            warnings.warn("The interior point method does not use an initial "
+                          "solution or basis; ignored.", UserWarning)
+            initial_solution, initial_basis = None, None
+        sol = _ipm.ipm(A, b, c, lb, ub)
+        if sol.converged:
+            try:
+                bfs = _crossover(lp, sol.x, feas_tol)
+            except (InvalidBasis, LinAlgError):
+                pass
+        if bfs is None:
+            warnings.warn("The interior point method did not find an optimal "
+                          "solution; using the primal simplex method.",
+                          UserWarning)
+        method = 'primal'
+    elif method == 'dual':
+        B = initial_basis
+        try:
+            if B is not None and _dual_feasible(lp, sorted(B), feas_tol):
+                bfs = _basic_solution(lp, B, feas_tol)
+        except (InvalidBasis, LinAlgError):
+            pass
+        if bfs is None:
+            warnings.warn("No dual feasible basis available; using the primal "
+                          "simplex method.", UserWarning)
+            method = 'primal'
+    elif initial_basis is not None and initial_solution is None:
+        try:
+            bfs = lp.get_basic_feasible_sol(sorted(initial_basis), feas_tol)
+        except (InvalidBasis, InfeasibleBasicSolution):
+            warnings.warn("Provided initial basis was not a feasible basis; "
+                          "ignored.", UserWarning)
+    if bfs is None:
+        bfs = _initial_solution(lp=lp, x=initial_solution, feas_tol=feas_tol,
+                                stats=stats, limits=limits)
+    return bfs, method
+
+
+def _iteration(lp: LP,
+               bfs: BFS,
+               method: str,
+               pivot_rule: str,
+               feas_tol: float,
+               pricing: str,
+               state: _SimplexState) -> BFS:
+    """Execute a single iteration of the primal or dual simplex method."""
+    if method == 'dual':
+        return _dual_simplex_iteration(lp=lp,
+                                       bfs=bfs,
+                                       feas_tol=feas_tol,
+                                       state=state)
+    return _simplex_iteration(lp=lp,
+                              bfs=bfs,
+                              pivot_rule=pivot_rule,
+                              feas_tol=feas_tol,
+                              pricing=pricing,
+                              state=state)
+
+
+def _map_callback(callback: Callable, transform: Callable) -> Callable:
+    """Return the callback applied to transformed iterates (None if None)."""
+    if callback is None:
+        return None
+    return lambda bfs, stats: callback(transform(bfs), stats)
 
 
 def simplex(lp: LP,
             pivot_rule: str = 'bland',
             initial_solution: Union[np.ndarray, List, Tuple] = None,
             iteration_limit: int = None,
-            feas_tol: float = 1e-7
-            ) -> Tuple[np.ndarray, List[int], float, bool, List[BFS]]:
+            feas_tol: float = 1e-7,
+            method: str = 'primal',
+            initial_basis: List[int] = None,
+            pricing: str = 'full',
+            presolve: bool = False,
+            scaling: str = None,
+            sensitivity: bool = False,
+            path_mode: str = 'full',
+            callback: Callable[[BFS, Stats], None] = None,
+            time_limit: float = None,
+            target: float = None,
+            cutoff: float = None,
+            cancel: threading.Event = None
+            ) -> Tuple[np.ndarray, List[int], float, bool, List[BFS], int,
+                       Sensitivity, Stats, str]:
     """Execute the revised simplex method on the given LP.
 
     Execute the revised simplex method on the given LP using the specified
@@ -548,6 +1821,96 @@ def simplex(lp: LP,
     and indicate the solution may not be optimal. Use a primal feasibility
     tolerance of feas_tol (with default vlaue of 1e-7).
 
+    METHODS
+
+        - 'primal': revised (primal) simplex method starting from a basic
+          feasible solution (initial_solution, initial_basis, or Phase I).
+        - 'dual': dual simplex method starting from a dual feasible basis
+          (initial_basis or, for inequality LPs, the slack basis). This is
+          the method of choice to re-optimize from an optimal basis after the
+          RHS b has changed. The pivot rule is ignored. If no dual feasible
+          basis is available, warn the user and use the primal method.
+        - 'ipm': primal-dual interior point method (Mehrotra's predictor-
+          corrector) followed by a crossover to a basic feasible solution
+          and primal simplex pivots until an optimal basis is found. Suited
+          to large LPs. The initial solution and initial basis are ignored.
+          If the interior point method does not converge (e.g. the LP is
+          infeasible or unbounded), warn the user and use the primal method.
+
+    PRICING
+
+        - 'full': compute the reduced costs of all columns every iteration.
+        - 'partial': compute the reduced costs of a rotating block of columns
+          and of a short list of attractive candidates kept from previous
+          iterations (partial and multiple pricing). Cheaper per iteration on
+          wide LPs (many more columns than rows); primal method only.
+
+    PRESOLVE
+
+    If presolve is True, the LP (in standard equality form) is reduced before
+    any pivoting: empty and singleton rows, fixed and dominated columns,
+    duplicate and linearly dependent rows are removed and implied bounds are
+    tightened. The reduced LP is solved and the solution, basis, and path are
+    mapped back to the original LP (postsolve). The initial solution and
+    initial basis are mapped to the reduced LP. Presolve is not applied to
+    LPs with variable bounds other than [0, inf).
+
+    SCALING
+
+        - None: solve the LP as given (default).
+        - 'geometric': geometric mean scaling of the rows and columns of A
+          followed by equilibration.
+        - 'equilibrate': scale the largest magnitude in every row and column
+          of A to one.
+
+    The scaled LP is solved and the solution and path are unscaled before
+    they are returned, so the tolerances apply to the scaled coefficients.
+    Scaling is applied after presolve.
+
+    SENSITIVITY
+
+    If sensitivity is True and an optimal solution is found, the shadow
+    prices, reduced costs, and objective function and RHS ranges of the
+    optimal basis are returned. They are computed from the factorization of
+    the optimal basis held by the simplex method; no inverse is computed.
+    With presolve, the postsolved optimal basis is factorized once. All of
+    them are given for the LP in standard equality form.
+
+    PATH MODES
+
+        - 'full': record a copy of every iterate as a BFS (default).
+        - 'compact': record only the pivots (entering variable, leaving
+          variable, and step). The returned SimplexPath rebuilds the
+          iterates when they are accessed.
+        - 'none': do not record the path (path is None).
+
+    CALLBACK
+
+    If a callback is given, it is called as callback(bfs, stats) after every
+    iteration which does not end the method: bfs is the new iterate and
+    stats are the statistics so far. The BFS is updated in place by the next
+    iteration; copy it to keep it. With presolve or scaling, the callback
+    gets the iterate mapped back to the given LP. The statistics of the run
+    (pivots, degenerate pivots, linear solves, and the time spent in pricing,
+    ratio tests, and phase I) are returned.
+
+    LIMITS
+
+    Before every iteration, simplex stops if the cancel event is set (by any
+    thread), the time limit (in seconds) has passed, or the iteration limit
+    is reached. The primal method also stops once the objective value of the
+    current (feasible) iterate is at least the target. The dual method also
+    stops once the objective value of the current iterate, an upper bound on
+    the optimal value, is at most the cutoff. Cancellation and the time
+    limit are also checked every pivot of phase I. The current iterate is
+    returned (it is primal infeasible if the dual method stopped early and x
+    is None if phase I did not finish) with the termination status:
+
+        - 'optimal': x is optimal.
+        - 'iteration_limit', 'time_limit', or 'cancelled': a limit was hit.
+        - 'target': x is feasible with objective value at least the target.
+        - 'cutoff': the optimal value is at most the cutoff.
+
     PIVOT RULES
 
     Entering variable:
@@ -555,6 +1918,8 @@ def simplex(lp: LP,
         - 'bland' or 'min_index': minimum index
         - 'dantzig' or 'max_reduced_cost': most positive reduced cost
         - 'greatest_ascent': most positive (minimum ratio) x (reduced cost)
+        - 'steepest_edge': most positive (reduced cost) / ||edge direction||
+        - 'devex': most positive (reduced cost) / (approximate edge norm)
         - 'manual' or 'manual_select': user selects possible entering index
 
     Leaving variable:
@@ -567,6 +1932,18 @@ def simplex(lp: LP,
         initial_solution (Union[np.ndarray, List, Tuple]): Initial bfs.
         iteration_limit (int): Simplex iteration limit. None by default.
         feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        method (str): Simplex method to be used. 'primal' by default.
+        initial_basis (List[int]): Initial basis. None by default.
+        pricing (str): Pricing ('full' or 'partial'). 'full' by default.
+        presolve (bool): True if the LP is presolved. False by default.
+        scaling (str): Scaling of rows and columns. None by default.
+        sensitivity (bool): True if a sensitivity analysis is returned.
+        path_mode (str): Recording of the path. 'full' by default.
+        callback (Callable[[BFS, Stats], None]): Called after each iteration.
+        time_limit (float): Time limit in seconds. None by default.
+        target (float): Target objective value. None by default.
+        cutoff (float): Objective cutoff value. None by default.
+        cancel (threading.Event): Event cancelling simplex. None by default.
 
     Return:
         Tuple:
@@ -575,18 +1952,182 @@ def simplex(lp: LP,
         - B (List[int]): Corresponding bases of the current best BFS.
         - obj_val (float): The current objective value.
         - optimal (bool): True if x is optimal. False otherwise.
-        - path (List[BFS]): Path of simplex.
+        - path (Union[List[BFS], SimplexPath]): Path of simplex.
+
+        The tuple also has the following attributes (which are not unpacked):
+
+        - priced (int): Number of reduced costs (columns) priced.
+        - sensitivity (Sensitivity): Sensitivity analysis (None if not
+          requested or not optimal).
+        - stats (Stats): Statistics of the run.
+        - status (str): Termination status.
 
     Raises:
         ValueError: Iteration limit must be strictly positive.
+        ValueError: Time limit must be non-negative.
+        ValueError: Invalid method. Select from (list).
+        ValueError: Invalid scaling. Select from (list).
+        ValueError: Invalid path mode. Select from (list).
         ValueError: initial_solution should have shape (n,1) but was ().
     """
     if iteration_limit is not None and iteration_limit <= 0:
         raise ValueError('Iteration limit must be strictly positive.')
-
-    n,m,A,b,c = lp.get_coefficients()
-    bfs = _initial_solution(lp=lp, x=initial_solution, feas_tol=feas_tol)
-    path = []
+    if time_limit is not None and time_limit < 0:
+        raise ValueError('Time limit must be non-negative.')
+    methods = ['primal', 'dual', 'ipm']
+    if method not in methods:
+        raise ValueError('Invalid method. Select from ' + str(methods))
+    if scaling is not None and scaling not in _scaling.SCALINGS:
+        raise ValueError('Invalid scaling. Select from '
+                         + str(_scaling.SCALINGS))
+    path_modes = ['full', 'compact', 'none']
+    if path_mode not in path_modes:
+        raise ValueError('Invalid path mode. Select from ' + str(path_modes))
+    start = time.perf_counter()
+    limits = _Limits(iteration_limit, time_limit, target, cutoff, cancel)
+
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    if method == 'dual' and initial_basis is None and not lp.equality:
+        initial_basis = list(range(lp.n, n))  # slack basis
+
+    if presolve and lp.is_bounded():
+        warnings.warn("Presolve does not support variable bounds; ignored.",
+                      UserWarning)
+        presolve = False
+
+    if presolve:
+        try:
+            pre = _presolve.presolve(_explicit(A), b, c, feas_tol)
+        except _presolve.PresolveInfeasible as e:
+            raise Infeasible('The LP has no feasible solutions. ' + str(e))
+        position = np.full(n, -1)
+        position[pre.cols] = np.arange(len(pre.cols))
+
+        def postsolve(bfs):
+            x, B = _presolve.postsolve(pre, bfs.x, bfs.B)
+            return BFS(x=x, B=B, obj_val=float(np.dot(c.transpose(), x)),
+                       optimal=bfs.optimal)
+
+        if len(pre.rows) == 0:
+            # Every constraint was removed; remaining variables are free of
+            # constraints and must be zero (or the LP is unbounded).
+            if np.any(pre.c > feas_tol):
+                raise UnboundedLinearProgram('This LP is unbounded')
+            bfs = postsolve(BFS(x=np.zeros((len(pre.cols),1)), B=[],
+                                obj_val=0, optimal=True))
+            analysis = None
+            if sensitivity:
+                analysis = _sensitivity(lp, bfs.x, BasisFactor(A, bfs.B),
+                                        feas_tol)
+            path = {'full': [bfs], 'none': None}.get(path_mode)
+            if path_mode == 'compact':
+                path = SimplexPath(lp, bfs)
+                path.record()
+            stats = Stats()
+            stats.time = time.perf_counter() - start
+            return _Simplex(x=bfs.x, B=bfs.B, obj_val=bfs.obj_val,
+                            optimal=True, path=path, priced=0,
+                            sensitivity=analysis, stats=stats,
+                            status='optimal')
+
+        x_red = None
+        if initial_solution is not None:
+            x_0 = _equality_form_solution(lp, initial_solution)
+            removed = np.flatnonzero(position < 0)
+            if np.allclose(x_0[removed], pre.x[removed], atol=feas_tol):
+                x_red = x_0[pre.cols]
+            else:
+                warnings.warn("Provided initial solution was not a basic "
+                              "feasible solution; ignored.", UserWarning)
+        B_red = None
+        if initial_basis is not None:
+            B_red = [int(position[j]) for j in initial_basis
+                     if position[j] >= 0]
+        # Objective value of the removed variables
+        offset = float(np.dot(c.transpose(), pre.x))
+        sol = simplex(lp=LP(pre.A, pre.b, pre.c, equality=True),
+                      pivot_rule=pivot_rule,
+                      initial_solution=x_red,
+                      iteration_limit=iteration_limit,
+                      feas_tol=feas_tol,
+                      method=method,
+                      initial_basis=B_red,
+                      pricing=pricing,
+                      scaling=scaling,
+                      path_mode=path_mode,
+                      callback=_map_callback(callback, postsolve),
+                      time_limit=limits.remaining(),
+                      target=None if target is None else target - offset,
+                      cutoff=None if cutoff is None else cutoff - offset,
+                      cancel=cancel)
+        sol.stats.time = time.perf_counter() - start
+        if sol.x is None:
+            return sol
+        bfs = postsolve(sol)
+        analysis = None
+        if sensitivity and sol.optimal:
+            analysis = _sensitivity(lp, bfs.x, BasisFactor(A, bfs.B),
+                                    feas_tol)
+        return sol._replace(x=bfs.x, B=bfs.B, obj_val=bfs.obj_val,
+                            path=_map_path(sol.path, postsolve),
+                            sensitivity=analysis)
+
+    if scaling is not None:
+        scaled = _scaling.scale(_explicit(A), b, c, scaling)
+        lb,ub = lp.get_bounds(copy=False)
+
+        def unscale(bfs):
+            x = _scaling.unscale(scaled, bfs.x)
+            return BFS(x=x, B=bfs.B, obj_val=float(np.dot(c.transpose(), x)),
+                       optimal=bfs.optimal)
+
+        x_scaled = None
+        if initial_solution is not None:
+            x_0 = _equality_form_solution(lp, initial_solution)
+            x_scaled = x_0 / scaled.col
+        sol = simplex(lp=LP(scaled.A, scaled.b, scaled.c, equality=True,
+                            lb=lb / scaled.col, ub=ub / scaled.col),
+                      pivot_rule=pivot_rule,
+                      initial_solution=x_scaled,
+                      iteration_limit=iteration_limit,
+                      feas_tol=feas_tol,
+                      method=method,
+                      initial_basis=initial_basis,
+                      pricing=pricing,
+                      sensitivity=sensitivity,
+                      path_mode=path_mode,
+                      callback=_map_callback(callback, unscale),
+                      time_limit=limits.remaining(),
+                      target=target,
+                      cutoff=cutoff,
+                      cancel=cancel)
+        sol.stats.time = time.perf_counter() - start
+        if sol.x is None:
+            return sol
+        bfs = unscale(sol)
+        analysis = sol.sensitivity
+        if analysis is not None:
+            # y = Ry', d = d'/s, and the ranges of c and b scale by 1/s, 1/r
+            analysis = Sensitivity(
+                y=scaled.row * analysis.y,
+                red_costs=analysis.red_costs / scaled.col,
+                obj_range=analysis.obj_range / scaled.col,
+                rhs_range=analysis.rhs_range / scaled.row)
+        return sol._replace(x=bfs.x, obj_val=bfs.obj_val,
+                            path=_map_path(sol.path, unscale),
+                            sensitivity=analysis)
+
+    stats = Stats()
+    try:
+        bfs, method = _start(lp, initial_solution, feas_tol, method,
+                             initial_basis, stats, limits)
+    except _Interrupted as e:
+        stats.time = time.perf_counter() - start
+        return _Simplex(x=None, B=None, obj_val=None, optimal=False,
+                        path=None if path_mode == 'none' else [], priced=0,
+                        sensitivity=None, stats=stats, status=str(e))
+    path = {'full': [], 'compact': SimplexPath(lp, bfs), 'none': None}
+    path = path[path_mode]
 
     # Print instructions if manual mode is chosen.
     if pivot_rule in ['manual', 'manual_select']:
@@ -596,22 +2137,351 @@ def simplex(lp: LP,
         "for possible variables (also called entering variables) is given.\n"
         print(s)
 
+    # Factorize the initial basis once; it is updated after every pivot.
+    state = _SimplexState(A, sorted(bfs.B), stats)
+
     i = 0  # number of iterations
+    status = None
     while(not bfs.optimal):
-        path.append(BFS(x=np.copy(bfs.x),
-                        B=bfs.B,
-                        obj_val=bfs.obj_val,
-                        optimal=bfs.optimal))
-        bfs = _simplex_iteration(lp=lp,
-                                 bfs=bfs,
-                                 pivot_rule=pivot_rule,
-                                 feas_tol=feas_tol)
-        i = i + 1
-        if iteration_limit is not None and i >= iteration_limit:
+        status = limits.status(bfs, i, method)
+        if status is not None:
             break
+        if path_mode == 'full':
+            path.append(BFS(x=np.copy(bfs.x),
+                            B=sorted(bfs.B),
+                            obj_val=bfs.obj_val,
+                            optimal=bfs.optimal))
+        elif path_mode == 'compact':
+            path.record(state.move)
+        bfs = _iteration(lp, bfs, method, pivot_rule, feas_tol, pricing, state)
+        if callback is not None and not bfs.optimal:
+            callback(bfs, stats)
+        i = i + 1
+    if bfs.optimal:
+        status = 'optimal'
     x, B, obj_val, optimal = bfs
-    Simplex = namedtuple('simplex', ['x', 'B', 'obj_val', 'optimal', 'path'])
-    return Simplex(x=x, B=B, obj_val=obj_val, optimal=optimal, path=path)
+    analysis = None
+    if sensitivity and optimal:
+        analysis = _sensitivity(lp, x, state.factor, feas_tol)
+    stats.solves += state.factor.solves
+    stats.time = time.perf_counter() - start
+    return _Simplex(x=x, B=B, obj_val=obj_val, optimal=optimal, path=path,
+                    priced=state.priced, sensitivity=analysis, stats=stats,
+                    status=status)
+
+
+def simplex_iter(lp: LP,
+                 pivot_rule: str = 'bland',
+                 initial_solution: Union[np.ndarray, List, Tuple] = None,
+                 feas_tol: float = 1e-7,
+                 method: str = 'primal',
+                 initial_basis: List[int] = None,
+                 pricing: str = 'full') -> Iterator[BFS]:
+    """Yield the iterates of the revised simplex method on the given LP.
+
+    The first BFS yielded is the initial iterate and every following BFS is
+    the iterate after one more iteration. Each BFS is yielded as soon as the
+    method knows whether it is optimal; the last BFS yielded is optimal. The
+    yielded BFS are copies and are not changed by later iterations. The
+    consumer may stop at any time (e.g. with break or close()); no further
+    iterations are done. The arguments are those of simplex(), which
+    describes the methods, pivot rules, and pricing.
+
+    Args:
+        lp (LP): LP on which to run simplex
+        pivot_rule (str): Pivot rule to be used. 'bland' by default.
+        initial_solution (Union[np.ndarray, List, Tuple]): Initial bfs.
+        feas_tol (float): Primal feasibility tolerance (1e-7 default).
+        method (str): Simplex method to be used. 'primal' by default.
+        initial_basis (List[int]): Initial basis. None by default.
+        pricing (str): Pricing ('full' or 'partial'). 'full' by default.
+
+    Yields:
+        BFS: The next iterate of the simplex method.
+
+    Raises:
+        ValueError: Invalid method. Select from (list).
+        UnboundedLinearProgram: The LP is unbounded.
+        Infeasible: The LP has no feasible solutions.
+    """
+    methods = ['primal', 'dual', 'ipm']
+    if method not in methods:
+        raise ValueError('Invalid method. Select from ' + str(methods))
+    n,m,A,b,c = lp.get_coefficients(copy=False)
+    bfs, method = _start(lp, initial_solution, feas_tol, method,
+                         initial_basis)
+    state = _SimplexState(A, sorted(bfs.B))
+    while True:
+        current = BFS(x=np.copy(bfs.x), B=sorted(bfs.B),
+                      obj_val=bfs.obj_val, optimal=False)
+        bfs = _iteration(lp, bfs, method, pivot_rule, feas_tol, pricing, state)
+        if bfs.optimal:
+            yield current._replace(optimal=True)
+            return
+        yield current
+
+
+class _Node:
+    """Branch and bound node stored as a bound change on its parent.
+
+    A node only stores its parent and the new bounds of the variable
+    branched on, so an open node takes constant memory. The LP of the node
+    is materialized from the LP of the root node when the node is explored.
+
+    Attributes:
+        parent (_Node): Parent node (None for the root node).
+        index (int): Index of the variable branched on (None for the root).
+        lb (float): New lower bound of x_index (-inf if unchanged).
+        ub (float): New upper bound of x_index (inf if unchanged).
+    """
+
+    def __init__(self,
+                 parent: '_Node' = None,
+                 index: int = None,
+                 lb: float = -math.inf,
+                 ub: float = math.inf):
+        self.parent = parent
+        self.index = index
+        self.lb = lb
+        self.ub = ub
+
+    def lp(self, root: LP) -> LP:
+        """Return the LP of this node where root is the LP of the root."""
+        if self.parent is None:
+            return root
+        lb,ub = root.get_bounds(equality=root.equality)
+        node = self
+        while node.parent is not None:
+            lb[node.index] = max(lb[node.index,0], node.lb)
+            ub[node.index] = min(ub[node.index,0], node.ub)
+            node = node.parent
+        n,m,A,b,c = root.get_coefficients(equality=root.equality, copy=False)
+        return LP(A,b,c,equality=root.equality,lb=lb,ub=ub,
+                  immutable=root.immutable)
+
+
+class _NodeQueue:
+    """Unexplored branch and bound nodes ordered by a node selection.
+
+    Every node is stored with the optimal basis, the optimal value (an upper
+    bound), and the estimate of its parent so that no node has to be solved
+    to be ordered (or pruned). The branch creating the node (the index i,
+    'left' or 'right', and the distance from x_i in the parent's solution to
+    the new bound) is stored too. The nodes are kept in a priority queue
+    (heap); ties are broken in favor of the most recently added node.
+
+    NODE SELECTIONS
+
+        - 'depth_first': most recently added node (left branch first).
+        - 'best_bound': node with the largest parent bound.
+        - 'best_estimate': node with the largest parent estimate of the
+          best integer solution in its subtree.
+        - 'hybrid': plunge depth first (left branch first) until a node is
+          fathomed and then continue from the node with the best bound.
+    """
+
+    def __init__(self, node_selection: str = 'depth_first'):
+        self.node_selection = node_selection
+        self._heap = []
+        self._count = itertools.count()
+        self._plunge = None  # next node of the current plunge (hybrid)
+
+    def __len__(self) -> int:
+        return len(self._heap) + (self._plunge is not None)
+
+    def push(self,
+             node: _Node,
+             basis: List[int] = None,
+             bound: float = math.inf,
+             estimate: float = math.inf,
+             branch: Tuple[int, str, float] = None):
+        """Add a node with the basis, bound, and estimate of its parent."""
+        key = {'depth_first': 0,
+               'best_bound': -bound,
+               'best_estimate': -estimate,
+               'hybrid': -bound}[self.node_selection]
+        heapq.heappush(self._heap, (key, -next(self._count),
+                                    (node, basis, bound, estimate, branch)))
+
+    def push_children(self,
+                      left: _Node,
+                      right: _Node,
+                      basis: List[int],
+                      bound: float,
+                      estimate: float,
+                      index: int = None,
+                      frac: float = None):
+        """Add both branches on x_index (with fractional part frac) of a node
+        (the left branch is selected first if the bounds are tied) and
+        continue the plunge from the left one. A pending plunge node (if the
+        children of several nodes are added between selections) is moved
+        to the heap."""
+        left_branch = right_branch = None
+        if index is not None:
+            left_branch = (index, 'left', frac)
+            right_branch = (index, 'right', 1 - frac)
+        self.push(right, basis, bound, estimate, right_branch)
+        if self.node_selection == 'hybrid':
+            if self._plunge is not None:
+                self.push(*self._plunge)
+            self._plunge = (left, basis, bound, estimate, left_branch)
+        else:
+            self.push(left, basis, bound, estimate, left_branch)
+
+    def pop(self) -> Tuple[_Node, List[int], float, float, Tuple]:
+        """Remove and return the next node with its parent's basis, bound,
+        and estimate and the branch creating it."""
+        if self._plunge is not None:
+            item, self._plunge = self._plunge, None
+            return item
+        return heapq.heappop(self._heap)[2]
+
+
+def _branch(lp: LP, i: int, bound: int, branch: str) -> LP:
+    """Create branch off LP on fractional variable x_i. The branch only
+    tightens the bounds on x_i (x_i <= bound on the left branch and
+    x_i >= bound on the right branch)."""
+    n,m,A,b,c = lp.get_coefficients(equality=lp.equality)
+    lb,ub = lp.get_bounds(equality=lp.equality)
+    if branch == 'left':
+        ub[i] = min(ub[i,0], bound)
+    else:
+        lb[i] = max(lb[i,0], bound)
+    return LP(A,b,c,equality=lp.equality,lb=lb,ub=ub,immutable=lp.immutable)
+
+
+class _PseudoCosts:
+    """Average loss of the optimal value per unit change of every variable
+    observed when branching on it.
+
+    Attributes:
+        loss (np.ndarray): Total loss per unit (n*2: left and right branch).
+        count (np.ndarray): Number of observations (n*2).
+        reliability (int): Observations in each direction after which the
+            pseudo-cost of a variable is trusted.
+    """
+
+    def __init__(self, n: int, reliability: int = 4):
+        self.loss = np.zeros((n, 2))
+        self.count = np.zeros((n, 2), dtype=int)
+        self.reliability = reliability
+
+    def update(self, i: int, branch: str, dist: float, loss: float):
+        """Record the loss of the branch moving x_i by dist."""
+        if dist > 0 and np.isfinite(loss):
+            k = int(branch == 'right')
+            self.loss[i,k] += max(loss, 0) / dist
+            self.count[i,k] += 1
+
+    def add(self, other: '_PseudoCosts'):
+        """Add the observations of other to these."""
+        self.loss += other.loss
+        self.count += other.count
+
+    def reliable(self, i: int) -> bool:
+        """Return True iff x_i was observed often enough in both directions."""
+        return bool(np.all(self.count[i] >= self.reliability))
+
+    def estimate(self,
+                 i: int,
+                 frac: float,
+                 default: float = None) -> Tuple[float, float]:
+        """Return the estimated losses of the left and right branch on x_i
+        where frac is the fractional part of x_i.
+
+        Directions without observations use the default loss per unit. If
+        there is no default, they use the average over all variables
+        observed in that direction (1 if there are none).
+        """
+        observed = self.count > 0
+        unit = np.ones(2)
+        for k in range(2):
+            if observed[i,k]:
+                unit[k] = self.loss[i,k] / self.count[i,k]
+            elif default is not None:
+                unit[k] = default
+            elif np.any(observed[:,k]):
+                unit[k] = np.mean(self.loss[observed[:,k],k]
+                                  / self.count[observed[:,k],k])
+        return unit[0] * frac, unit[1] * (1 - frac)
+
+
+def _score(left: float, right: float) -> float:
+    """Return the product score of the losses of the two branches."""
+    return max(left, 1e-6) * max(right, 1e-6)
+
+
+def _strong_branching(lp: LP,
+                      x: np.ndarray,
+                      value: float,
+                      i: int,
+                      B: List[int],
+                      feas_tol: float,
+                      stats: Stats,
+                      iteration_limit: int = 10) -> Tuple[float, float]:
+    """Return the losses of the left and right branch on x_i.
+
+    Each branch is re-optimized from the optimal basis B of the node with at
+    most iteration_limit dual simplex iterations. The objective value of a
+    dual simplex iterate is an upper bound on the optimal value of the
+    branch, so the losses are lower bounds (infinite if a branch is
+    infeasible).
+    """
+    losses = []
+    for branch, bound in [('left', math.floor(x[i,0])),
+                          ('right', math.ceil(x[i,0]))]:
+        try:
+            sol = simplex(lp=_branch(lp, i, bound, branch), method='dual',
+                          initial_basis=B, feas_tol=feas_tol,
+                          iteration_limit=iteration_limit, path_mode='none')
+            stats.add(sol.stats)
+            losses.append(value - sol.obj_val)
+        except Infeasible:
+            losses.append(math.inf)
+    return tuple(losses)
+
+
+def _branching_index(lp: LP,
+                     x: np.ndarray,
+                     value: float,
+                     pos_i: np.ndarray,
+                     B: List[int],
+                     branching: str,
+                     pseudo_costs: _PseudoCosts,
+                     feas_tol: float,
+                     stats: Stats,
+                     candidates: int = 8) -> int:
+    """Return the index of the fractional variable to branch on.
+
+    Strong branching evaluates at most the given number of candidates (the
+    most fractional ones). Its losses are recorded in the pseudo-costs.
+    """
+    frac = x[pos_i,0] - np.floor(x[pos_i,0])
+    if branching == 'first':
+        return int(pos_i[0])
+    order = np.argsort(-np.minimum(frac, 1 - frac), kind='stable')
+    if branching == 'most_fractional':
+        return int(pos_i[order[0]])
+
+    best_i, best_score = None, -math.inf
+    for k in order:
+        i = int(pos_i[k])
+        if branching == 'pseudo_cost' and pseudo_costs.reliable(i):
+            left, right = pseudo_costs.estimate(i, frac[k])
+        elif candidates > 0:
+            candidates -= 1
+            left, right = _strong_branching(lp, x, value, i, B, feas_tol,
+                                            stats)
+            pseudo_costs.update(i, 'left', frac[k], left)
+            pseudo_costs.update(i, 'right', 1 - frac[k], right)
+        elif branching == 'pseudo_cost':
+            left, right = pseudo_costs.estimate(i, frac[k])
+        else:
+            break
+        score = _score(left, right)
+        if score > best_score:
+            best_i, best_score = i, score
+    return best_i
 
 
 def branch_and_bound_iteration(lp: LP,
@@ -619,13 +2489,50 @@ def branch_and_bound_iteration(lp: LP,
                                best_bound: float,
                                manual: bool = False,
                                feas_tol: float = 1e-7,
-                               int_feas_tol: float = 1e-7
-                               ) -> Tuple[bool, np.ndarray, float, LP, LP]:
+                               int_feas_tol: float = 1e-7,
+                               stats: Stats = None,
+                               time_limit: float = None,
+                               cancel: threading.Event = None,
+                               initial_basis: List[int] = None,
+                               branching: str = 'first',
+                               pseudo_costs: _PseudoCosts = None,
+                               branches: bool = True
+                               ) -> Tuple[bool, np.ndarray, float, LP, LP,
+                                          str, List[int], float, float,
+                                          int, np.ndarray]:
     """Exectue one iteration of branch and bound on the given node.
 
     Execute one iteration of branch and bound on the given node (LP). Update
     the current incumbent and best bound if needed. Use the given primal
-    feasibility and integer feasibility tolerance (defaults to 1e-7).
+    feasibility and integer feasibility tolerance (defaults to 1e-7). If
+    statistics are given, the node, the statistics of its simplex run, and
+    the reason it was pruned (if it was) are added to them. The time limit
+    and cancel event are passed to simplex; if simplex stops early, the node
+    is neither fathomed nor branched on.
+
+    A node differs from its parent only in the bounds of the branching
+    variable, so the optimal basis of the parent remains dual feasible. If it
+    is given as initial_basis, the node is re-optimized from it with the dual
+    simplex method (usually in a few pivots) instead of being solved from
+    scratch with phase I and the primal simplex method.
+
+    Unless manual is True, the variable to branch on is chosen by the
+    branching rule. Pseudo-costs (needed for 'pseudo_cost' and updated by
+    strong branching) are kept across nodes by the caller.
+
+    BRANCHING RULES
+
+        - 'first': first fractional variable.
+        - 'most_fractional': variable whose fractional part is closest to
+          1/2.
+        - 'pseudo_cost': variable with the best product score of its
+          estimated losses (pseudo-cost times distance to the bound). The
+          pseudo-costs of variables with fewer than pseudo_costs.reliability
+          observations in a direction are initialized by strong branching.
+        - 'strong': variable with the best product score of the losses found
+          by strong branching on the (at most 8) most fractional variables.
+          Each branch is re-optimized with at most 10 dual simplex
+          iterations from the optimal basis of the node.
 
     Args:
         lp (LP): Branch and bound node.
@@ -634,6 +2541,15 @@ def branch_and_bound_iteration(lp: LP,
         manual (bool): True if the user can choose the variable to branch on.
         feas_tol (float): Primal feasibility tolerance (1e-7 default).
         int_feas_tol (float): Integer feasibility tolerance (1e-7 default).
+        stats (Stats): Statistics of branch and bound. None by default.
+        time_limit (float): Time limit of simplex in seconds. None by default.
+        cancel (threading.Event): Event cancelling simplex. None by default.
+        initial_basis (List[int]): Optimal basis of the parent node (if any).
+        branching (str): Branching rule ('first' by default).
+        pseudo_costs (_PseudoCosts): Pseudo-costs (kept across nodes).
+        branches (bool): True if the branch nodes (LPs) are created. If
+            False, left_LP and right_LP are None and the branches are given
+            by index and x only.
 
     Returns:
         Tuple:
@@ -643,22 +2559,54 @@ def branch_and_bound_iteration(lp: LP,
         - best_bound (float): Current best bound (after iteration).
         - right_LP (LP): Left branch node (LP).
         - left_LP (LP): Right branch node (LP).
-    """
-
-    # Named tuple for return values
-    BnbIter = namedtuple('bnb_iter', ['fathomed','incumbent','best_bound',
-                                      'left_LP', 'right_LP'])
+        - status (str): Status of simplex on the node ('infeasible' if the
+          node is infeasible).
+        - B (List[int]): Optimal basis of the node if it was branched on.
+        - obj_val (float): Optimal value of the node (None if the node was
+          not solved to optimality).
+        - estimate (float): Estimate of the best integer solution in the
+          subtree of the node if it was branched on. Every fractional x_j
+          is assumed to lose its pseudo-cost (|c_j| without pseudo-costs)
+          per unit it is rounded (to the closer integer).
+        - index (int): Index of the variable branched on (if any).
+        - x (np.ndarray): Optimal solution of the node if it was branched on.
 
+    Raises:
+        ValueError: Invalid branching rule. Select from (list).
+    """
+    branchings = ['first', 'most_fractional', 'pseudo_cost', 'strong']
+    if branching not in branchings:
+        raise ValueError('Invalid branching rule. Select from '
+                         + str(branchings))
+
+    if pseudo_costs is None:
+        pseudo_costs = _PseudoCosts(lp.n)
+    stats = Stats() if stats is None else stats
+    stats.nodes += 1
     try:
-        sol = simplex(lp=lp, feas_tol=feas_tol)
+        method = 'primal' if initial_basis is None else 'dual'
+        sol = simplex(lp=lp, feas_tol=feas_tol, method=method,
+                      initial_basis=initial_basis, path_mode='none',
+                      time_limit=time_limit, cutoff=best_bound, cancel=cancel)
         x = sol.x
         value = sol.obj_val
+        stats.add(sol.stats)
     except Infeasible:
+        stats.pruned['infeasible'] += 1
         return BnbIter(fathomed=True, incumbent=incumbent,
-                       best_bound=best_bound, left_LP=None, right_LP=None)
-    if best_bound is not None and best_bound >= value:
+                       best_bound=best_bound, left_LP=None, right_LP=None,
+                       status='infeasible')
+    if sol.status in ['time_limit', 'cancelled']:
+        return BnbIter(fathomed=False, incumbent=incumbent,
+                       best_bound=best_bound, left_LP=None, right_LP=None,
+                       status=sol.status)
+    if sol.status == 'cutoff' or (best_bound is not None
+                                  and best_bound >= value):
+        stats.pruned['bound'] += 1
         return BnbIter(fathomed=True, incumbent=incumbent,
-                       best_bound=best_bound, left_LP=None, right_LP=None)
+                       best_bound=best_bound, left_LP=None, right_LP=None,
+                       status=sol.status,
+                       obj_val=value if sol.status == 'optimal' else None)
     else:
         frac_comp = ~np.isclose(x, np.round(x), atol=int_feas_tol)[:lp.n]
         if np.sum(frac_comp) > 0:
@@ -668,79 +2616,335 @@ def branch_and_bound_iteration(lp: LP,
                 if i not in pos_i:
                     raise ValueError('This index can not be branched on.')
             else:
-                i = pos_i[0]  # branch on first fractional component x_i
+                i = _branching_index(lp, x, value, pos_i, sol.B, branching,
+                                     pseudo_costs, feas_tol, stats)
             frac_val = x[i,0]
             lb, ub = math.floor(frac_val), math.ceil(frac_val)
-
-            def create_branch(lp, i, bound, branch):
-                """Create branch off LP on fractional variable x_i."""
-                s = {'left': 1, 'right': -1}[branch]
-                n,m,A,b,c = lp.get_coefficients(equality=lp.equality)
-                v = np.zeros(n)
-                v[i] = s
-                A = np.vstack((A,v))
-                b = np.vstack((b,np.array([[s*bound]])))
-                if lp.equality:
-                    A = np.hstack((A,np.zeros((len(A),1))))
-                    A[-1,-1] = 1
-                    c = np.vstack((c,np.array([0])))
-                return LP(A,b,c)
-
-            left_LP = create_branch(lp,i,lb,'left')
-            right_LP = create_branch(lp,i,ub,'right')
+            left_LP = right_LP = None
+            if branches:
+                left_LP = _branch(lp,i,lb,'left')
+                right_LP = _branch(lp,i,ub,'right')
+
+            c = lp.get_coefficients(copy=False).c
+            estimate = value
+            for j in pos_i:
+                frac = x[j,0] - math.floor(x[j,0])
+                estimate -= min(pseudo_costs.estimate(j, frac, abs(c[j,0])))
         else:
-            # better all integer solution
-            incumbent = x
-            best_bound = value
+            # better all integer solution (rounded to remove the round-off
+            # of the simplex updates)
+            c = lp.get_coefficients(copy=False).c
+            incumbent = np.copy(x)
+            incumbent[:lp.n] = np.round(incumbent[:lp.n])
+            best_bound = float(np.dot(c.transpose(), incumbent))
+            stats.pruned['integral'] += 1
             return BnbIter(fathomed=True, incumbent=incumbent,
-                           best_bound=best_bound, left_LP=None, right_LP=None)
+                           best_bound=best_bound, left_LP=None, right_LP=None,
+                           obj_val=value)
     return BnbIter(fathomed=False, incumbent=incumbent,best_bound=best_bound,
-                   left_LP=left_LP, right_LP=right_LP)
+                   left_LP=left_LP, right_LP=right_LP, B=sol.B,
+                   obj_val=value, estimate=estimate, index=int(i), x=x)
+
+
+_shared_bound = None  # best bound shared with the branch and bound workers
+
+
+def _init_worker(shared_bound: multiprocessing.Value):
+    """Initialize a branch and bound worker process with the shared bound."""
+    global _shared_bound
+    _shared_bound = shared_bound
+
+
+def _solve_node(lp: LP,
+                best_bound: float,
+                initial_basis: List[int],
+                feas_tol: float,
+                int_feas_tol: float,
+                time_limit: float,
+                branching: str,
+                pseudo_costs: _PseudoCosts
+                ) -> Tuple[Tuple, Stats, _PseudoCosts]:
+    """Run branch_and_bound_iteration on a node in a worker process.
+
+    The best bound is the larger of the given one and the shared one (if
+    any). Return the iteration (as a tuple without the branch LPs), its
+    statistics, and the new observations of the pseudo-costs.
+    """
+    if _shared_bound is not None and _shared_bound.value > -math.inf:
+        shared = _shared_bound.value
+        best_bound = shared if best_bound is None else max(best_bound, shared)
+    stats = Stats()
+    observed = copy.deepcopy(pseudo_costs)
+    iteration = branch_and_bound_iteration(lp=lp,
+                                           incumbent=None,
+                                           best_bound=best_bound,
+                                           feas_tol=feas_tol,
+                                           int_feas_tol=int_feas_tol,
+                                           stats=stats,
+                                           time_limit=time_limit,
+                                           initial_basis=initial_basis,
+                                           branching=branching,
+                                           pseudo_costs=observed,
+                                           branches=False)
+    observed.loss -= pseudo_costs.loss
+    observed.count -= pseudo_costs.count
+    return tuple(iteration), stats, observed
 
 
 def branch_and_bound(lp: LP,
                      manual: bool = False,
                      feas_tol: float = 1e-7,
-                     int_feas_tol: float = 1e-7
-                     ) -> Tuple[np.ndarray, float]:
+                     int_feas_tol: float = 1e-7,
+                     callback: Callable[[LP, Tuple, Stats], None] = None,
+                     time_limit: float = None,
+                     target: float = None,
+                     cutoff: float = None,
+                     cancel: threading.Event = None,
+                     node_selection: str = 'depth_first',
+                     branching: str = 'first',
+                     workers: int = None,
+                     deterministic: bool = False
+                     ) -> Tuple[np.ndarray, float, Stats, str]:
     """Execute branch and bound on the given LP.
 
     Execute branch and bound on the given LP assuming that all decision
     variables must be integer. Use a primal feasibility tolerance of feas_tol
     (with default vlaue of 1e-7) and an integer feasibility tolerance of
-    int_feas_tol (with default vlaue of 1e-7).
+    int_feas_tol (with default vlaue of 1e-7). If a callback is given, it is
+    called as callback(node, iteration, stats) after every node where node is
+    the node (LP), iteration is the result of branch_and_bound_iteration on
+    it, and stats are the statistics so far.
+
+    Branch and bound stops if the cancel event is set (by any thread) or the
+    time limit (in seconds) has passed; both are also checked at every pivot
+    of the simplex runs. It also stops once the incumbent has an objective
+    value of at least the target. Nodes whose LP relaxation has an optimal
+    value of at most the cutoff are pruned, so only integer solutions better
+    than the cutoff are found. The incumbent (None if there is none) is
+    returned with the termination status:
+
+        - 'optimal': the incumbent is optimal.
+        - 'infeasible': there is no integer solution.
+        - 'cutoff': there is no integer solution better than the cutoff.
+        - 'time_limit' or 'cancelled': a limit was hit.
+        - 'target': the incumbent reached the target.
+
+    NODE SELECTIONS
+
+        - 'depth_first': explore the most recently created node (the left
+          branch first). Finds incumbents quickly with few open nodes.
+        - 'best_bound': explore the node whose parent has the largest LP
+          relaxation value. Explores few nodes but keeps many open.
+        - 'best_estimate': explore the node whose parent has the largest
+          estimate of the best integer solution below it.
+        - 'hybrid': plunge depth first until a node is fathomed and then
+          continue from the node with the best bound.
+
+    An open node whose parent's optimal value is at most the best bound is
+    pruned when it is selected without being solved. It is counted in
+    stats.pruned['bound'] but not in stats.nodes, and the callback is not
+    called for it.
+
+    Open nodes are stored as bound changes on their parents and their LPs
+    are only created when they are explored. Hence, the iterations passed
+    to the callback do not include the branch LPs (left_LP and right_LP
+    are None); the branches are given by index and x.
+
+    The variable to branch on is chosen by the branching rule ('first',
+    'most_fractional', 'pseudo_cost', or 'strong'; see
+    branch_and_bound_iteration). The pseudo-costs are updated with the
+    optimal value of every solved node and the strong branching results.
+
+    If workers is larger than one, nodes are solved in parallel by a pool of
+    that many worker processes. Every node is sent with the best bound and
+    the pseudo-costs at that time; the best bound is also shared with the
+    workers as soon as a better incumbent is found. The cancel event is
+    checked between nodes (a node being solved is not interrupted). The
+    order in which nodes finish depends on timing. If deterministic is
+    True, the nodes are instead solved in batches of one node per worker:
+    the nodes of a batch get the same best bound, and their results are
+    processed in the order of the node selection once the whole batch is
+    solved. The search then only depends on the number of workers.
 
     Args:
         lp (LP): LP on which to run the branch and bound algorithm.
         manual (bool): True if the user can choose the variable to branch on.
         feas_tol (float): Primal feasibility tolerance (1e-7 default).
         int_feas_tol (float): Integer feasibility tolerance (1e-7 default).
+        callback (Callable[[LP, Tuple, Stats], None]): Called after each node.
+        time_limit (float): Time limit in seconds. None by default.
+        target (float): Target objective value. None by default.
+        cutoff (float): Objective cutoff value. None by default.
+        cancel (threading.Event): Event cancelling the search. None by default.
+        node_selection (str): Node selection strategy ('depth_first' default).
+        branching (str): Branching rule ('first' by default).
+        workers (int): Number of worker processes. None (serial) by default.
+        deterministic (bool): True if the parallel search is deterministic.
 
     Return:
         Tuple:
 
         - x (np.ndarray): An optimal all integer solution.
         - obj_val(float): The optimal value subject to integrality constraints.
+
+        The tuple also has the following attributes (which are not unpacked):
+
+        - stats (Stats): Statistics of branch and bound (summed over nodes).
+        - status (str): Termination status.
+
+    Raises:
+        ValueError: Time limit must be non-negative.
+        ValueError: Invalid node selection. Select from (list).
+        ValueError: Invalid branching rule. Select from (list).
+        ValueError: The number of workers must be strictly positive.
+        ValueError: Manual branching can not be done in parallel.
     """
+    if time_limit is not None and time_limit < 0:
+        raise ValueError('Time limit must be non-negative.')
+    if workers is not None and workers <= 0:
+        raise ValueError('The number of workers must be strictly positive.')
+    if manual and workers is not None and workers > 1:
+        raise ValueError('Manual branching can not be done in parallel.')
+    node_selections = ['depth_first', 'best_bound', 'best_estimate', 'hybrid']
+    if node_selection not in node_selections:
+        raise ValueError('Invalid node selection. Select from '
+                         + str(node_selections))
+    start = time.perf_counter()
+    limits = _Limits(time_limit=time_limit, cancel=cancel)
+    stats = Stats()
     incumbent = None
-    best_bound = None
-    unexplored = [lp]
-
-    while len(unexplored) > 0:
-        sub = unexplored.pop()
-        iteration = branch_and_bound_iteration(lp=sub,
-                                               incumbent=incumbent,
-                                               best_bound=best_bound,
-                                               manual=manual,
-                                               feas_tol=feas_tol,
-                                               int_feas_tol=int_feas_tol)
-        fathom = iteration.fathomed
-        incumbent = iteration.incumbent
-        best_bound = iteration.best_bound
-        left_LP = iteration.left_LP
-        right_LP = iteration.right_LP
-        if not fathom:
-            unexplored.append(right_LP)
-            unexplored.append(left_LP)
-    Bnb = namedtuple('bnb', ['x', 'obj_val'])
-    return Bnb(x=incumbent[:lp.n], obj_val=best_bound)
+    best_bound = cutoff
+    unexplored = _NodeQueue(node_selection)
+    unexplored.push(_Node())
+    pseudo_costs = _PseudoCosts(lp.n)
+
+    status = None
+    if workers is not None and workers > 1:
+        shared_bound = None
+        if not deterministic:
+            shared_bound = multiprocessing.Value('d', -math.inf)
+        executor = futures.ProcessPoolExecutor(max_workers=workers,
+                                               initializer=_init_worker,
+                                               initargs=(shared_bound,))
+        running = {}  # nodes being solved (parent bound and branch)
+        while len(unexplored) > 0 or len(running) > 0:
+            status = limits.interrupted()
+            if (status is None and target is not None
+                    and incumbent is not None and best_bound >= target):
+                status = 'target'
+            if status is not None:
+                break
+            if not deterministic or len(running) == 0:
+                while len(unexplored) > 0 and len(running) < workers:
+                    node, basis, bound, _, branch = unexplored.pop()
+                    if best_bound is not None and bound <= best_bound:
+                        stats.pruned['bound'] += 1  # pruned without a solve
+                        continue
+                    sub = node.lp(lp)
+                    future = executor.submit(_solve_node, sub, best_bound,
+                                             basis, feas_tol, int_feas_tol,
+                                             limits.remaining(), branching,
+                                             pseudo_costs)
+                    running[future] = (node, sub, bound, branch)
+            when = (futures.ALL_COMPLETED if deterministic
+                    else futures.FIRST_COMPLETED)
+            done, _ = futures.wait(running, timeout=0.05, return_when=when)
+            if deterministic and len(done) < len(running):
+                continue
+            for future in [future for future in running if future in done]:
+                node, sub, bound, branch = running.pop(future)
+                values, node_stats, observed = future.result()
+                iteration = BnbIter(*values)
+                stats.add(node_stats)
+                pseudo_costs.add(observed)
+                if iteration.status == 'time_limit':
+                    status = iteration.status
+                    break
+                if (iteration.incumbent is not None
+                        and (best_bound is None
+                             or iteration.best_bound > best_bound)):
+                    incumbent = iteration.incumbent
+                    best_bound = iteration.best_bound
+                    if shared_bound is not None:
+                        shared_bound.value = best_bound
+                if (not iteration.fathomed and best_bound is not None
+                        and iteration.obj_val <= best_bound):
+                    # the incumbent improved while the node was solved
+                    stats.pruned['bound'] += 1
+                    iteration = iteration._replace(fathomed=True,
+                                                   left_LP=None,
+                                                   right_LP=None)
+                iteration = iteration._replace(incumbent=incumbent,
+                                               best_bound=best_bound)
+                if callback is not None:
+                    callback(sub, iteration, stats)
+                if branch is not None and iteration.obj_val is not None:
+                    pseudo_costs.update(*branch, bound - iteration.obj_val)
+                if not iteration.fathomed:
+                    i = iteration.index
+                    x_i = iteration.x[i,0]
+                    unexplored.push_children(
+                        _Node(node, i, ub=math.floor(x_i)),
+                        _Node(node, i, lb=math.ceil(x_i)),
+                        iteration.B, iteration.obj_val, iteration.estimate,
+                        i, x_i - math.floor(x_i))
+            if status is not None:
+                break
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=True)
+    else:
+        while len(unexplored) > 0:
+            status = limits.interrupted()
+            if (status is None and target is not None
+                    and incumbent is not None and best_bound >= target):
+                status = 'target'
+            if status is not None:
+                break
+            node, basis, bound, _, branch = unexplored.pop()
+            if best_bound is not None and bound <= best_bound:
+                stats.pruned['bound'] += 1  # pruned without a solve
+                continue
+            sub = node.lp(lp)
+            iteration = branch_and_bound_iteration(
+                lp=sub,
+                incumbent=incumbent,
+                best_bound=best_bound,
+                manual=manual,
+                feas_tol=feas_tol,
+                int_feas_tol=int_feas_tol,
+                stats=stats,
+                time_limit=limits.remaining(),
+                cancel=cancel,
+                initial_basis=basis,
+                branching=branching,
+                pseudo_costs=pseudo_costs,
+                branches=False)
+            if callback is not None:
+                callback(sub, iteration, stats)
+            if iteration.status in ['time_limit', 'cancelled']:
+                status = iteration.status
+                break
+            if branch is not None and iteration.obj_val is not None:
+                pseudo_costs.update(*branch, bound - iteration.obj_val)
+            fathom = iteration.fathomed
+            incumbent = iteration.incumbent
+            best_bound = iteration.best_bound
+            if not fathom:
+                i = iteration.index
+                x_i = iteration.x[i,0]
+                unexplored.push_children(
+                    _Node(node, i, ub=math.floor(x_i)),
+                    _Node(node, i, lb=math.ceil(x_i)),
+                    iteration.B, iteration.obj_val, iteration.estimate,
+                    i, x_i - math.floor(x_i))
+    if status is None:
+        if incumbent is not None:
+            status = 'optimal'
+        else:
+            status = 'infeasible' if cutoff is None else 'cutoff'
+    stats.time = time.perf_counter() - start
+    if incumbent is None:
+        return _Bnb(x=None, obj_val=None, stats=stats, status=status)
+    return _Bnb(x=incumbent[:lp.n], obj_val=best_bound, stats=stats,
+                status=status)
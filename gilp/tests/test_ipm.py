@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+from scipy import sparse
+import gilp
+from gilp._ipm import ipm
+from gilp._linalg import SlackMatrix
+
+
+@pytest.mark.parametrize("lp",[
+    gilp.examples.ALL_INTEGER_2D_LP,
+    gilp.examples.KLEE_MINTY_3D_LP,
+    gilp.examples.SQUARE_PYRAMID_3D_LP,
+    gilp.examples.DODECAHEDRON_3D_LP])
+@pytest.mark.parametrize("form",['slack', 'dense', 'sparse'])
+def test_ipm(lp, form):
+    n,m,A,b,c = lp.get_coefficients()
+    lb,ub = lp.get_bounds()
+    M = {'slack': SlackMatrix(lp.A),
+         'dense': A,
+         'sparse': sparse.csc_matrix(A)}[form]
+    sol = ipm(M, b, c, lb, ub)
+    assert sol.converged
+    assert np.isclose(float(c.T @ sol.x), gilp.simplex(lp).obj_val)
+    assert np.allclose(A @ sol.x, b)
+    assert np.all(sol.x > 0)
+    # Dual feasibility: c - A^Ty <= 0 for the (max) LP
+    assert np.all(c - A.T @ sol.y <= 1e-6)
+
+
+def test_bounds():
+    # max x_0 + x_1 + x_2 s.t. x_0 + x_1 + x_2 <= 4 where x_2 is fixed at 1
+    A = np.array([[1,1,1]])
+    sol = ipm(SlackMatrix(A), [4], [1,1,1,0], [1,0,1,0], [2,np.inf,1,np.inf])
+    assert sol.converged
+    assert np.isclose(sol.x[:3].sum(), 4)
+    assert sol.x[2,0] == 1
+    assert 1 <= sol.x[0,0] <= 2
+
+
+def test_not_converged():
+    # x_0 + x_1 <= 1 and x_0 >= 2
+    A = np.array([[1,1],[-1,0]])
+    sol = ipm(SlackMatrix(A), [1,-2], [1,1,0,0], np.zeros(4),
+              np.full(4, np.inf))
+    assert not sol.converged
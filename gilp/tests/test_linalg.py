@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+from scipy.linalg import LinAlgError
+from scipy import sparse
+from gilp._linalg import BasisFactor, SlackMatrix, column, columns
+
+
+@pytest.fixture
+def A():
+    return np.array([[2,1,1,0,0,3],
+                     [1,3,0,1,0,1],
+                     [0,1,0,0,1,2]], dtype=float)
+
+
+def test_singular_basis(A):
+    with pytest.raises(LinAlgError):
+        BasisFactor(A, [0,2,3])
+    with pytest.raises(LinAlgError):
+        BasisFactor(A, [0,1])
+
+
+@pytest.mark.parametrize("refactor_interval",[1,2,50])
+def test_updates(A, refactor_interval):
+    factor = BasisFactor(A, [2,3,4], refactor_interval=refactor_interval)
+    for p,k in [(0,0),(2,5),(1,1)]:
+        d = factor.ftran(A[:,k])
+        factor.replace(p, k, d)
+        A_B = A[:,factor.basis]
+        a = np.array([1.0,-2.0,3.0])
+        assert np.allclose(factor.ftran(a), np.linalg.solve(A_B, a))
+        assert np.allclose(factor.btran(a), np.linalg.solve(A_B.T, a))
+        M = A[:,[1,5]]
+        assert np.allclose(factor.ftran(M), np.linalg.solve(A_B, M))
+    assert list(factor.basis) == [0,1,5]
+
+
+@pytest.mark.parametrize("sparse_A",[False, True])
+def test_slack_matrix(A, sparse_A):
+    S = SlackMatrix(sparse.csc_matrix(A) if sparse_A else A)
+    A_eq = np.hstack((A, np.identity(3)))
+    x = np.arange(9, dtype=float).reshape(-1,1)
+    assert np.allclose(S @ x, A_eq @ x)
+    assert np.allclose(S.transpose() @ x[:3,0], A_eq.T @ x[:3,0])
+    assert np.allclose(S.toarray(), A_eq)
+    assert np.allclose(S.tocsc().toarray(), A_eq)
+    assert np.allclose(columns(S, [7,1,6]), A_eq[:,[7,1,6]])
+    assert np.allclose(column(S, 8), A_eq[:,8])
+
+    # Bases with structural and slack columns (only A[~L,S] is factorized)
+    for basis in [[6,7,8], [0,7,8], [8,0,6], [1,5,2]]:
+        factor = BasisFactor(S, basis)
+        A_B = A_eq[:,basis]
+        a = np.array([1.0,-2.0,3.0])
+        assert np.allclose(factor.ftran(a), np.linalg.solve(A_B, a))
+        assert np.allclose(factor.btran(a), np.linalg.solve(A_B.T, a))
+        M = A_eq[:,[1,5]]
+        assert np.allclose(factor.ftran(M), np.linalg.solve(A_B, M))
+    factor = BasisFactor(S, [6,7,8])
+    for p,k in [(0,0),(2,5),(1,1)]:
+        factor.replace(p, k, factor.ftran(column(S, k)))
+    a = np.array([1.0,-2.0,3.0])
+    assert np.allclose(factor.ftran(a), np.linalg.solve(A_eq[:,[0,1,5]], a))
+    with pytest.raises(LinAlgError):
+        BasisFactor(S, [6,6,8])
+    with pytest.raises(LinAlgError):
+        BasisFactor(S, [4,7,8])
+
+
+@pytest.mark.parametrize("sparse_A",[False, True])
+def test_signed_unit_columns(A, sparse_A):
+    rows, signs = [2,0,2], [-1,1,1]
+    S = SlackMatrix(sparse.csc_matrix(A) if sparse_A else A, rows, signs)
+    U = np.array([[0,1,0],[0,0,0],[-1,0,1]])
+    A_U = np.hstack((A, U))
+    x = np.arange(9, dtype=float).reshape(-1,1)
+    assert S.shape == (3,9)
+    assert np.allclose(S @ x, A_U @ x)
+    assert np.allclose(S.transpose() @ x[:3,0], A_U.T @ x[:3,0])
+    assert np.allclose(S.toarray(), A_U)
+    assert np.allclose(S.tocsc().toarray(), A_U)
+    assert np.allclose(columns(S, [6,1,7]), A_U[:,[6,1,7]])
+    assert np.allclose(column(S, 6), A_U[:,6])
+    for basis in [[6,7,1], [7,3,8], [0,1,6]]:
+        factor = BasisFactor(S, basis)
+        A_B = A_U[:,basis]
+        a = np.array([1.0,-2.0,3.0])
+        assert np.allclose(factor.ftran(a), np.linalg.solve(A_B, a))
+        assert np.allclose(factor.btran(a), np.linalg.solve(A_B.T, a))
+    with pytest.raises(LinAlgError):
+        BasisFactor(S, [6,8,1])
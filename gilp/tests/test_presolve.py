@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+from scipy import sparse
+import gilp
+from gilp._presolve import presolve, postsolve, PresolveInfeasible
+from gilp.simplex import LP, Infeasible, UnboundedLinearProgram
+
+
+def test_singleton_row():
+    A = np.array([[2,0,0],
+                  [1,1,1]])
+    b = np.array([4,5])
+    c = np.array([1,1,2])
+    pre = presolve(A, b, c)
+    # x_0 = 2 by row 0; then x_1 is dominated by x_2 in row 1
+    assert len(pre.rows) == 0
+    assert np.allclose(pre.x, [[2],[0],[3]])
+    assert pre.basic == [0,2]
+
+
+def test_duplicate_row():
+    A = np.array([[1,1,1,0],
+                  [2,2,2,0],
+                  [1,0,0,1]])
+    b = np.array([2,4,1])
+    c = np.array([1,2,0,0])
+    pre = presolve(A, b, c)
+    assert np.allclose(pre.x, [[0],[2],[0],[1]])
+    assert pre.basic == [1,3]
+    with pytest.raises(PresolveInfeasible):
+        presolve(A, np.array([2,5,1]), c)
+
+
+def test_dependent_row():
+    A = np.array([[1,1,0,1],
+                  [0,1,1,1],
+                  [1,2,1,2]])
+    b = np.array([1,2,3])
+    c = np.array([1,1,1,1])
+    pre = presolve(A, b, c)
+    assert len(pre.rows) == 2
+    with pytest.raises(PresolveInfeasible):
+        presolve(A, np.array([1,2,4]), c)
+
+
+def test_forcing_row():
+    # x_0 + x_1 = 0 forces x_0 = x_1 = 0
+    A = np.array([[1,1,0,0],
+                  [1,0,1,1]])
+    b = np.array([0,3])
+    c = np.array([1,1,1,2])
+    pre = presolve(A, b, c)
+    assert np.allclose(pre.x, [[0],[0],[0],[3]])
+
+
+def test_dominated_column():
+    # x_2 is a slack of row 0 so y_0 >= 0 and x_0 has a negative reduced cost
+    A = np.array([[1,1,1],
+                  [0,1,0]])
+    b = np.array([4,1])
+    c = np.array([-1,1,0])
+    pre = presolve(A, b, c)
+    assert 0 not in pre.cols
+
+
+def test_infeasible():
+    with pytest.raises(PresolveInfeasible):
+        presolve(np.array([[1,1],[-1,0]]), np.array([1,1]), np.array([1,1]))
+    with pytest.raises(PresolveInfeasible):
+        presolve(np.array([[1,1]]), np.array([-1]), np.array([1,1]))
+
+
+def test_postsolve():
+    A = np.array([[2,0,0,0],
+                  [1,1,1,0],
+                  [0,1,0,1]])
+    b = np.array([4,5,2])
+    c = np.array([1,1,2,0])
+    pre = presolve(A, b, c)
+    assert len(pre.rows) == 0
+    x, B = postsolve(pre, np.zeros((0,1)), [])
+    assert len(B) == 3
+    assert np.linalg.matrix_rank(A[:,B]) == 3
+    assert np.allclose(A @ x, b.reshape(-1,1))
+    assert np.all(x >= 0)
+
+
+@pytest.mark.parametrize("lp",[
+    gilp.examples.ALL_INTEGER_2D_LP,
+    gilp.examples.LIMITING_CONSTRAINT_2D_LP,
+    gilp.examples.DEGENERATE_FIN_2D_LP,
+    gilp.examples.KLEE_MINTY_3D_LP,
+    gilp.examples.ALL_INTEGER_3D_LP,
+    gilp.examples.MULTIPLE_OPTIMAL_3D_LP,
+    gilp.examples.SQUARE_PYRAMID_3D_LP,
+    gilp.examples.DODECAHEDRON_3D_LP])
+def test_simplex(lp):
+    n,m,A,b,c = lp.get_coefficients()
+    expected = gilp.simplex(lp)
+    actual = gilp.simplex(lp, presolve=True)
+    assert actual.optimal
+    assert np.isclose(actual.obj_val, expected.obj_val)
+    assert np.allclose(A @ actual.x, b)
+    assert np.linalg.matrix_rank(A[:,actual.B]) == m
+    for bfs in actual.path:
+        assert np.allclose(A @ bfs.x, b)
+
+
+def test_simplex_sparse():
+    lp = gilp.examples.DODECAHEDRON_3D_LP
+    n,m,A,b,c = lp.get_coefficients()
+    expected = gilp.simplex(lp)
+    actual = gilp.simplex(LP(sparse.csc_matrix(A),b,c,equality=True),
+                          presolve=True)
+    assert np.isclose(actual.obj_val, expected.obj_val)
+
+
+def test_simplex_exceptions():
+    lp = LP(np.array([[1,1],[-1,0]]), np.array([1,-2]), np.array([1,1]))
+    with pytest.raises(Infeasible):
+        gilp.simplex(lp, presolve=True)
+    lp = LP(np.array([[1,-1]]), np.array([1]), np.array([1,1]))
+    with pytest.raises(UnboundedLinearProgram):
+        gilp.simplex(lp, presolve=True)
+
+
+def test_simplex_initial():
+    lp = gilp.examples.ALL_INTEGER_3D_LP
+    expected = gilp.simplex(lp)
+    actual = gilp.simplex(lp, presolve=True, initial_solution=[0,0,0])
+    assert np.isclose(actual.obj_val, expected.obj_val)
+    actual = gilp.simplex(lp, presolve=True, method='dual',
+                          initial_basis=[3,4,5,6])
+    assert np.isclose(actual.obj_val, expected.obj_val)
@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+from scipy import sparse
+import gilp
+from gilp._scaling import scale, unscale
+from gilp.simplex import LP
+
+
+@pytest.fixture
+def A():
+    return np.array([[1e4,2,0],
+                     [3e-3,0,5e2],
+                     [0,7e5,1e-2]])
+
+
+@pytest.mark.parametrize("method",['geometric', 'equilibrate'])
+def test_scale(A, method):
+    b = np.array([1,2,3])
+    c = np.array([4,5,6])
+    scaled = scale(A, b, c, method)
+    R, S = np.diagflat(scaled.row), np.diagflat(scaled.col)
+    assert np.allclose(scaled.A, R @ A @ S)
+    assert np.allclose(scaled.b, R @ b.reshape(-1,1))
+    assert np.allclose(scaled.c, S @ c.reshape(-1,1))
+    for factors in [scaled.row, scaled.col]:
+        assert np.all(np.log2(factors) == np.round(np.log2(factors)))
+    # Largest magnitude in every column is one up to rounding
+    big = np.abs(scaled.A).max(axis=0)
+    assert np.all((big >= 0.5) & (big <= 2))
+    x = np.array([[1],[2],[3]])
+    assert np.allclose(unscale(scaled, x), S @ x)
+
+    sparse_scaled = scale(sparse.csr_matrix(A), b, c, method)
+    assert sparse.issparse(sparse_scaled.A)
+    assert np.allclose(sparse_scaled.A.toarray(), scaled.A)
+
+
+def test_geometric(A):
+    scaled = scale(A, np.ones(3), np.ones(3), 'geometric')
+    magnitudes = np.abs(scaled.A[scaled.A != 0])
+    assert magnitudes.max() / magnitudes.min() < 1e-2 * 7e5 / 3e-3
+
+
+def test_invalid_scaling(A):
+    with pytest.raises(ValueError, match='Invalid scaling.*'):
+        scale(A, np.ones(3), np.ones(3), 'arithmetic')
+    with pytest.raises(ValueError, match='Invalid scaling.*'):
+        gilp.simplex(gilp.examples.ALL_INTEGER_2D_LP, scaling='arithmetic')
+
+
+@pytest.mark.parametrize("lp",[
+    gilp.examples.ALL_INTEGER_3D_LP,
+    gilp.examples.KLEE_MINTY_3D_LP,
+    gilp.examples.SQUARE_PYRAMID_3D_LP,
+    gilp.examples.DODECAHEDRON_3D_LP])
+@pytest.mark.parametrize("scaling",['geometric', 'equilibrate'])
+def test_simplex(lp, scaling):
+    n,m,A,b,c = lp.get_coefficients()
+    # Badly scaled copy of the LP: A' = RAS, b' = Rb, c' = Sc
+    R = np.diag(10.0**np.resize([3,-2,4,-3,1], m))
+    S = np.diag(10.0**np.resize([-4,2,-1,3], n))
+    bad_lp = LP(R @ A @ S, R @ b, S @ c, equality=True)
+    expected = gilp.simplex(lp)
+    actual = gilp.simplex(bad_lp, scaling=scaling)
+    assert actual.optimal
+    assert np.isclose(actual.obj_val, expected.obj_val)
+    assert np.allclose(R @ A @ S @ actual.x, R @ b)
+    for bfs in actual.path:
+        assert np.allclose(R @ A @ S @ bfs.x, R @ b)
+
+
+def test_simplex_options():
+    lp = gilp.examples.ALL_INTEGER_3D_LP
+    expected = gilp.simplex(lp)
+    actual = gilp.simplex(lp, scaling='geometric', presolve=True,
+                          initial_solution=[0,0,0])
+    assert np.isclose(actual.obj_val, expected.obj_val)
+    actual = gilp.simplex(lp, scaling='geometric', method='dual')
+    assert np.isclose(actual.obj_val, expected.obj_val)
@@ -1,11 +1,19 @@
 import pytest
 from pytest import warns
+import warnings
 import mock
 import numpy as np
+from scipy import sparse
+import threading
 import gilp
 from gilp.simplex import (InvalidBasis, Infeasible, InfeasibleBasicSolution,
                           UnboundedLinearProgram, _invertible, _phase_one,
-                          _simplex_iteration, branch_and_bound_iteration, BFS)
+                          _simplex_iteration, branch_and_bound_iteration, BFS,
+                          _SimplexState, _crash_basis, _crossover, _dense,
+                          SimplexPath, _Node, _NodeQueue,
+                          _PseudoCosts)
+from gilp._linalg import SlackMatrix
+from gilp._stats import Stats
 
 
 class TestLP:
@@ -49,6 +57,43 @@ class TestLP:
         assert (c == actual[4]).all()
         assert (equality == lp.equality)
 
+    @pytest.mark.parametrize("A",[
+        np.array([[1,2],[3,0]]),
+        sparse.csc_matrix(np.array([[1,2],[3,0]]))])
+    def test_read_only_coefficients(self,A):
+        lp = gilp.LP(A,[3,4],[1,2])
+        n,m,A_eq,b,c = lp.get_coefficients(copy=False)
+        lb,ub = lp.get_bounds(copy=False)
+        # Slack columns of the equality form are implicit
+        assert isinstance(A_eq, SlackMatrix)
+        assert np.shares_memory(A_eq.A.data, lp.A.data)
+        assert (A_eq.toarray() == np.array([[1,2,1,0],[3,0,0,1]])).all()
+        A = A_eq.A.data if sparse.issparse(A_eq.A) else A_eq.A
+        for M in [b, c, lb, ub, A]:
+            assert not M.flags.writeable
+        with pytest.raises(ValueError):
+            b[0] = 5
+        assert np.shares_memory(b, lp.b_eq)
+        # Copies are writeable and independent of the LP
+        b = lp.get_coefficients().b
+        b[0] = 5
+        assert lp.b_eq[0,0] == 3
+
+    def test_immutable(self):
+        lp = gilp.LP([[1,2],[3,0]],[3,4],[1,2],ub=[1,1],immutable=True)
+        assert lp.immutable
+        with pytest.raises(ValueError):
+            lp.A_eq[0,0] = 5
+        # [A I] is formed once for an immutable LP
+        assert lp.A_eq is lp.A_eq
+        with pytest.raises(ValueError):
+            lp.ub[0] = 5
+        with pytest.raises(AttributeError):
+            lp.b = np.array([[1],[1]])
+        expected = gilp.simplex(gilp.LP([[1,2],[3,0]],[3,4],[1,2],ub=[1,1]))
+        assert gilp.simplex(lp).obj_val == expected.obj_val
+        assert lp.get_coefficients().A.flags.writeable
+
     def test_get_bfs(self, degenerate_lp):
         lp = degenerate_lp
         bfs = np.array([[2],[4],[0],[0],[4],[1],[0]])
@@ -231,6 +276,59 @@ class TestSimplexIteration:
             assert 50 == actual[2]
             assert not actual[3]
 
+    def test_state(self, klee_minty_3d_lp):
+        A = klee_minty_3d_lp.get_coefficients().A
+        bfs = BFS(x=np.array([[0.0],[0],[0],[5],[25],[125]]),
+                  B=[3,4,5],
+                  obj_val=0,
+                  optimal=False)
+        state = _SimplexState(A, bfs.B)
+        for i in range(3):
+            bfs = _simplex_iteration(lp=klee_minty_3d_lp,
+                                     bfs=bfs,
+                                     pivot_rule='dantzig',
+                                     state=state)
+            assert state.matches(bfs.B)
+            assert sorted(state.header) == sorted(bfs.B)
+            assert (np.flatnonzero(state.is_basic) == sorted(bfs.B)).all()
+            assert (state.header[state.position[bfs.B]] == bfs.B).all()
+        assert [1,5,3] == bfs.B
+
+    def test_steepest_edge_weights(self):
+        rng = np.random.default_rng(0)
+        A = rng.uniform(0,10,(6,8))
+        b = rng.uniform(10,100,(6,1))
+        lp = gilp.LP(A, b, rng.uniform(1,10,(8,1)))
+        A = lp.get_coefficients().A
+        bfs = BFS(x=np.vstack((np.zeros((8,1)),b)),
+                  B=list(range(8,14)),
+                  obj_val=0,
+                  optimal=False)
+        state = _SimplexState(A, bfs.B)
+        for i in range(3):
+            bfs = _simplex_iteration(lp=lp,
+                                     bfs=bfs,
+                                     pivot_rule='steepest_edge',
+                                     state=state)
+            N = np.flatnonzero(~state.is_basic)
+            W = np.linalg.solve(A[:,state.header], A[:,N])
+            exact = 1 + np.sum(W**2, axis=0)
+            assert np.allclose(exact, state.weights[N])
+
+    @pytest.mark.parametrize("sparse_A",[False, True])
+    def test_init_weights(self, sparse_A):
+        rng = np.random.default_rng(0)
+        A = rng.uniform(0,10,(6,8))
+        S = SlackMatrix(sparse.csc_matrix(A) if sparse_A else A)
+        A = S.toarray()
+        # Slack basis (norms of the columns) and chunked edge directions
+        for B in [list(range(8,14)), [0,3,9,10,12,13]]:
+            state = _SimplexState(S, B)
+            state.init_weights(S, 'steepest_edge', chunk_size=3)
+            N = np.flatnonzero(~state.is_basic)
+            W = np.linalg.solve(A[:,state.header], A[:,N])
+            assert np.allclose(1 + np.sum(W**2, axis=0), state.weights[N])
+
 
 class TestSimplex():
 
@@ -267,6 +365,50 @@ class TestSimplex():
         assert np.allclose(bases,actual[1],atol=1e-7)
         assert 125 == actual[2]
         assert actual[3]
+        # Only x, B, obj_val, optimal, and path are unpacked
+        x, B, obj_val, optimal, path = actual
+        assert actual.status == 'optimal' and actual.stats.pivots > 0
+        sol = actual._replace(optimal=False)
+        assert not sol.optimal and sol.stats is actual.stats
+
+    @pytest.mark.parametrize("rule,pivots",[
+        ('dantzig',7),
+        ('steepest_edge',1),
+        ('devex',5)])
+    def test_weighted_rules(self, klee_minty_3d_lp, rule, pivots):
+        actual = gilp.simplex(klee_minty_3d_lp,
+                              pivot_rule=rule,
+                              initial_solution=[0,0,0])
+        assert 125 == actual.obj_val
+        assert actual.optimal
+        assert pivots == len(actual.path) - 1
+
+    @pytest.mark.parametrize("rule",['bland','dantzig','steepest_edge'])
+    def test_partial_pricing(self, rule):
+        rng = np.random.default_rng(1)
+        lp = gilp.LP(rng.uniform(0,10,(5,60)),
+                     rng.uniform(50,100,(5,1)),
+                     rng.uniform(1,10,(60,1)))
+        full = gilp.simplex(lp, pivot_rule=rule, initial_solution=np.zeros(60))
+        partial = gilp.simplex(lp, pivot_rule=rule, pricing='partial',
+                               initial_solution=np.zeros(60))
+        assert partial.optimal
+        assert np.isclose(full.obj_val, partial.obj_val)
+        assert partial.priced < full.priced
+        with pytest.raises(ValueError,match='Invalid pricing.*'):
+            gilp.simplex(lp, pricing='invalid')
+        # Fixed columns (lb = ub) are never attractive
+        for lp in [gilp.LP([[-5,-5,-3,2]], [-2], [5,-4,3,-4],
+                           lb=[-2,-1,1,-2], ub=[1,np.inf,np.inf,-2]),
+                   gilp.LP([[3,-2,-2,5]], [-1], [-2,2,-2,3],
+                           lb=[-2,-1,0,1], ub=[-2,np.inf,0,np.inf])]:
+            with pytest.raises(UnboundedLinearProgram):
+                gilp.simplex(lp, pivot_rule=rule, pricing='partial')
+        lp = gilp.LP([[1,1,1],[1,0,0]], [4,3], [1,2,-1],
+                     lb=[0,0,1], ub=[np.inf,np.inf,1])
+        full = gilp.simplex(lp, pivot_rule=rule)
+        partial = gilp.simplex(lp, pivot_rule=rule, pricing='partial')
+        assert np.isclose(full.obj_val, partial.obj_val)
 
     def test_initial_solution(self, klee_minty_3d_lp):
         actual = gilp.simplex(klee_minty_3d_lp,
@@ -299,8 +441,568 @@ class TestSimplex():
         assert not actual[3]
 
 
+class TestDualSimplex():
+
+    def test_bad_inputs(self, klee_minty_3d_lp):
+        with pytest.raises(ValueError,match='Invalid method.*'):
+            gilp.simplex(klee_minty_3d_lp, method='invalid')
+        with warns(UserWarning, match='.*No dual feasible basis.*'):
+            actual = gilp.simplex(klee_minty_3d_lp, method='dual')
+            assert 125 == actual.obj_val
+        with warns(UserWarning, match='.*No dual feasible basis.*'):
+            gilp.simplex(klee_minty_3d_lp, method='dual',
+                         initial_basis=[3,4,5])
+        with warns(UserWarning, match='.*initial basis was not.*'):
+            gilp.simplex(klee_minty_3d_lp, initial_basis=[0,1,2,3])
+
+    def test_rhs_change(self, klee_minty_3d_lp):
+        B = gilp.simplex(klee_minty_3d_lp).B
+        lp = gilp.LP(np.array([[1,0,0],[4,1,0],[8,4,1]]),
+                     np.array([[5],[25],[-30]]),
+                     np.array([[4],[2],[1]]))
+        with pytest.raises(Infeasible):
+            gilp.simplex(lp, method='dual', initial_basis=B)
+        lp = gilp.LP(np.array([[1,0,0],[4,1,0],[8,4,1],[0,0,1]]),
+                     np.array([[5],[25],[125],[100]]),
+                     np.array([[4],[2],[1]]))
+        actual = gilp.simplex(lp, method='dual', initial_basis=B + [6])
+        expected = gilp.simplex(lp)
+        assert np.allclose(expected.x, actual.x, atol=1e-7)
+        assert np.isclose(expected.obj_val, actual.obj_val)
+        assert actual.optimal
+        assert len(actual.path) == 2
+
+    def test_slack_basis(self):
+        lp = gilp.LP(np.array([[-1,-1],[-1,-3]]),
+                     np.array([[-2],[-3]]),
+                     np.array([[-2],[-3]]))
+        actual = gilp.simplex(lp, method='dual')
+        assert np.allclose(np.array([[1.5],[0.5],[0],[0]]), actual.x)
+        assert np.isclose(-4.5, actual.obj_val)
+        assert actual.optimal
+
+    def test_primal_initial_basis(self, klee_minty_3d_lp):
+        actual = gilp.simplex(klee_minty_3d_lp, initial_basis=[2,3,4])
+        assert 125 == actual.obj_val
+        assert len(actual.path) == 1
+
+
+class TestInteriorPoint():
+
+    @pytest.mark.parametrize("lp",[
+        gilp.examples.ALL_INTEGER_2D_LP,
+        gilp.examples.DEGENERATE_FIN_2D_LP,
+        gilp.examples.KLEE_MINTY_3D_LP,
+        gilp.examples.MULTIPLE_OPTIMAL_3D_LP,
+        gilp.examples.SQUARE_PYRAMID_3D_LP,
+        gilp.examples.DODECAHEDRON_3D_LP,
+        gilp.LP([[1,1],[2,1]], [4,6], [1,1], lb=[1,0], ub=[2,np.inf]),
+        gilp.LP(sparse.csc_matrix(np.array([[1,1,0],[-1,1,-1]])),
+                np.array([3,1]),
+                np.array([2,1,0]),
+                equality=True)])
+    def test_simplex(self, lp):
+        n,m,A,b,c = lp.get_coefficients()
+        lb,ub = lp.get_bounds()
+        expected = gilp.simplex(lp)
+        actual = gilp.simplex(lp, method='ipm')
+        assert actual.optimal
+        assert np.isclose(expected.obj_val, actual.obj_val)
+        assert np.allclose(A @ actual.x, b)
+        # The solution is basic: nonbasic variables are at a bound
+        assert len(actual.B) == m
+        assert np.linalg.matrix_rank(_dense(A)[:,actual.B]) == m
+        N = np.setdiff1d(range(n), actual.B)
+        assert np.all((actual.x[N] == lb[N]) | (actual.x[N] == ub[N]))
+
+    def test_crossover(self):
+        lp = gilp.examples.MULTIPLE_OPTIMAL_3D_LP
+        opt = gilp.simplex(lp).obj_val
+        # Midpoint of the optimal face spanned by two optimal BFS
+        x = [bfs.x for bfs in lp.get_basic_feasible_solns()
+             if np.isclose(bfs.obj_val, opt)]
+        bfs = _crossover(lp, (x[0] + x[-1]) / 2)
+        assert np.isclose(bfs.obj_val, opt)
+        assert bfs.x.tolist() in [y.tolist() for y in x]
+
+    def test_exceptions(self):
+        lp = gilp.LP([[1,1],[-1,0]], [1,-2], [1,1])
+        with warns(UserWarning, match='.*interior point method did not.*'):
+            with pytest.raises(Infeasible):
+                gilp.simplex(lp, method='ipm')
+        lp = gilp.LP([[1,-1]], [1], [1,1])
+        with warns(UserWarning, match='.*interior point method did not.*'):
+            with pytest.raises(UnboundedLinearProgram):
+                gilp.simplex(lp, method='ipm')
+        with warns(UserWarning, match='.*does not use an initial.*'):
+            gilp.simplex(gilp.examples.KLEE_MINTY_3D_LP, method='ipm',
+                         initial_basis=[3,4,5])
+
+
+class TestSensitivity():
+
+    def test_example(self):
+        lp = gilp.LP([[1,1],[1,3],[1,0]], [4,6,3], [3,2])
+        sol = gilp.simplex(lp, sensitivity=True)
+        y, red_costs, obj_range, rhs_range = sol.sensitivity
+        assert np.allclose(y, [[2],[0],[1]])
+        assert np.allclose(red_costs, [[0],[0],[-2],[0],[-1]])
+        assert np.allclose(obj_range[:2], [[2,np.inf],[0,3]])
+        assert np.allclose(rhs_range, [[3,4],[6,np.inf],[3,4]])
+        assert gilp.simplex(lp).sensitivity is None
+        sol = gilp.simplex(lp, sensitivity=True, iteration_limit=1)
+        assert not sol.optimal
+        assert sol.sensitivity is None
+
+    @staticmethod
+    def inside(interval, value):
+        """Return a value strictly inside the (possibly infinite) interval."""
+        lo, hi = interval
+        if np.isinf(lo) and np.isinf(hi):
+            return value + 1
+        lo = hi - 2 if np.isinf(lo) else lo
+        hi = lo + 2 if np.isinf(hi) else hi
+        return (lo + hi) / 2
+
+    @pytest.mark.parametrize("lp",[
+        gilp.examples.ALL_INTEGER_2D_LP,
+        gilp.examples.KLEE_MINTY_3D_LP,
+        gilp.examples.SQUARE_PYRAMID_3D_LP,
+        gilp.examples.DODECAHEDRON_3D_LP,
+        gilp.LP([[1,1],[2,1]], [4,6], [1,1], lb=[1,0], ub=[2,np.inf])])
+    def test_ranges(self, lp):
+        n,m,A,b,c = lp.get_coefficients()
+        lb,ub = lp.get_bounds()
+        sol = gilp.simplex(lp, sensitivity=True)
+        y, red_costs, obj_range, rhs_range = sol.sensitivity
+        T = lp.get_tableau(list(sol.B))
+        assert np.allclose(red_costs[:,0], -T[0,1:n+1])
+        assert np.isclose(float(b.T @ y), T[0,n+1])
+        # The optimal solution stays optimal for c_j inside its range
+        for j in range(lp.n):
+            c_j = c[:lp.n].copy()
+            c_j[j] = self.inside(obj_range[j], c[j,0])
+            lp_j = gilp.LP(lp.A, lp.b, c_j, lb=lb[:lp.n], ub=ub[:lp.n])
+            assert np.isclose(gilp.simplex(lp_j).obj_val,
+                              float(c_j.T @ sol.x[:lp.n]))
+        # The optimal value changes by y_i per unit of b_i inside its range
+        for i in range(m):
+            b_i = b.copy()
+            b_i[i] = self.inside(rhs_range[i], b[i,0])
+            lp_i = gilp.LP(lp.A, b_i, lp.c, lb=lb[:lp.n], ub=ub[:lp.n])
+            assert np.isclose(gilp.simplex(lp_i).obj_val,
+                              sol.obj_val + y[i,0] * (b_i[i,0] - b[i,0]))
+
+    @pytest.mark.parametrize("options",[
+        dict(presolve=True),
+        dict(scaling='geometric'),
+        dict(presolve=True, scaling='equilibrate'),
+        dict(pricing='partial')])
+    def test_options(self, options):
+        lp = gilp.examples.DODECAHEDRON_3D_LP
+        expected = gilp.simplex(lp, sensitivity=True).sensitivity
+        actual = gilp.simplex(lp, sensitivity=True, **options).sensitivity
+        for a, e in zip(actual, expected):
+            assert np.allclose(a, e)
+
+
+class TestSimplexPath():
+
+    @pytest.mark.parametrize("lp,options",[
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(pivot_rule='dantzig')),
+        (gilp.examples.DODECAHEDRON_3D_LP, dict(pivot_rule='steepest_edge')),
+        (gilp.examples.DODECAHEDRON_3D_LP, dict(iteration_limit=2)),
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(method='dual')),
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(scaling='geometric')),
+        (gilp.examples.ALL_INTEGER_3D_LP, dict(presolve=True)),
+        (gilp.LP([[1,1],[2,1]], [4,6], [1,1], lb=[1,0], ub=[2,np.inf]),
+         dict())])
+    def test_compact(self, lp, options):
+        full = gilp.simplex(lp, **options).path
+        compact = gilp.simplex(lp, path_mode='compact', **options).path
+        assert isinstance(compact, SimplexPath)
+        assert len(compact.pivots) <= len(compact) == len(full)
+        # Random (backward) access rebuilds the same iterates
+        for i in [*range(len(full)), -1, 1, 0]:
+            assert np.allclose(compact[i].x, full[i].x)
+            assert compact[i].B == full[i].B
+            assert np.isclose(compact[i].obj_val, full[i].obj_val)
+        assert [bfs.B for bfs in compact] == [bfs.B for bfs in full]
+        with pytest.raises(IndexError):
+            compact[len(full)]
+
+    def test_full(self):
+        path = gilp.simplex(gilp.examples.KLEE_MINTY_3D_LP,
+                            pivot_rule='dantzig').path
+        assert path[0].B == [3,4,5]
+        assert path[-1].B == [2,3,4]
+
+    def test_none(self):
+        lp = gilp.examples.KLEE_MINTY_3D_LP
+        sol = gilp.simplex(lp, path_mode='none')
+        assert sol.path is None
+        assert np.isclose(sol.obj_val, gilp.simplex(lp).obj_val)
+        with pytest.raises(ValueError, match='Invalid path mode.*'):
+            gilp.simplex(lp, path_mode='lazy')
+
+
+class TestSimplexIter():
+
+    @pytest.mark.parametrize("lp,options",[
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(pivot_rule='dantzig')),
+        (gilp.examples.DODECAHEDRON_3D_LP, dict(pivot_rule='steepest_edge')),
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(method='dual')),
+        (gilp.examples.SQUARE_PYRAMID_3D_LP, dict(method='ipm')),
+        (gilp.examples.ALL_INTEGER_3D_LP, dict(initial_solution=[0,0,0])),
+        (gilp.LP([[1,1],[2,1]], [4,6], [1,1], lb=[1,0], ub=[2,np.inf]),
+         dict())])
+    def test_iterates(self, lp, options):
+        sol = gilp.simplex(lp, **options)
+        iterates = list(gilp.simplex_iter(lp, **options))
+        assert len(iterates) == len(sol.path)
+        for bfs, expected in zip(iterates, sol.path):
+            assert np.allclose(bfs.x, expected.x)
+            assert bfs.B == expected.B
+        assert not any(bfs.optimal for bfs in iterates[:-1])
+        assert iterates[-1].optimal
+        assert np.isclose(iterates[-1].obj_val, sol.obj_val)
+
+    def test_early_termination(self):
+        lp = gilp.examples.KLEE_MINTY_3D_LP
+        path = gilp.simplex(lp, pivot_rule='dantzig').path
+        iterates = gilp.simplex_iter(lp, pivot_rule='dantzig')
+        first = next(iterates)
+        for bfs in iterates:
+            if bfs.obj_val >= 50:
+                break
+        iterates.close()
+        assert np.allclose(first.x, path[0].x)
+        assert np.allclose(bfs.x, path[3].x)
+        with pytest.raises(StopIteration):
+            next(iterates)
+
+    def test_exceptions(self):
+        iterates = gilp.simplex_iter(gilp.LP([[1,-1]], [1], [1,1]))
+        assert not next(iterates).optimal
+        with pytest.raises(UnboundedLinearProgram):
+            list(iterates)
+        with pytest.raises(ValueError, match='Invalid method.*'):
+            next(gilp.simplex_iter(gilp.examples.KLEE_MINTY_3D_LP,
+                                   method='barrier'))
+
+
+class TestStats():
+
+    @pytest.mark.parametrize("lp,options",[
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(pivot_rule='dantzig')),
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(method='dual')),
+        (gilp.examples.KLEE_MINTY_3D_LP, dict(scaling='geometric')),
+        (gilp.examples.SQUARE_PYRAMID_3D_LP, dict(presolve=True))])
+    def test_simplex(self, lp, options):
+        iterates = []
+        sol = gilp.simplex(lp, **options,
+                           callback=lambda bfs, stats: iterates.append(
+                               (np.copy(bfs.x), stats.iterations)))
+        stats = sol.stats
+        assert len(iterates) == len(sol.path) - 1
+        assert np.all(np.diff([i for x, i in iterates]) == 1)
+        assert iterates[-1][1] == stats.iterations
+        for (x, _), bfs in zip(iterates, sol.path[1:]):
+            assert np.allclose(x, bfs.x)
+        assert stats.pivots == stats.iterations
+        assert stats.solves > 0
+        assert stats.pricing_time > 0 and stats.ratio_test_time > 0
+        assert stats.time >= stats.pricing_time + stats.ratio_test_time
+
+    def test_phase_one(self):
+        lp = gilp.LP([[1,1],[-1,-1]], [4,-2], [1,2])
+        stats = gilp.simplex(lp).stats
+        assert stats.phase_one_pivots > 0
+        assert stats.pivots > stats.phase_one_pivots
+        assert stats.phase_one_time > 0
+        stats = gilp.simplex(lp, initial_solution=[2,0]).stats
+        assert stats.phase_one_time == 0
+
+    def test_degenerate(self):
+        lp = gilp.LP([[1,-1],[1,0],[0,1]], [0,2,3], [1,1])
+        stats = gilp.simplex(lp).stats
+        assert 0 < stats.degenerate_pivots < stats.pivots
+
+    def test_bound_flip(self):
+        lp = gilp.LP([[1,1]], [10], [1,1], ub=[2,3])
+        stats = gilp.simplex(lp).stats
+        assert stats.bound_flips == 2
+        assert stats.pivots == 0
+
+    def test_branch_and_bound(self):
+        lp = gilp.examples.STANDARD_2D_IP
+        nodes = []
+        sol = gilp.branch_and_bound(lp, callback=lambda node, iteration, stats:
+                                    nodes.append(iteration.fathomed))
+        stats = sol.stats
+        assert len(nodes) == stats.nodes
+        assert sum(stats.pruned.values()) == sum(nodes)
+        assert stats.pruned['integral'] > 0
+        assert stats.pivots > 0
+
+
+class TestLimits():
+
+    def test_simplex(self):
+        lp = gilp.examples.KLEE_MINTY_3D_LP
+        sol = gilp.simplex(lp, pivot_rule='dantzig')
+        assert sol.status == 'optimal'
+        sol = gilp.simplex(lp, time_limit=0)
+        assert sol.status == 'time_limit'
+        assert not sol.optimal
+        assert sol.stats.iterations == 0
+        sol = gilp.simplex(lp, iteration_limit=2)
+        assert sol.status == 'iteration_limit'
+        sol = gilp.simplex(lp, pivot_rule='dantzig', target=50)
+        assert sol.status == 'target'
+        assert sol.obj_val == 50
+        with pytest.raises(ValueError, match='Time limit must be.*'):
+            gilp.simplex(lp, time_limit=-1)
+
+    def test_cancel(self):
+        lp = gilp.examples.KLEE_MINTY_3D_LP
+        cancel = threading.Event()
+
+        def callback(bfs, stats):
+            if stats.iterations == 2:
+                cancel.set()
+
+        sol = gilp.simplex(lp, callback=callback, cancel=cancel)
+        assert sol.status == 'cancelled'
+        assert sol.stats.iterations == 2
+        # Phase I is cancelled too
+        lp = gilp.LP([[1,1],[-1,-1]], [4,-2], [1,2])
+        sol = gilp.simplex(lp, cancel=cancel)
+        assert sol.status == 'cancelled'
+        assert sol.x is None
+        assert gilp.simplex(lp, cancel=cancel, presolve=True).x is None
+
+    def test_cutoff(self):
+        # min x_0 + x_1 s.t. x_0 + x_1 >= 2: the slack basis is dual feasible
+        lp = gilp.LP([[-1,-1],[1,0]], [-2,3], [-1,-1])
+        sol = gilp.simplex(lp, method='dual', cutoff=0.5)
+        assert sol.status == 'cutoff'
+        sol = gilp.simplex(lp, method='dual', cutoff=-3)
+        assert sol.status == 'optimal'
+        assert np.isclose(sol.obj_val, -2)
+
+    @pytest.mark.parametrize("options",[
+        dict(presolve=True),
+        dict(scaling='geometric')])
+    def test_options(self, options):
+        lp = gilp.examples.ALL_INTEGER_3D_LP
+        sol = gilp.simplex(lp, pivot_rule='dantzig', target=20, **options)
+        assert sol.status == 'target'
+        assert 20 <= sol.obj_val < 29
+
+    def test_branch_and_bound(self):
+        lp = gilp.examples.STANDARD_2D_IP
+        assert gilp.branch_and_bound(lp).status == 'optimal'
+        sol = gilp.branch_and_bound(lp, cutoff=30)
+        assert sol.status == 'optimal'
+        assert sol.obj_val == 40
+        sol = gilp.branch_and_bound(lp, cutoff=40)
+        assert sol.status == 'cutoff'
+        assert sol.x is None
+        sol = gilp.branch_and_bound(lp, target=1)
+        assert sol.status == 'target'
+        assert sol.stats.nodes < gilp.branch_and_bound(lp).stats.nodes
+        sol = gilp.branch_and_bound(lp, time_limit=0)
+        assert sol.status == 'time_limit'
+        assert sol.stats.nodes == 0
+        cancel = threading.Event()
+
+        def callback(node, iteration, stats):
+            cancel.set()
+
+        sol = gilp.branch_and_bound(lp, callback=callback, cancel=cancel)
+        assert sol.status == 'cancelled'
+        assert sol.stats.nodes == 1
+        # 2x_0 = 1 has no integer solution
+        lp = gilp.LP([[2,0],[-2,0],[0,1]], [1,-1,1], [1,1])
+        sol = gilp.branch_and_bound(lp)
+        assert sol.status == 'infeasible'
+        assert sol.x is None
+
+
+class TestSparse():
+
+    def test_init(self):
+        A = sparse.csr_matrix(np.array([[1,2],[3,0]]))
+        lp = gilp.LP(A, [3,4], [1,2])
+        assert sparse.issparse(lp.A) and sparse.issparse(lp.A_eq)
+        assert (lp.A_eq.toarray() == np.array([[1,2,1,0],[3,0,0,1]])).all()
+        assert sparse.issparse(lp.get_coefficients().A)
+
+    @pytest.mark.parametrize("lp",[
+        gilp.examples.KLEE_MINTY_3D_LP,
+        gilp.examples.DEGENERATE_FIN_2D_LP,
+        gilp.examples.ALL_INTEGER_3D_LP,
+        gilp.LP(np.array([[1,1,0],[-1,1,-1]]),
+                np.array([3,1]),
+                np.array([2,1,0]),
+                equality=True)])
+    @pytest.mark.parametrize("method",['primal','dual'])
+    def test_simplex(self, lp, method):
+        n,m,A,b,c = lp.get_coefficients(equality=lp.equality)
+        sparse_lp = gilp.LP(sparse.csc_matrix(A), b, c, equality=lp.equality)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            expected = gilp.simplex(lp, method=method)
+            actual = gilp.simplex(sparse_lp, method=method)
+        assert np.allclose(expected.x, actual.x, atol=1e-7)
+        assert expected.B == actual.B
+        assert np.isclose(expected.obj_val, actual.obj_val)
+
+    def test_phase_one(self):
+        lp = gilp.LP(sparse.csc_matrix(np.array([[1,1],[1,1]])),
+                     np.array([[1],[1]]),
+                     np.array([[2],[1]]),
+                     equality=True)
+        x,B = _phase_one(lp)[:2]
+        assert all(x == np.array([[1],[0]]))
+        assert B == [0]
+
+
+class TestBounds():
+
+    def test_init(self):
+        lp = gilp.LP([[1,1],[2,1]], [4,6], [1,1], lb=[1,0], ub=[2,np.inf])
+        lb,ub = lp.get_bounds()
+        assert all(lb == np.array([[1],[0],[0],[0]]))
+        assert all(ub == np.array([[2],[np.inf],[np.inf],[np.inf]]))
+        lb,ub = lp.get_bounds(equality=False)
+        assert all(lb == np.array([[1],[0]]))
+        assert lp.is_bounded()
+        assert not gilp.LP([[1,1]], [4], [1,1]).is_bounded()
+        with pytest.raises(ValueError, match='.*lb should have one of .*'):
+            gilp.LP([[1,1]], [4], [1,1], lb=[0,0,0])
+        with pytest.raises(ValueError, match='.*ub should have one of .*'):
+            gilp.LP([[1,1]], [4], [1,1], ub=[1])
+        with pytest.raises(ValueError, match='Lower bounds must be .*'):
+            gilp.LP([[1,1]], [4], [1,1], lb=[2,0], ub=[1,1])
+        with pytest.raises(ValueError, match='Lower bounds must be .*'):
+            gilp.LP([[1,1]], [4], [1,1], lb=[-np.inf,0])
+
+    def test_get_vertices(self):
+        lp = gilp.LP([[1,1]], [4], [1,1], lb=[1,0], ub=[2,np.inf])
+        vertices = np.array([list(v[:,0]) for v in lp.get_vertices()])
+        expected = [[1,0],[2,0],[2,2],[1,3]]
+        assert sorted(map(tuple, np.round(vertices, 7))) == sorted(
+            map(tuple, np.array(expected, dtype=float)))
+
+    @pytest.mark.parametrize("lb,ub",[
+        ([0,0,0], [np.inf,np.inf,np.inf]),
+        ([0,0,0], [3,2,np.inf]),
+        ([1,0,2], [4,np.inf,2.5]),
+        ([0.5,1,0], [1,1,10]),
+        ([1,2,3], [1,2,3])])
+    @pytest.mark.parametrize("pivot_rule",['bland','dantzig',
+                                           'greatest_ascent','steepest_edge'])
+    def test_simplex(self, lb, ub, pivot_rule):
+        A = np.array([[1,1,1],[2,1,0],[0,1,3]])
+        b = np.array([[10],[9],[12]])
+        c = np.array([[3],[2],[4]])
+        lp = gilp.LP(A, b, c, lb=lb, ub=ub)
+        # The same LP with the bounds as rows (shifted by lb)
+        lb, ub = np.array(lb, dtype=float), np.array(ub, dtype=float)
+        finite = np.isfinite(ub)
+        rows_lp = gilp.LP(np.vstack((A, np.identity(3)[finite])),
+                          np.vstack((b - A @ lb[:,None],
+                                     (ub - lb)[finite][:,None])), c)
+        actual = gilp.simplex(lp, pivot_rule=pivot_rule)
+        expected = gilp.simplex(rows_lp)
+        assert np.isclose(actual.obj_val, expected.obj_val + float(c.T @ lb))
+        x = actual.x[:3,0]
+        assert np.all(x >= lb - 1e-7) and np.all(x <= ub + 1e-7)
+        assert np.allclose(A @ x + actual.x[3:,0], b[:,0])
+        for bfs in actual.path:
+            assert np.allclose(lp.A_eq @ bfs.x, b)
+
+    def test_bound_flip(self):
+        lp = gilp.LP([[1,1]], [4], [1,1], ub=[1,np.inf])
+        bfs = BFS(x=np.array([[0.0],[0],[4]]), B=[2], obj_val=0,
+                  optimal=False)
+        # x_1 enters but reaches its upper bound first; the basis is the same
+        bfs = _simplex_iteration(lp, bfs)
+        assert np.allclose(bfs.x, [[1],[0],[3]])
+        assert bfs.B == [2]
+        bfs = _simplex_iteration(lp, bfs)
+        assert np.allclose(bfs.x, [[1],[3],[0]])
+        assert bfs.B == [1]
+        bfs = _simplex_iteration(lp, bfs)
+        assert bfs.optimal
+
+    def test_dual(self):
+        lp = gilp.LP([[1,1],[1,-1]], [4,1], [1,2], ub=[3,2])
+        expected = gilp.simplex(lp)
+        actual = gilp.simplex(lp, method='dual')
+        assert np.isclose(actual.obj_val, expected.obj_val)
+        n,m,A,b,c = lp.get_coefficients(equality=False)
+        lb,ub = lp.get_bounds(equality=False)
+        # Re-optimize after a change of the RHS
+        lp = gilp.LP(A, [4,-1], c, lb=lb, ub=ub)
+        actual = gilp.simplex(lp, method='dual', initial_basis=sol_B(lp))
+        assert np.isclose(actual.obj_val, gilp.simplex(lp).obj_val)
+
+    def test_initial_solution(self):
+        lp = gilp.LP([[1,1]], [4], [1,1], lb=[1,0], ub=[2,np.inf])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', UserWarning)
+            sol = gilp.simplex(lp, initial_solution=[2,0])
+        assert np.isclose(sol.obj_val, 4)
+        with pytest.warns(UserWarning, match='.*initial solution.*'):
+            gilp.simplex(lp, initial_solution=[0,0])
+
+    def test_options(self):
+        lp = gilp.LP([[1,1,1],[2,1,0]], [10,9], [3,2,4], lb=[1,0,0],
+                     ub=[2,5,3])
+        expected = gilp.simplex(lp)
+        actual = gilp.simplex(lp, scaling='geometric')
+        assert np.isclose(actual.obj_val, expected.obj_val)
+        with pytest.warns(UserWarning, match='Presolve does not support.*'):
+            actual = gilp.simplex(lp, presolve=True)
+        assert np.isclose(actual.obj_val, expected.obj_val)
+
+
+def sol_B(lp):
+    """Return an optimal basis of the LP."""
+    return gilp.simplex(lp).B
+
+
 class TestPhaseOne():
 
+    def test_crash_basis(self):
+        A = np.array([[1,1,1,0,0],
+                      [1,-1,0,1,0],
+                      [1,2,0,0,-1]])
+        lb = np.zeros((5,1))
+        ub = np.array([[np.inf]]*4 + [[1]])
+        residual = np.array([[3],[-1],[-2]])
+        crash, pivots = _crash_basis(A, residual, lb, ub)
+        assert list(crash) == [2,-1,-1]
+        assert list(pivots) == [1,0,0]
+        residual = np.array([[3],[1],[-1]])
+        crash, pivots = _crash_basis(A, residual, lb, ub)
+        assert list(crash) == [2,3,4]
+        assert list(pivots) == [1,1,-1]
+        # Implicit unit columns are crashed without being formed
+        A = SlackMatrix(np.array([[1,1],[1,-1],[1,2]]), [0,2], [1,-1])
+        crash, pivots = _crash_basis(A, residual, lb[:4], ub[[0,1,2,4]])
+        assert list(crash) == [2,-1,3]
+        assert list(pivots) == [1,0,-1]
+
+    def test_slack_basis(self):
+        lp = gilp.examples.KLEE_MINTY_3D_LP
+        x,B = _phase_one(lp)[:2]
+        assert B == [3,4,5]
+        assert all(x == np.array([[0],[0],[0],[5],[25],[125]]))
+
     @pytest.mark.parametrize("lp,bfs",[
         (gilp.LP([[1,1,0],[-1,1,-1]],
                  [3, 1],
@@ -311,6 +1013,19 @@ class TestPhaseOne():
         assert all(x == bfs[0])
         assert B == bfs[1]
 
+    def test_redundant_row(self):
+        # Row 2 is the sum of rows 0 and 1 so its artificial stays basic
+        A = np.array([[1,1,1,0],
+                      [1,-1,0,1],
+                      [2,0,1,1]])
+        b = np.array([[2],[1],[3]])
+        x,B = _phase_one(gilp.LP(A,b,[1,1,1,1],equality=True))[:2]
+        assert len(B) == 2
+        assert np.linalg.matrix_rank(A[:,B]) == 2
+        assert np.allclose(A @ x, b)
+        assert np.all(x >= 0)
+        assert np.all(np.delete(x, B) == 0)
+
     @pytest.mark.parametrize("lp",[
         (gilp.LP(np.array([[1],[-1]]),
                  np.array([2,-3]),
@@ -387,6 +1102,44 @@ def test_get_vertices_equality_lp():
         lp.get_vertices()
 
 
+def test_branch_and_bound_bounds():
+    lp = gilp.LP(np.array([[1,1],[5,9]]),
+                 np.array([[6],[45]]),
+                 np.array([[5],[8]]))
+    iteration = branch_and_bound_iteration(lp, None, None)
+    for branch in [iteration.left_LP, iteration.right_LP]:
+        assert branch.m == lp.m and branch.n == lp.n
+    assert all(iteration.left_LP.ub == np.array([[2],[np.inf]]))
+    assert all(iteration.right_LP.lb == np.array([[3],[0]]))
+    iteration = branch_and_bound_iteration(lp, None, None, branches=False)
+    assert not iteration.fathomed
+    assert iteration.left_LP is None and iteration.right_LP is None
+    assert iteration.index == 0
+    assert np.isclose(iteration.x[0,0], 2.25)
+
+
+def test_branch_and_bound_warm_start():
+    lp = gilp.LP(np.array([[1,1],[5,9]]),
+                 np.array([[6],[45]]),
+                 np.array([[5],[8]]))
+    iteration = branch_and_bound_iteration(lp, None, None)
+    assert iteration.B == gilp.simplex(lp).B
+    for branch in [iteration.left_LP, iteration.right_LP]:
+        cold_stats, warm_stats = Stats(), Stats()
+        cold = branch_and_bound_iteration(branch, None, None,
+                                          stats=cold_stats)
+        warm = branch_and_bound_iteration(branch, None, None,
+                                          stats=warm_stats,
+                                          initial_basis=iteration.B)
+        assert warm.fathomed == cold.fathomed
+        assert warm.B == cold.B
+        assert warm_stats.iterations < cold_stats.iterations
+        assert warm_stats.phase_one_pivots == 0
+        if not cold.fathomed:
+            assert np.allclose(gilp.simplex(warm.left_LP).x,
+                               gilp.simplex(cold.left_LP).x)
+
+
 def test_branch_and_bound_manual():
     lp = gilp.LP(np.array([[1,1],[5,9]]),
                  np.array([[6],[45]]),
@@ -440,3 +1193,152 @@ def test_branch_and_bound(lp,x,val):
     ans = gilp.branch_and_bound(lp)
     assert all(x == ans[0])
     assert val == ans[1]
+    # Only x and obj_val are unpacked
+    x, obj_val = ans
+    assert ans.status == 'optimal' and ans.stats.nodes > 0
+
+
+@pytest.mark.parametrize("node_selection",[
+    'depth_first', 'best_bound', 'best_estimate', 'hybrid'])
+@pytest.mark.parametrize("lp",[
+    gilp.examples.STANDARD_2D_IP,
+    gilp.examples.EVERY_FATHOM_2D_IP,
+    gilp.examples.VARIED_BRANCHING_3D_IP])
+def test_node_selection(lp, node_selection):
+    expected = gilp.branch_and_bound(lp)
+    fathomed = []
+    actual = gilp.branch_and_bound(lp, node_selection=node_selection,
+                                   callback=lambda node, iteration, stats:
+                                   fathomed.append(iteration.fathomed))
+    assert actual.status == 'optimal'
+    assert np.isclose(actual.obj_val, expected.obj_val)
+    # Every created node is either solved or pruned without a solve
+    stats = actual.stats
+    assert len(fathomed) == stats.nodes
+    unsolved = sum(stats.pruned.values()) - sum(fathomed)
+    assert 1 + 2 * (stats.nodes - sum(fathomed)) == stats.nodes + unsolved
+    with pytest.raises(ValueError, match='Invalid node selection.*'):
+        gilp.branch_and_bound(lp, node_selection='breadth_first')
+
+
+def test_node_queue():
+    lp = gilp.examples.STANDARD_2D_IP
+    for node_selection, order in [('depth_first', [4,3,2,1]),
+                                  ('best_bound', [1,4,3,2]),
+                                  ('best_estimate', [2,4,3,1])]:
+        queue = _NodeQueue(node_selection)
+        for i, bound, estimate in [(1,9,1), (2,5,9), (3,7,5), (4,7,6)]:
+            queue.push(i, bound=bound, estimate=estimate)
+        assert len(queue) == 4
+        assert [queue.pop()[0] for _ in range(4)] == order
+    queue = _NodeQueue('hybrid')
+    queue.push(lp, bound=5)
+    queue.push_children('left', 'right', [0,1], 3, 2)
+    assert queue.pop()[0] == 'left'
+    assert queue.pop()[0] == lp
+    assert queue.pop() == ('right', [0,1], 3, 2, None)
+    assert len(queue) == 0
+    # Children of several nodes added between selections are all kept
+    queue.push_children('left_1', 'right_1', None, 3, 0)
+    queue.push_children('left_2', 'right_2', None, 4, 0)
+    assert len(queue) == 4
+    assert [queue.pop()[0] for _ in range(4)] == ['left_2', 'right_2',
+                                                  'left_1', 'right_1']
+
+
+@pytest.mark.parametrize("branching",[
+    'first', 'most_fractional', 'pseudo_cost', 'strong'])
+@pytest.mark.parametrize("lp",[
+    gilp.examples.STANDARD_2D_IP,
+    gilp.examples.EVERY_FATHOM_2D_IP,
+    gilp.examples.VARIED_BRANCHING_3D_IP])
+def test_branching(lp, branching):
+    expected = gilp.branch_and_bound(lp)
+    for node_selection in ['depth_first', 'best_bound']:
+        actual = gilp.branch_and_bound(lp, node_selection=node_selection,
+                                       branching=branching)
+        assert actual.status == 'optimal'
+        assert np.isclose(actual.obj_val, expected.obj_val)
+    with pytest.raises(ValueError, match='Invalid branching rule.*'):
+        gilp.branch_and_bound(lp, branching='last')
+
+
+def test_branching_index():
+    lp = gilp.LP([[2,5,4,2],[3,4,1,2],[4,4,5,4]], [7,6,7], [2,5,1,2])
+    first = branch_and_bound_iteration(lp, None, None)
+    assert np.allclose(first.x[:4,0], [1/6,7/6,0,5/12])
+    assert np.isclose(first.obj_val, 7)
+    assert first.index == 0
+    fractional = branch_and_bound_iteration(lp, None, None,
+                                            branching='most_fractional')
+    assert fractional.index == 3
+    # Strong branching: the right branch on x_1 is infeasible
+    pseudo_costs = _PseudoCosts(4)
+    strong = branch_and_bound_iteration(lp, None, None, branching='strong',
+                                        pseudo_costs=pseudo_costs)
+    assert strong.index == 1
+    assert np.all(pseudo_costs.count == [[1,1],[1,0],[0,0],[1,1]])
+    assert np.isclose(pseudo_costs.loss[1,0], 0.5 / (1/6))
+
+
+def test_pseudo_costs():
+    pseudo_costs = _PseudoCosts(3, reliability=2)
+    pseudo_costs.update(0, 'left', 0.5, 1)
+    pseudo_costs.update(0, 'left', 0.25, 1)
+    pseudo_costs.update(0, 'right', 0.5, 1)
+    pseudo_costs.update(1, 'right', 0.5, np.inf)
+    assert not pseudo_costs.reliable(0)
+    pseudo_costs.update(0, 'right', 0.5, 3)
+    assert pseudo_costs.reliable(0)
+    assert np.allclose(pseudo_costs.estimate(0, 0.5), [1.5, 2])
+    # Unobserved directions use the average (or the given default)
+    assert np.allclose(pseudo_costs.estimate(1, 0.5), [1.5, 2])
+    assert np.allclose(pseudo_costs.estimate(1, 0.5, 1), [0.5, 0.5])
+
+
+@pytest.mark.parametrize("lp",[
+    gilp.examples.STANDARD_2D_IP,
+    gilp.examples.VARIED_BRANCHING_3D_IP])
+@pytest.mark.parametrize("node_selection",['depth_first', 'hybrid'])
+def test_parallel_branch_and_bound(lp, node_selection):
+    expected = gilp.branch_and_bound(lp)
+    actual = gilp.branch_and_bound(lp, workers=2, branching='pseudo_cost',
+                                   node_selection=node_selection)
+    assert actual.status == 'optimal'
+    assert np.isclose(actual.obj_val, expected.obj_val)
+    assert actual.stats.nodes > 0
+    # Deterministic searches explore the same nodes in the same order
+    searches = []
+    for _ in range(2):
+        values = []
+        sol = gilp.branch_and_bound(lp, workers=3, deterministic=True,
+                                    node_selection=node_selection,
+                                    callback=lambda node, iteration, stats:
+                                    values.append(iteration.obj_val))
+        assert np.isclose(sol.obj_val, expected.obj_val)
+        assert len(values) == sol.stats.nodes
+        searches.append(values)
+    assert searches[0] == searches[1]
+    sol = gilp.branch_and_bound(lp, workers=2, time_limit=0)
+    assert sol.status == 'time_limit'
+    assert sol.stats.nodes == 0
+    with pytest.raises(ValueError, match='The number of workers must.*'):
+        gilp.branch_and_bound(lp, workers=0)
+    with pytest.raises(ValueError, match='Manual branching can not.*'):
+        gilp.branch_and_bound(lp, manual=True, workers=2)
+
+
+def test_node():
+    lp = gilp.LP([[1,1],[5,9]], [6,45], [5,8], ub=[np.inf,4])
+    root = _Node()
+    assert root.lp(lp) is lp
+    left = _Node(root, 1, ub=3)
+    right = _Node(left, 0, lb=2)
+    node = _Node(right, 1, lb=2)
+    sub = node.lp(lp)
+    assert np.all(sub.lb == np.array([[2],[2]]))
+    assert np.all(sub.ub == np.array([[np.inf],[3]]))
+    assert np.all(sub.A == lp.A)
+    assert np.all(left.lp(lp).ub == np.array([[np.inf],[3]]))
+    assert np.all(lp.ub == np.array([[np.inf],[4]]))
+    assert np.isclose(gilp.simplex(sub).obj_val, 39)
@@ -0,0 +1,16 @@
+from gilp._stats import Stats
+
+
+def test_add():
+    a = Stats()
+    a.pivots, a.pricing_time, a.time = 3, 0.5, 2.0
+    a.pruned['bound'] = 1
+    b = Stats()
+    b.pivots, b.pricing_time, b.time = 4, 0.25, 1.0
+    b.pruned['bound'], b.pruned['infeasible'] = 2, 1
+    a.add(b)
+    assert a.pivots == 7
+    assert a.pricing_time == 0.75
+    assert a.time == 2.0
+    assert a.pruned == {'infeasible': 1, 'bound': 3, 'integral': 0}
+    assert 'pivots=7' in repr(a)
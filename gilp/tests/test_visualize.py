@@ -81,6 +81,8 @@ def test_simplex_visual():
              ex.SQUARE_PYRAMID_3D_LP]
     for test in tests:
         simplex_visual(test)
+    for rule in ['steepest_edge', 'devex']:
+        simplex_visual(ex.KLEE_MINTY_3D_LP, rule=rule)
 
 
 def test_bnb_visual():
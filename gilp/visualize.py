@@ -151,7 +151,7 @@ def bfs_plot(lp: LP,
     Returns:
         Union[plt.Scatter, plt.Scatter3d]: Scatter trace for every BFS.
     """
-    n,m,A,b,c = lp.get_coefficients(equality=False)
+    n,m,A,b,c = lp.get_coefficients(equality=False, copy=False)
     if vertices is None:
         vertices = lp.get_vertices()
 
@@ -216,18 +216,18 @@ def feasible_region(lp: LP,
     Raises:
         InfiniteFeasibleRegion: Can not visualize.
     """
-    n,m,A,b,c = lp.get_coefficients(equality=False)
+    n,m,A,b,c = lp.get_coefficients(equality=False, copy=False)
+    lb,ub = lp.get_bounds(equality=False, copy=False)
     try:
-        simplex(LP(A,b,np.ones((n,1))))
+        simplex(LP(A,b,np.ones((n,1)),lb=lb,ub=ub))
     except UnboundedLinearProgram:
         raise InfiniteFeasibleRegion('Can not visualize.')
 
     if vertices is None:
         vertices = lp.get_vertices()
 
-    # Add non-negativity constraints
-    A_tmp = np.vstack((A, -np.identity(n)))
-    b_tmp = np.vstack((b, np.zeros((n,1))))
+    # Add bounds (non-negativity constraints by default)
+    A_tmp, b_tmp = lp.get_polyhedron()
 
     # Light theme by default
     opacity = 0.2
@@ -301,17 +301,18 @@ def feasible_integer_pts(lp: LP, fig: Figure) -> scatter:
         scatter: Scatter trace representing feasible integer points to the LP.
     """
     limits = fig.get_axis_limits()
+    A,b = lp.get_polyhedron()
     pts = []
     for i in range(math.ceil(limits[0])):
         for j in range(math.ceil(limits[0])):
             if len(limits) == 2:
                 x = np.array([[i],[j]])
-                if all(np.matmul(lp.A,x) <= lp.b + 1e-10):
+                if all(np.matmul(A,x) <= b + 1e-10):
                     pts.append(x)
             else:
                 for k in range(math.ceil(limits[0])):
                     x = np.array([[i],[j],[k]])
-                    if all(np.matmul(lp.A,x) <= lp.b + 1e-10):
+                    if all(np.matmul(A,x) <= b + 1e-10):
                         pts.append(x)
     return scatter(pts, template=INTEGER_POINT)
 
@@ -332,7 +333,7 @@ def constraints(lp: LP,
     Returns:
         List[Union[plt.Scatter, plt.Scatter3d]]: List of constraint traces.
     """
-    n,m,A,b,c = lp.get_coefficients(equality=False)
+    n,m,A,b,c = lp.get_coefficients(equality=False, copy=False)
     traces = []
     for i in range(m):
         lb = '('+str(i+n+1)+') '+equation_string(A[i],b[i][0])
@@ -369,7 +370,7 @@ def isoprofit_slider(fig: Figure,
     """
     if lp.equality:
         raise ValueError('The LP must be in standard inequality form.')
-    n,m,A,b,c = lp.get_coefficients(equality=False)
+    n,m,A,b,c = lp.get_coefficients(equality=False, copy=False)
 
     # Get minimum and maximum value of objective function in plot window
     limits = fig.get_axis_limits()
@@ -408,15 +409,15 @@ def isoprofit_slider(fig: Figure,
         # If feasible, get the objective values when the isoprofit plane first
         # intersects and last intersects the feasible region respectively
         if feas:
-            s_val = -simplex(LP(A,b,-c))[2]
+            lb,ub = lp.get_bounds(equality=False, copy=False)
+            s_val = -simplex(LP(A,b,-c,lb=lb,ub=ub))[2]
             t_val = opt_val
 
         # Keep track of an interior point once one is found
         interior_pt = None
 
-        # Add nonnegativity constraints
-        A = np.vstack((A,-np.identity(n)))
-        b = np.vstack((b,np.zeros((n,1))))
+        # Add bounds (non-negativity constraints by default)
+        A,b = lp.get_polyhedron()
 
         for i in range(ISOPROFIT_STEPS + feas):
             traces = []
@@ -489,8 +490,8 @@ def tableau_strings(lp: LP,
     """
     if lp.equality:
         raise ValueError('The LP must be in standard inequality form.')
-    n,m = lp.get_coefficients(equality=False)[:2]
-    A,b,c = lp.get_coefficients()[2:]
+    n,m = lp.get_coefficients(equality=False, copy=False)[:2]
+    A,b,c = lp.get_coefficients(copy=False)[2:]
     T = lp.get_tableau(B)
     if form == 'canonical':
         header = ['<b>x<sub>' + str(i) + '</sub></b>' for i in range(n+m+2)]
@@ -559,8 +560,10 @@ def simplex_path_slider(fig: Figure,
     if lp.equality:
         raise ValueError('The LP must be in standard inequality form.')
 
+    # Iterates are rebuilt from the recorded pivots as they are plotted
     path = simplex(lp=lp, pivot_rule=rule, initial_solution=initial_solution,
-                   iteration_limit=iteration_limit,feas_tol=feas_tol).path
+                   iteration_limit=iteration_limit,feas_tol=feas_tol,
+                   path_mode='compact').path
 
     # Add initial tableau
     tab_template = {'canonical': CANONICAL_TABLE,
@@ -737,6 +740,8 @@ def bnb_visual(lp: LP,
     best_bound = None
     unexplored = [lp]
     lp_to_node = {}  # dictionary from an LP object to the node id
+    lp_to_branch = {}  # dictionary from an LP object to its branch (i, lb)
+    lp_to_basis = {lp: None}  # dictionary from an LP object to parent basis
 
     # Initialize the branch and bound tree
     G = nx.Graph()
@@ -756,9 +761,14 @@ def bnb_visual(lp: LP,
         fig = template_figure(lp.n, visual_type='bnb_tree')
         fig.set_axis_limits(limits)
 
-        # Solve the LP relaxation
+        # Solve the LP relaxation (from the optimal basis of the parent)
+        basis = lp_to_basis[current]
         try:
-            sol = simplex(lp=current)
+            if basis is None:
+                sol = simplex(lp=current, path_mode='none')
+            else:
+                sol = simplex(lp=current, method='dual', initial_basis=basis,
+                              path_mode='none')
             x = sol.x
             value = sol.obj_val
             x_str = ', '.join(map(str, [num_format(i) for i in x[:lp.n]]))
@@ -799,24 +809,16 @@ def bnb_visual(lp: LP,
 
         # Show previous branch (constraints) of current node (if not the root)
         if nodes_ct > 1:
-            A = current.A[-1]
-            b = float(current.b[-1])
-            i = int(np.nonzero(A)[0][0])+1
+            i, b = lp_to_branch[current]
+            A = np.zeros(lp.n)
+            A[i] = 1
             template = {2: CONSTRAINT_LINE, 3: CONSTRAINT_POLYGON}[lp.n]
-            if any(A < 0):
-                fig.add_trace(equation(-A,-(b)-1, domain=limits,
-                                       name="x<sub>%d</sub> ≤ %d" % (i,-(b+1)),
-                                       template=template))
-                fig.add_trace(equation(A, b, domain=limits,
-                                       name="x<sub>%d</sub> ≥ %d" % (i, -b),
-                                       template=template))
-            else:
-                fig.add_trace(equation(A, b, domain=limits,
-                                       name="x<sub>%d</sub> ≤ %d" % (i, b),
-                                       template=template))
-                fig.add_trace(equation(-A, -(b+1), domain=limits,
-                                       name="x<sub>%d</sub> ≥ %d" % (i, (b+1)),
-                                       template=template))
+            fig.add_trace(equation(A, b, domain=limits,
+                                   name="x<sub>%d</sub> ≤ %d" % (i+1, b),
+                                   template=template))
+            fig.add_trace(equation(-A, -(b+1), domain=limits,
+                                   name="x<sub>%d</sub> ≥ %d" % (i+1, (b+1)),
+                                   template=template))
 
         # Add path of simplex for the current node's LP
         try:
@@ -845,7 +847,8 @@ def bnb_visual(lp: LP,
                                                best_bound=best_bound,
                                                manual=manual,
                                                feas_tol=feas_tol,
-                                               int_feas_tol=int_feas_tol)
+                                               int_feas_tol=int_feas_tol,
+                                               initial_basis=basis)
         fathom = iteration.fathomed
         incumbent = iteration.incumbent
         best_bound = iteration.best_bound
@@ -854,9 +857,12 @@ def bnb_visual(lp: LP,
 
         # If not fathomed, create nodes in the tree for each branch
         if not fathom:
-            i = int(np.nonzero(left_LP.A[-1])[0][0])  # branched on index
-            lb = int(left_LP.b[-1])
+            # index branched on and the upper bound of the left branch
+            i = iteration.index
+            lb = int(left_LP.get_bounds(equality=False).ub[i,0])
             ub = lb + 1
+            lp_to_branch[left_LP] = lp_to_branch[right_LP] = (i, lb)
+            lp_to_basis[left_LP] = lp_to_basis[right_LP] = iteration.B
 
             # left branch node
             G.add_node(nodes_ct)